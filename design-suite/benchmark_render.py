@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark sacred geometry rendering per geometry type and backend.
+Prints the median per-image latency in milliseconds.
+"""
+import argparse
+import statistics
+import time
+
+from design_suite.geometry import get_sacred_geometries
+from design_suite.render import RENDER_BACKENDS, generate_sacred_geometry
+
+
+def time_render(geometries, name: str, size, backend: str, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        generate_sacred_geometry(geometries, name, size, backend)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def backend_available(backend: str) -> bool:
+    try:
+        RENDER_BACKENDS[backend]((8, 8)).close()
+    except ImportError:
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, nargs=2, default=(800, 800), metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--backend", choices=list(RENDER_BACKENDS), action="append")
+    args = parser.parse_args()
+
+    geometries = get_sacred_geometries()
+    backends = [backend for backend in args.backend or RENDER_BACKENDS if backend_available(backend)]
+    size = tuple(args.size)
+
+    print(f"{'geometry':<22}" + "".join(f"{backend:>14}" for backend in backends))
+    for name in geometries:
+        row = [f"{time_render(geometries, name, size, backend, args.repeats):>11.1f} ms" for backend in backends]
+        print(f"{name:<22}" + "".join(row))
+
+
+if __name__ == "__main__":
+    main()
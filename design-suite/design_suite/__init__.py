@@ -2,15 +2,18 @@
 
 from .suite import CathedralDesignSuite
 from .geometry import SacredGeometry
-from .fractals import FractalPattern
+from .fractals import FractalPattern, Viewport
 from .templates import DesignTemplate
+from .render_cache import RenderCache
 from .integrations import build_integration_spec, render_integration_preview
 
 __all__ = [
     "CathedralDesignSuite",
     "SacredGeometry",
     "FractalPattern",
+    "Viewport",
     "DesignTemplate",
+    "RenderCache",
     "build_integration_spec",
     "render_integration_preview",
 ]
@@ -1,5 +1,10 @@
+import atexit
+import math
+import os
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 try:
     import numpy as np
 except ImportError as exc:
@@ -9,6 +14,43 @@ except ImportError as exc:
     ) from exc
 
 
+@dataclass(frozen=True)
+class Viewport:
+    """Rectangle of the complex plane mapped onto the output image"""
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
+
+    @classmethod
+    def centered(cls, center: complex, width: float, aspect: float = 1.0) -> "Viewport":
+        half_w = width / 2
+        half_h = width / aspect / 2
+        return cls(center.real - half_w, center.real + half_w, center.imag - half_h, center.imag + half_h)
+
+    @property
+    def center(self) -> complex:
+        return complex((self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2)
+
+    def zoom(self, factor: float, center: Optional[complex] = None) -> "Viewport":
+        """Viewport magnified by factor around center (default: the current center)"""
+        center = self.center if center is None else center
+        half_w = (self.x_max - self.x_min) / factor / 2
+        half_h = (self.y_max - self.y_min) / factor / 2
+        return Viewport(center.real - half_w, center.real + half_w, center.imag - half_h, center.imag + half_h)
+
+    def axes(self, size: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        width, height = size
+        return np.linspace(self.x_min, self.x_max, width), np.linspace(self.y_min, self.y_max, height)
+
+
+DEFAULT_VIEWPORTS: Dict[str, Viewport] = {
+    "mandelbrot": Viewport(-2.5, 1.5, -2.0, 2.0),
+    "julia": Viewport(-2.0, 2.0, -2.0, 2.0),
+}
+JULIA_CONSTANT = -0.7 + 0.27015j
+
+
 @dataclass
 class FractalPattern:
     name: str
@@ -17,70 +59,382 @@ class FractalPattern:
     complexity: float
     color_scheme: List[str]
     magical_properties: Dict[str, Any] = field(default_factory=dict)
+    viewport: Optional[Viewport] = None
+    smooth_gradient: bool = False
+    lsystem: Optional[str] = None
 
 
-def iterations_to_rgb(iterations: np.ndarray, color_scheme: List[str]) -> np.ndarray:
-    max_iter = int(np.max(iterations))
-    normalized = iterations / max_iter if max_iter > 0 else iterations
-    h, w = iterations.shape
-    rgb = np.zeros((h, w, 3), dtype=np.uint8)
-    for i, color_hex in enumerate(color_scheme):
-        r = int(color_hex[1:3], 16)
-        g = int(color_hex[3:5], 16)
-        b = int(color_hex[5:7], 16)
-        lower = i / len(color_scheme)
-        upper = (i + 1) / len(color_scheme)
-        mask = (normalized >= lower) & (normalized < upper)
-        rgb[mask] = [r, g, b]
-    return rgb
+# Palette lookup tables
+#
+# A color scheme is expanded once into a (steps + 1, 3) uint8 table; coloring
+# an image is then one scaled index into it. The last entry is black and is
+# hit only by normalized == 1.0, i.e. points that never escaped.
 
+PALETTE_STEPS_PER_COLOR = 256
 
-def generate_mandelbrot(pattern: FractalPattern, size: Tuple[int, int]) -> np.ndarray:
-    width, height = size
-    x = np.linspace(-2.5, 1.5, width)
-    y = np.linspace(-2.0, 2.0, height)
-    X, Y = np.meshgrid(x, y)
-    C = X + 1j * Y
-    Z = np.zeros_like(C)
-    iterations = np.zeros(C.shape, dtype=int)
-    for i in range(pattern.iterations):
-        mask = np.abs(Z) <= 2
-        Z[mask] = Z[mask] ** 2 + C[mask]
-        iterations[mask] = i
-    return iterations_to_rgb(iterations, pattern.color_scheme)
-
-
-def generate_julia(pattern: FractalPattern, size: Tuple[int, int]) -> np.ndarray:
+
+def _hex_to_rgb(color_hex: str) -> Tuple[int, int, int]:
+    return int(color_hex[1:3], 16), int(color_hex[3:5], 16), int(color_hex[5:7], 16)
+
+
+@lru_cache(maxsize=64)
+def palette_lut(color_scheme: Tuple[str, ...], smooth: bool = False) -> np.ndarray:
+    """Read-only RGB lookup table for a color scheme, banded or interpolated"""
+    stops = np.array([_hex_to_rgb(color_hex) for color_hex in color_scheme], dtype=np.float64)
+    steps = len(stops) * PALETTE_STEPS_PER_COLOR
+    lut = np.zeros((steps + 1, 3), dtype=np.uint8)
+    if smooth and len(stops) > 1:
+        positions = np.linspace(0.0, len(stops) - 1, steps)
+        for channel in range(3):
+            lut[:steps, channel] = np.rint(np.interp(positions, np.arange(len(stops)), stops[:, channel]))
+    else:
+        lut[:steps] = np.repeat(stops, PALETTE_STEPS_PER_COLOR, axis=0)
+    lut.setflags(write=False)
+    return lut
+
+
+def iterations_to_rgb(
+    iterations: np.ndarray,
+    color_scheme: List[str],
+    out: Optional[np.ndarray] = None,
+    smooth: bool = False,
+) -> np.ndarray:
+    """Color iteration counts through the scheme's cached palette table.
+
+    out, if given, must be a (height, width, 3) uint8 array and is filled in place.
+    """
+    lut = palette_lut(tuple(color_scheme), smooth)
+    steps = len(lut) - 1
+    max_iter = float(np.max(iterations))
+    if max_iter > 0:
+        # Divide first: steps / max_iter rounds, and the product can land just under a band edge
+        index = np.divide(iterations, max_iter, dtype=np.float64)
+        index *= steps
+        np.floor(index, out=index)
+        np.clip(index, 0, steps, out=index)
+        index = index.astype(np.intp)
+        index[iterations >= max_iter] = steps
+    else:
+        index = np.zeros(iterations.shape, dtype=np.intp)
+    if out is None:
+        out = np.empty(iterations.shape + (3,), dtype=np.uint8)
+    return np.take(lut, index, axis=0, out=out)
+
+
+# Escape-time engine
+#
+# Each band of rows is iterated on flat arrays holding only the points that
+# have not escaped yet; escaped points are recorded and dropped, so later
+# iterations only touch the shrinking active set. z is updated in place.
+#
+# Banded counts escape at radius 2. Smooth counts escape at a much larger
+# bailout, where the fractional term is accurate, and are shifted back by
+# the iterations that takes so both modes put a point in the same band.
+
+ESCAPE_RADIUS = 2.0
+SMOOTH_BAILOUT_SQUARED = 2.0 ** 16
+SMOOTH_ITERATION_SHIFT = math.log2(math.log(SMOOTH_BAILOUT_SQUARED) / math.log(ESCAPE_RADIUS * ESCAPE_RADIUS))
+PRECISIONS = {"single": np.complex64, "double": np.complex128}
+TILE_ROWS = 128
+PARALLEL_MIN_PIXELS = 1 << 22  # ~4 megapixels; smaller renders stay in-process
+
+
+def _escape_band(
+    algorithm: str,
+    viewport: Viewport,
+    size: Tuple[int, int],
+    rows: Tuple[int, int],
+    max_iter: int,
+    julia_c: complex,
+    smooth: bool,
+    precision: str,
+) -> np.ndarray:
+    """Iteration counts for rows[0]:rows[1] of the image, as float32"""
+    dtype = PRECISIONS[precision]
+    x, y = viewport.axes(size)
+    y = y[rows[0]:rows[1]]
+    points = np.empty((len(y), len(x)), dtype=dtype)
+    points.real = x
+    points.imag = y[:, None]
+    points = points.ravel()
+
+    if algorithm == "julia":
+        z, c = points, dtype(julia_c)
+        per_point_c = False
+    else:
+        z, c = np.zeros_like(points), points
+        per_point_c = True
+
+    # Points that never escape keep the top count, as in the original masks
+    counts = np.full(points.size, max(max_iter - 1, 0), dtype=np.float32)
+    active = np.arange(points.size)
+    magnitude = np.empty(points.size, dtype=z.real.dtype)
+    scratch = np.empty_like(magnitude)
+    limit = SMOOTH_BAILOUT_SQUARED if smooth else ESCAPE_RADIUS * ESCAPE_RADIUS
+    log_limit = math.log(limit)
+
+    for i in range(max_iter):
+        n = z.size
+        mag, tmp = magnitude[:n], scratch[:n]
+        np.multiply(z.real, z.real, out=mag)
+        np.multiply(z.imag, z.imag, out=tmp)
+        mag += tmp
+        escaped = mag > limit
+        if escaped.any():
+            value = max(i - 1, 0)
+            hit = active[escaped]
+            if smooth:
+                # n + 1 - log2(log|z| / log R), kept inside [n, n + 1) so bands stay ordered
+                fraction = 1.0 - np.log2(np.log(mag[escaped].astype(np.float64)) / log_limit)
+                smooth_count = value + np.clip(fraction, 0.0, 0.999) - SMOOTH_ITERATION_SHIFT
+                counts[hit] = np.maximum(smooth_count, 0.0)
+            else:
+                counts[hit] = value
+            keep = np.flatnonzero(~escaped)
+            if keep.size == 0:
+                break
+            active = active[keep]
+            z = z[keep]
+            if per_point_c:
+                c = c[keep]
+        np.multiply(z, z, out=z)
+        z += c
+
+    return counts.reshape(len(y), len(x))
+
+
+def _escape_band_task(task: Tuple) -> np.ndarray:
+    return _escape_band(*task)
+
+
+_band_pool: Optional[ProcessPoolExecutor] = None
+_band_pool_workers = 0
+
+
+def _get_band_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool kept across renders, so zoom sequences pay its startup once"""
+    global _band_pool, _band_pool_workers
+    if _band_pool is None or _band_pool_workers != workers:
+        shutdown_band_pool()
+        _band_pool = ProcessPoolExecutor(max_workers=workers)
+        _band_pool_workers = workers
+    return _band_pool
+
+
+@atexit.register
+def shutdown_band_pool() -> None:
+    """Stop the shared render pool; the next parallel render starts a new one"""
+    global _band_pool, _band_pool_workers
+    if _band_pool is not None:
+        _band_pool.shutdown()
+        _band_pool = None
+        _band_pool_workers = 0
+
+
+def render_escape_time(
+    algorithm: str,
+    size: Tuple[int, int],
+    max_iter: int,
+    viewport: Optional[Viewport] = None,
+    julia_c: complex = JULIA_CONSTANT,
+    smooth: bool = True,
+    precision: str = "double",
+    workers: Optional[int] = None,
+) -> np.ndarray:
+    """Iteration counts for a Mandelbrot or Julia render, shape (height, width).
+
+    Large images are split into row bands and spread across a shared process
+    pool (workers=None uses every CPU, workers=1 stays in-process). "single"
+    precision is faster but blurs once zoomed past ~1e5; "double" holds to ~1e13.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}', expected one of {sorted(PRECISIONS)}")
+    viewport = viewport or DEFAULT_VIEWPORTS.get(algorithm, DEFAULT_VIEWPORTS["mandelbrot"])
     width, height = size
-    c = -0.7 + 0.27015j
-    x = np.linspace(-2.0, 2.0, width)
-    y = np.linspace(-2.0, 2.0, height)
-    X, Y = np.meshgrid(x, y)
-    Z = X + 1j * Y
-    iterations = np.zeros(Z.shape, dtype=int)
-    for i in range(pattern.iterations):
-        mask = np.abs(Z) <= 2
-        Z[mask] = Z[mask] ** 2 + c
-        iterations[mask] = i
-    return iterations_to_rgb(iterations, pattern.color_scheme)
-
-
-def generate_dragon_curve(pattern: FractalPattern, size: Tuple[int, int]) -> np.ndarray:
-    # Lightweight placeholder image: gradient using first color
+    bands = [(start, min(start + TILE_ROWS, height)) for start in range(0, height, TILE_ROWS)]
+    tasks = [(algorithm, viewport, size, rows, max_iter, julia_c, smooth, precision) for rows in bands]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2 or width * height < PARALLEL_MIN_PIXELS:
+        results = [_escape_band_task(task) for task in tasks]
+    else:
+        results = list(_get_band_pool(workers).map(_escape_band_task, tasks))
+    if not results:
+        return np.zeros((height, width), dtype=np.float32)
+    return np.concatenate(results, axis=0)
+
+
+def generate_mandelbrot(
+    pattern: FractalPattern,
+    size: Tuple[int, int],
+    viewport: Optional[Viewport] = None,
+    workers: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    iterations = render_escape_time(
+        "mandelbrot", size, pattern.iterations,
+        viewport=viewport or pattern.viewport, smooth=pattern.smooth_gradient, workers=workers,
+    )
+    return iterations_to_rgb(iterations, pattern.color_scheme, out=out, smooth=pattern.smooth_gradient)
+
+
+def generate_julia(
+    pattern: FractalPattern,
+    size: Tuple[int, int],
+    viewport: Optional[Viewport] = None,
+    workers: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    iterations = render_escape_time(
+        "julia", size, pattern.iterations,
+        viewport=viewport or pattern.viewport, smooth=pattern.smooth_gradient, workers=workers,
+    )
+    return iterations_to_rgb(iterations, pattern.color_scheme, out=out, smooth=pattern.smooth_gradient)
+
+
+# L-system curves
+#
+# Rewriting runs on uint8 symbol arrays: every pass gathers each symbol's
+# replacement out of one flat rule table, so there is no string building or
+# recursion. The turtle is a cumulative sum of headings and step vectors.
+
+@dataclass(frozen=True)
+class LSystem:
+    axiom: str
+    rules: Tuple[Tuple[str, str], ...]
+    angle: float
+    draw_symbols: str = "F"
+    start_angle: float = 0.0
+
+
+def get_lsystems() -> Dict[str, LSystem]:
+    return {
+        "dragon": LSystem("FX", (("X", "X+YF+"), ("Y", "-FX-Y")), 90.0),
+        "hilbert": LSystem("A", (("A", "+BF-AFA-FB+"), ("B", "-AF+BFB+FA-")), 90.0),
+        "koch_snowflake": LSystem("F--F--F", (("F", "F+F--F+F"),), 60.0),
+        "sierpinski_arrowhead": LSystem("A", (("A", "B-A-B"), ("B", "A+B+A")), 60.0, draw_symbols="AB"),
+        "gosper_flowsnake": LSystem(
+            "A", (("A", "A-B--B+A++AA+B-"), ("B", "+A-BB--B-A++A+B")), 60.0, draw_symbols="AB"
+        ),
+        "quadratic_koch_island": LSystem(
+            "F-F-F-F", (("F", "F+FF-FF-F-F+F+FF-F-F+F+FF+FF-F"),), 90.0
+        ),
+    }
+
+
+def _rule_table(system: LSystem) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flat replacement table plus per-symbol start offset and length"""
+    rules = dict(system.rules)
+    chunks = [rules.get(chr(code), chr(code)).encode("latin-1") for code in range(256)]
+    lengths = np.array([len(chunk) for chunk in chunks], dtype=np.intp)
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    flat = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+    return flat, starts, lengths
+
+
+def expand_lsystem(system: LSystem, iterations: int) -> np.ndarray:
+    """Symbol sequence after the given number of rewriting passes, as uint8"""
+    flat, rule_starts, rule_lengths = _rule_table(system)
+    symbols = np.frombuffer(system.axiom.encode("latin-1"), dtype=np.uint8)
+    for _ in range(iterations):
+        lengths = rule_lengths[symbols]
+        ends = np.cumsum(lengths)
+        offsets = np.arange(ends[-1]) - np.repeat(ends - lengths, lengths)
+        symbols = flat[np.repeat(rule_starts[symbols], lengths) + offsets]
+    return symbols
+
+
+def lsystem_vertices(system: LSystem, iterations: int) -> np.ndarray:
+    """Turtle-walk the expanded system into an (n, 2) array of unit-step vertices"""
+    symbols = expand_lsystem(system, iterations)
+    turns = np.zeros(256, dtype=np.float64)
+    turns[ord("+")] = system.angle
+    turns[ord("-")] = -system.angle
+    turns[ord("|")] = 180.0
+    draws = np.zeros(256, dtype=bool)
+    draws[[ord(symbol) for symbol in system.draw_symbols]] = True
+
+    headings = np.cumsum(turns[symbols])[draws[symbols]]
+    headings = np.deg2rad(headings + system.start_angle)
+    vertices = np.zeros((len(headings) + 1, 2), dtype=np.float64)
+    np.cumsum(np.cos(headings), out=vertices[1:, 0])
+    np.cumsum(np.sin(headings), out=vertices[1:, 1])
+    return vertices
+
+
+RASTER_CHUNK_SAMPLES = 1 << 22
+
+
+def rasterize_polyline(
+    vertices: np.ndarray,
+    size: Tuple[int, int],
+    color_scheme: List[str],
+    out: Optional[np.ndarray] = None,
+    margin: float = 0.05,
+) -> np.ndarray:
+    """Draw a polyline scaled to fit the image, colored along its length.
+
+    Every segment is sampled once per pixel step (DDA) and all samples of a
+    chunk of segments are written with one fancy assignment.
+    """
     width, height = size
-    base_color = pattern.color_scheme[0]
-    r = int(base_color[1:3], 16)
-    g = int(base_color[3:5], 16)
-    b = int(base_color[5:7], 16)
-    x = np.linspace(0, 1, width)
-    y = np.linspace(0, 1, height)
-    X, Y = np.meshgrid(x, y)
-    img = np.stack([
-        (r * X).astype(np.uint8),
-        (g * Y).astype(np.uint8),
-        (b * (1 - X * Y)).astype(np.uint8),
-    ], axis=-1)
-    return img
+    if out is None:
+        out = np.zeros((height, width, 3), dtype=np.uint8)
+    else:
+        out.fill(0)
+    if len(vertices) < 2:
+        return out
+
+    low = vertices.min(axis=0)
+    span = np.maximum(vertices.max(axis=0) - low, 1e-12)
+    usable = np.array([width - 1, height - 1], dtype=np.float64) * (1 - 2 * margin)
+    scale = float(np.min(usable / span))
+    offset = (np.array([width - 1, height - 1]) - span * scale) / 2
+    points = (vertices - low) * scale + offset
+    points[:, 1] = (height - 1) - points[:, 1]
+
+    start = points[:-1]
+    delta = points[1:] - start
+    steps = np.maximum(np.ceil(np.abs(delta).max(axis=1)).astype(np.intp), 1)
+    lut = palette_lut(tuple(color_scheme), True)
+    shade = np.arange(len(steps)) * (len(lut) - 2) // max(len(steps) - 1, 1)
+
+    ends = np.cumsum(steps)
+    cuts = np.searchsorted(ends, np.arange(RASTER_CHUNK_SAMPLES, ends[-1], RASTER_CHUNK_SAMPLES))
+    bounds = np.concatenate(([0], cuts, [len(steps)]))
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        if first == last:
+            continue
+        counts = steps[first:last]
+        segment = np.repeat(np.arange(first, last), counts)
+        local_ends = np.cumsum(counts)
+        t = (np.arange(local_ends[-1]) - np.repeat(local_ends - counts, counts)) / counts[segment - first]
+        xs = np.rint(start[segment, 0] + t * delta[segment, 0]).astype(np.intp)
+        ys = np.rint(start[segment, 1] + t * delta[segment, 1]).astype(np.intp)
+        out[ys, xs] = lut[shade[segment]]
+    end_x, end_y = np.rint(points[-1]).astype(np.intp)
+    out[end_y, end_x] = lut[shade[-1]]
+    return out
+
+
+def generate_lsystem(
+    pattern: FractalPattern,
+    size: Tuple[int, int],
+    system: Optional[str] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    systems = get_lsystems()
+    name = system or pattern.lsystem or pattern.algorithm
+    if name not in systems:
+        raise ValueError(f"L-system '{name}' not found")
+    vertices = lsystem_vertices(systems[name], pattern.iterations)
+    return rasterize_polyline(vertices, size, pattern.color_scheme, out=out)
+
+
+def generate_dragon_curve(
+    pattern: FractalPattern, size: Tuple[int, int], out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    return generate_lsystem(pattern, size, "dragon", out=out)
 
 
 def get_fractal_patterns() -> Dict[str, FractalPattern]:
@@ -124,6 +478,45 @@ def get_fractal_patterns() -> Dict[str, FractalPattern]:
                 "meditation_focus": "serpent_power",
             },
         ),
+        "hilbert_labyrinth": FractalPattern(
+            name="Hilbert Labyrinth",
+            algorithm="lsystem",
+            iterations=7,
+            complexity=0.75,
+            color_scheme=["#2c1810", "#8b4513", "#daa520", "#ffd700"],
+            magical_properties={
+                "space_filling": True,
+                "labyrinth_walk": True,
+                "meditation_focus": "the_winding_path",
+            },
+            lsystem="hilbert",
+        ),
+        "koch_snowflake_veil": FractalPattern(
+            name="Koch Snowflake Veil",
+            algorithm="lsystem",
+            iterations=6,
+            complexity=0.6,
+            color_scheme=["#191970", "#6a5acd", "#b0c4de", "#ffffff"],
+            magical_properties={
+                "infinite_boundary": True,
+                "finite_area": True,
+                "meditation_focus": "bounded_infinity",
+            },
+            lsystem="koch_snowflake",
+        ),
+        "flowsnake_flower": FractalPattern(
+            name="Flowsnake Flower of Life",
+            algorithm="lsystem",
+            iterations=5,
+            complexity=0.85,
+            color_scheme=["#013220", "#228b22", "#daa520", "#fffacd"],
+            magical_properties={
+                "hexagonal_harmony": True,
+                "seven_fold_growth": True,
+                "meditation_focus": "flower_of_life",
+            },
+            lsystem="gosper_flowsnake",
+        ),
         "abyss_crossing": FractalPattern(
             name="Abyss Crossing Fractal",
             algorithm="mandelbrot",
@@ -157,15 +550,42 @@ def get_fractal_patterns() -> Dict[str, FractalPattern]:
     }
 
 
-def generate_fractal(patterns: Dict[str, FractalPattern], name: str, size: Tuple[int, int]) -> np.ndarray:
+def generate_fractal(
+    patterns: Dict[str, FractalPattern],
+    name: str,
+    size: Tuple[int, int],
+    viewport: Optional[Viewport] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     if name not in patterns:
         raise ValueError(f"Fractal pattern '{name}' not found")
     pattern = patterns[name]
     if pattern.algorithm == "mandelbrot":
-        return generate_mandelbrot(pattern, size)
+        return generate_mandelbrot(pattern, size, viewport, out=out)
     if pattern.algorithm == "julia":
-        return generate_julia(pattern, size)
+        return generate_julia(pattern, size, viewport, out=out)
     if pattern.algorithm == "dragon_curve":
-        return generate_dragon_curve(pattern, size)
+        return generate_dragon_curve(pattern, size, out=out)
+    if pattern.algorithm == "lsystem":
+        return generate_lsystem(pattern, size, out=out)
     # Default fallback
-    return generate_mandelbrot(pattern, size)
+    return generate_mandelbrot(pattern, size, viewport, out=out)
+
+
+def generate_zoom_frames(
+    patterns: Dict[str, FractalPattern],
+    name: str,
+    size: Tuple[int, int],
+    center: complex,
+    frames: int,
+    zoom_per_frame: float = 1.1,
+) -> Iterator[np.ndarray]:
+    """Yield successive frames zooming into center, one RGB image per frame"""
+    if name not in patterns:
+        raise ValueError(f"Fractal pattern '{name}' not found")
+    pattern = patterns[name]
+    start = pattern.viewport or DEFAULT_VIEWPORTS.get(pattern.algorithm, DEFAULT_VIEWPORTS["mandelbrot"])
+    viewport = start.zoom(1.0, center)
+    for _ in range(frames):
+        yield generate_fractal(patterns, name, size, viewport)
+        viewport = viewport.zoom(zoom_per_frame)
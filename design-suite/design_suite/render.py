@@ -1,116 +1,483 @@
 """
 Sacred Geometry Rendering Module for Cathedral Design Suite
-Renders sacred geometric patterns using matplotlib with proper error handling
+Renders sacred geometric patterns through a small canvas interface with
+proper error handling. The default backend rasterizes with NumPy directly;
+matplotlib is kept as an optional backend and only imported when requested.
 """
 
-import warnings
 import logging
 import math
-from typing import Dict, Tuple, Union
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "NumPy is required for design_suite/render.py. "
+        "Install it with: python -m pip install numpy, then select the same interpreter in VS Code."
+    ) from exc
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-try:
-    import matplotlib
-    # Use headless backend for non-GUI environments
-    matplotlib.use("Agg")
-    
-    import numpy as np  # type: ignore
-    from matplotlib.patches import Polygon, Circle, FancyBboxPatch
-    import matplotlib.pyplot as plt
-    
-    MATPLOTLIB_AVAILABLE = True
-    logger.info("Matplotlib successfully imported")
-    
-except ImportError as e:
-    logger.error(f"Failed to import matplotlib dependencies: {e}")
-    logger.error("Please install required dependencies: pip install matplotlib numpy")
-    MATPLOTLIB_AVAILABLE = False
-    
-    # Create placeholder classes to prevent import errors
-    class MockMatplotlib:
-        def use(self, backend): pass
-    
-    matplotlib = MockMatplotlib()
-    
-    # Create placeholder modules
-    np = type('MockModule', (), {
-        'linspace': lambda *args: [],
-        'sqrt': lambda x: x,
-        'max': lambda x: x,
-        'exp': lambda x: x,
-        'cos': lambda x: x,
-        'sin': lambda x: x,
-        'pi': 3.14159
-    })()
-    
-    # Create placeholder types for matplotlib
-    Polygon = Circle = FancyBboxPatch = plt = type('MockModule', (), {})()
-
-
-def _create_triangle(x: float, y: float, scale: float, direction: str = "up"):
-    """Create a triangle polygon with proper matplotlib properties."""
-    height = scale * math.sqrt(3) / 2
-    if direction == "up":
-        points = [
-            [x, y + height * 2 / 3],
-            [x - scale / 2, y - height * 1 / 3],
-            [x + scale / 2, y - height * 1 / 3],
-        ]
-    else:
-        points = [
-            [x, y - height * 2 / 3],
-            [x - scale / 2, y + height * 1 / 3],
-            [x + scale / 2, y + height * 1 / 3],
-        ]
-    
-    if MATPLOTLIB_AVAILABLE:
-        return Polygon(points, closed=True, facecolor='none', edgecolor='black', linewidth=1)
-    else:
-        return type('MockPolygon', (), {'set_alpha': lambda self, x: None})()
+Point = Tuple[float, float]
+Color = Union[str, Tuple[float, float, float]]
+
+# Figure geometry shared by both backends: 100 dpi, matplotlib's default
+# subplot box, and a [-2, 2] x [-2, 2] data square with equal aspect.
+DPI = 100
+AXES_BOX = (0.125, 0.11, 0.9, 0.88)  # left, bottom, right, top
+DATA_LIMITS = (-2.0, 2.0)
+
+NAMED_COLORS: Dict[str, Tuple[int, int, int]] = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "gold": (255, 215, 0),
+    "silver": (192, 192, 192),
+    "purple": (128, 0, 128),
+    "red": (255, 0, 0),
+    "crimson": (220, 20, 60),
+    "blue": (0, 0, 255),
+}
+
+
+def parse_color(color: Color) -> np.ndarray:
+    """Named color, "#rrggbb" string or 0-1 RGB tuple as a float32 0-255 triple"""
+    if isinstance(color, str):
+        if color.startswith("#"):
+            return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float32)
+        if color not in NAMED_COLORS:
+            raise ValueError(f"Unknown color '{color}'")
+        return np.array(NAMED_COLORS[color], dtype=np.float32)
+    return np.array(color, dtype=np.float32) * 255
+
+
+# Drawing interface
+
+class Canvas(ABC):
+    """Drawing surface targeted by the _draw_* functions, in data coordinates.
+
+    Linewidths and font sizes are in points, as in matplotlib.
+    """
+
+    @abstractmethod
+    def circle(self, center: Point, radius: float, edgecolor: Optional[Color] = None,
+               facecolor: Optional[Color] = None, linewidth: float = 1.0, alpha: float = 1.0,
+               linestyle: str = "-") -> None:
+        ...
+
+    @abstractmethod
+    def polygon(self, points: Sequence[Point], edgecolor: Optional[Color] = None,
+                facecolor: Optional[Color] = None, linewidth: float = 1.0, alpha: float = 1.0) -> None:
+        ...
+
+    def rectangle(self, corner: Point, width: float, height: float, edgecolor: Optional[Color] = None,
+                  facecolor: Optional[Color] = None, linewidth: float = 1.0, alpha: float = 1.0) -> None:
+        x, y = corner
+        points = [(x, y), (x + width, y), (x + width, y + height), (x, y + height)]
+        self.polygon(points, edgecolor=edgecolor, facecolor=facecolor, linewidth=linewidth, alpha=alpha)
+
+    @abstractmethod
+    def polyline(self, xs: Sequence[float], ys: Sequence[float], color: Color,
+                 linewidth: float = 1.0, alpha: float = 1.0) -> None:
+        ...
+
+    def fill_between(self, xs: Sequence[float], upper: Sequence[float], lower: Sequence[float],
+                     color: Color, alpha: float = 1.0) -> None:
+        points = list(zip(xs, upper)) + list(zip(xs[::-1], lower[::-1]))
+        self.polygon(points, facecolor=color, alpha=alpha)
+
+    @abstractmethod
+    def text(self, x: float, y: float, label: str, color: Color = "black", fontsize: float = 10,
+             ha: str = "left", va: str = "baseline", weight: str = "normal", style: str = "normal",
+             alpha: float = 1.0) -> None:
+        ...
+
+    @abstractmethod
+    def arrow(self, start: Point, end: Point, color: Color, linewidth: float = 1.0, alpha: float = 1.0) -> None:
+        ...
+
+    @abstractmethod
+    def to_array(self) -> np.ndarray:
+        """Finish drawing and return the image as (height, width, 3) uint8"""
+
+    def close(self) -> None:
+        """Release backend resources if drawing is abandoned"""
+
+
+# NumPy backend
+#
+# Shapes become antialiased coverage masks that are alpha-blended once into
+# the RGB buffer, so overlapping strokes of one shape never double up.
+# Circles only visit the pixels of their ring (row spans), polygon fills are
+# scan-converted on sub-scanlines, and strokes use distance-to-segment over
+# small per-segment (or per-chunk) windows.
+
+SEGMENT_CHUNK = 16
+STROKE_GROUP_LENGTH = 48
+SUBSCANLINES = 4
+DASH_PATTERN = (3.7, 1.6)  # on/off lengths in linewidths, matplotlib's "--"
+
+
+def _segment_distances(xs: np.ndarray, ys: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """Distance from every pixel center to the nearest of the given segments"""
+    ax, ay, bx, by = (segments[:, i][:, None, None] for i in range(4))
+    dx, dy = bx - ax, by - ay
+    length2 = np.maximum(dx * dx + dy * dy, 1e-12)
+    t = np.clip(((xs - ax) * dx + (ys - ay) * dy) / length2, 0.0, 1.0)
+    px = xs - (ax + t * dx)
+    py = ys - (ay + t * dy)
+    return np.sqrt((px * px + py * py).min(axis=0))
+
+
+def _span_coverage(left: np.ndarray, right: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """Horizontal coverage of pixels [x, x + 1) by spans, summed over the last span axis"""
+    cover = np.clip(right[..., None] - xs, 0.0, 1.0) - np.clip(left[..., None] - xs, 0.0, 1.0)
+    return np.clip(cover, 0.0, None).sum(axis=-2)
+
+
+class NumpyCanvas(Canvas):
+    def __init__(self, size: Tuple[int, int], background: Color = "white"):
+        self.width, self.height = size
+        self.pixels = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self.pixels[:] = parse_color(background)
+        left, bottom, right, top = AXES_BOX
+        box_w = (right - left) * self.width
+        box_h = (top - bottom) * self.height
+        span = DATA_LIMITS[1] - DATA_LIMITS[0]
+        self.scale = min(box_w, box_h) / span
+        self.origin_x = left * self.width + box_w / 2
+        self.origin_y = (1 - (bottom + top) / 2) * self.height
+        self.px_per_point = DPI / 72
+        # Shapes are clipped to the data square like matplotlib clips patches to
+        # the axes; text is not clipped (matplotlib's clip_on=False for text)
+        half_span = span / 2 * self.scale
+        self.clip = (
+            max(int(round(self.origin_x - half_span)), 0),
+            max(int(round(self.origin_y - half_span)), 0),
+            min(int(round(self.origin_x + half_span)), self.width),
+            min(int(round(self.origin_y + half_span)), self.height),
+        )
+
+    # Coordinate helpers
+    def _to_pixels(self, points: Sequence[Point]) -> np.ndarray:
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return np.column_stack((self.origin_x + pts[:, 0] * self.scale, self.origin_y - pts[:, 1] * self.scale))
+
+    def _grid(self, x_min: float, y_min: float, x_max: float, y_max: float):
+        """Pixel window covering a bounding box, with pixel-center coordinates"""
+        clip_c0, clip_r0, clip_c1, clip_r1 = self.clip
+        c0 = max(int(math.floor(x_min)), clip_c0)
+        r0 = max(int(math.floor(y_min)), clip_r0)
+        c1 = min(int(math.ceil(x_max)) + 1, clip_c1)
+        r1 = min(int(math.ceil(y_max)) + 1, clip_r1)
+        if c0 >= c1 or r0 >= r1:
+            return None
+        xs = np.arange(c0, c1, dtype=np.float64)[None, :] + 0.5
+        ys = np.arange(r0, r1, dtype=np.float64)[:, None] + 0.5
+        return (slice(r0, r1), slice(c0, c1)), xs, ys
+
+    def _blend(self, window, coverage: np.ndarray, color: Color, alpha: float) -> None:
+        """Alpha-blend color into the pixels of a window (slices or index arrays)"""
+        if isinstance(window[0], slice):
+            # Only touch covered pixels; stroke windows are mostly empty
+            rows, cols = np.nonzero(coverage)
+            coverage = coverage[rows, cols]
+            window = (rows + window[0].start, cols + window[1].start)
+        region = self.pixels[window].astype(np.float32)
+        weight = (coverage * alpha).astype(np.float32)[..., None]
+        region += (parse_color(color) - region) * weight
+        self.pixels[window] = region + 0.5
+
+    def _ring_pixels(self, cx: float, cy: float, inner: float, outer: float):
+        """Row and column indices of the pixels between two radii around a center"""
+        clip_c0, clip_r0, clip_c1, clip_r1 = self.clip
+        r0 = max(int(math.floor(cy - outer)), clip_r0)
+        r1 = min(int(math.ceil(cy + outer)) + 1, clip_r1)
+        if r0 >= r1:
+            return None
+        rows = np.arange(r0, r1)
+        dy2 = (rows + 0.5 - cy) ** 2
+        outer_half = np.sqrt(np.maximum(outer * outer - dy2, 0.0))
+        inner_half = np.sqrt(np.maximum(inner * inner - dy2, 0.0)) if inner > 0 else np.zeros_like(dy2)
+        # Left and right span per row; they join up where the row misses the hole
+        starts = np.concatenate((cx - outer_half, cx + inner_half))
+        stops = np.concatenate((cx - inner_half, cx + outer_half))
+        starts = np.clip(np.floor(starts).astype(np.intp), clip_c0, clip_c1)
+        stops = np.clip(np.ceil(stops).astype(np.intp), clip_c0, clip_c1)
+        span_rows = np.concatenate((rows, rows))
+        # Keep the right span from re-visiting pixels of the left one
+        starts[len(rows):] = np.maximum(starts[len(rows):], stops[:len(rows)])
+        counts = np.maximum(stops - starts, 0)
+        total = int(counts.sum())
+        if total == 0:
+            return None
+        ends = np.cumsum(counts)
+        cols = np.arange(total) - np.repeat(ends - counts, counts) + np.repeat(starts, counts)
+        return np.repeat(span_rows, counts), cols
+
+    def _stroke_coverage(self, pts: np.ndarray, half: float, closed: bool):
+        """Coverage of a stroked polyline over its bounding window"""
+        reach = half + 1
+        grid = self._grid(*(pts.min(axis=0) - reach), *(pts.max(axis=0) + reach))
+        if grid is None:
+            return None
+        window, _, _ = grid
+        coverage = np.zeros((window[0].stop - window[0].start, window[1].stop - window[1].start))
+        ends = np.vstack((pts, pts[:1])) if closed else pts
+        segments = np.hstack((ends[:-1], ends[1:]))
+        lengths = np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+        # Consecutive segments are grouped up to STROKE_GROUP_LENGTH pixels of
+        # outline (and SEGMENT_CHUNK segments) so every group scans a small window
+        buckets = np.cumsum(lengths) // STROKE_GROUP_LENGTH
+        cuts = np.union1d(np.flatnonzero(np.diff(buckets)) + 1, np.arange(0, len(segments), SEGMENT_CHUNK))
+        for first, last in zip(cuts, np.append(cuts[1:], len(segments))):
+            group = segments[first:last]
+            corners = group.reshape(-1, 2)
+            sub = self._grid(*(corners.min(axis=0) - reach), *(corners.max(axis=0) + reach))
+            if sub is None:
+                continue
+            (rows, cols), sub_xs, sub_ys = sub
+            dist = _segment_distances(sub_xs, sub_ys, group)
+            target = coverage[rows.start - window[0].start:rows.stop - window[0].start,
+                              cols.start - window[1].start:cols.stop - window[1].start]
+            np.maximum(target, np.clip(half + 0.5 - dist, 0.0, 1.0), out=target)
+        return window, coverage
+
+    def _fill_coverage(self, pts: np.ndarray):
+        """Even-odd polygon coverage from spans on SUBSCANLINES rows per pixel"""
+        grid = self._grid(*pts.min(axis=0), *pts.max(axis=0))
+        if grid is None:
+            return None
+        window, xs, _ = grid
+        rows = window[0]
+        sub_ys = rows.start + (np.arange((rows.stop - rows.start) * SUBSCANLINES) + 0.5) / SUBSCANLINES
+        x0, y0 = pts[:, 0], pts[:, 1]
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+        ys = sub_ys[:, None]
+        crosses = (y0 > ys) != (y1 > ys)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            hits = np.where(crosses, x0 + (ys - y0) * (x1 - x0) / (y1 - y0), np.inf)
+        hits.sort(axis=1)
+        pairs = int(crosses.sum(axis=1).max()) // 2
+        if pairs == 0:
+            return None
+        left, right = hits[:, 0:2 * pairs:2], hits[:, 1:2 * pairs:2]
+        gap = ~np.isfinite(right)
+        left[gap] = right[gap] = 0.0
+        cover = _span_coverage(left, right, xs[0] - 0.5)
+        return window, cover.reshape(-1, SUBSCANLINES, cover.shape[-1]).mean(axis=1)
+
+    # Canvas interface
+    def circle(self, center, radius, edgecolor=None, facecolor=None, linewidth=1.0, alpha=1.0, linestyle="-"):
+        (cx, cy), = self._to_pixels([center])
+        r = radius * self.scale
+        half = linewidth * self.px_per_point / 2
+        if facecolor is not None:
+            pixels = self._ring_pixels(cx, cy, 0.0, r + 1)
+            if pixels is not None:
+                rows, cols = pixels
+                dist = np.hypot(cols + 0.5 - cx, rows + 0.5 - cy)
+                self._blend((rows, cols), np.clip(r - dist + 0.5, 0.0, 1.0), facecolor, alpha)
+        if edgecolor is not None and linewidth > 0:
+            pixels = self._ring_pixels(cx, cy, r - half - 1, r + half + 1)
+            if pixels is None:
+                return
+            rows, cols = pixels
+            dx, dy = cols + 0.5 - cx, rows + 0.5 - cy
+            coverage = np.clip(half + 0.5 - np.abs(np.hypot(dx, dy) - r), 0.0, 1.0)
+            if linestyle == "--":
+                on, off = (length * linewidth * self.px_per_point for length in DASH_PATTERN)
+                arc = (np.arctan2(dy, dx) % (2 * math.pi)) * r
+                coverage = coverage * ((arc % (on + off)) < on)
+            self._blend((rows, cols), coverage, edgecolor, alpha)
+
+    def polygon(self, points, edgecolor=None, facecolor=None, linewidth=1.0, alpha=1.0):
+        pts = self._to_pixels(points)
+        if facecolor is not None:
+            filled = self._fill_coverage(pts)
+            if filled is not None:
+                self._blend(*filled, facecolor, alpha)
+        if edgecolor is not None and linewidth > 0:
+            stroked = self._stroke_coverage(pts, linewidth * self.px_per_point / 2, closed=True)
+            if stroked is not None:
+                self._blend(*stroked, edgecolor, alpha)
+
+    def polyline(self, xs, ys, color, linewidth=1.0, alpha=1.0):
+        pts = self._to_pixels(np.column_stack((np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64))))
+        if len(pts) < 2:
+            return
+        stroked = self._stroke_coverage(pts, linewidth * self.px_per_point / 2, closed=False)
+        if stroked is not None:
+            self._blend(*stroked, color, alpha)
+
+    def text(self, x, y, label, color="black", fontsize=10, ha="left", va="baseline",
+             weight="normal", style="normal", alpha=1.0):
+        font = _load_font(weight == "bold", style == "italic", int(round(fontsize * self.px_per_point)))
+        if font is None:
+            return
+        from PIL import Image, ImageDraw
+
+        anchor = {"left": "l", "center": "m", "right": "r"}[ha] + \
+            {"baseline": "s", "center": "m", "top": "t", "bottom": "b"}[va]
+        left, top, right, bottom = font.getbbox(label, anchor=anchor)
+        if right <= left or bottom <= top:
+            return
+        mask = Image.new("L", (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), label, font=font, fill=255, anchor=anchor)
+        coverage = np.asarray(mask, dtype=np.float32) / 255.0
+        (px, py), = self._to_pixels([(x, y)])
+        c0, r0 = int(round(px)) + left, int(round(py)) + top
+        rows = slice(max(r0, 0), min(r0 + coverage.shape[0], self.height))
+        cols = slice(max(c0, 0), min(c0 + coverage.shape[1], self.width))
+        if rows.start >= rows.stop or cols.start >= cols.stop:
+            return
+        coverage = coverage[rows.start - r0:rows.stop - r0, cols.start - c0:cols.stop - c0]
+        self._blend((rows, cols), coverage, color, alpha)
+
+    def arrow(self, start, end, color, linewidth=1.0, alpha=1.0):
+        (sx, sy), (ex, ey) = start, end
+        angle = math.atan2(ey - sy, ex - sx)
+        head = 12 * self.px_per_point / self.scale * 0.4
+        xs, ys = [sx, ex], [sy, ey]
+        self.polyline(xs, ys, color, linewidth=linewidth, alpha=alpha)
+        for side in (-1, 1):
+            barb = angle + math.pi - side * math.pi / 6
+            self.polyline([ex + head * math.cos(barb), ex], [ey + head * math.sin(barb), ey],
+                          color, linewidth=linewidth, alpha=alpha)
+
+    def to_array(self) -> np.ndarray:
+        return self.pixels.copy()
+
+
+@lru_cache(maxsize=32)
+def _load_font(bold: bool, italic: bool, pixel_size: int):
+    """DejaVu Sans (matplotlib's default face) via Pillow; None without Pillow"""
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        logger.debug("Pillow not installed; text is skipped by the numpy backend")
+        return None
+    styled = "DejaVuSans" + ("-Bold" if bold else "") + ("Oblique" if italic else "") + ".ttf"
+    plain = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+    for name in (styled.replace("SansOblique", "Sans-Oblique"), plain):
+        try:
+            return ImageFont.truetype(name, max(pixel_size, 1))
+        except OSError:
+            continue
+    try:
+        # Pillow >= 10.1 scales its default font; older versions only have the fixed bitmap
+        return ImageFont.load_default(size=max(pixel_size, 1))
+    except TypeError:
+        return ImageFont.load_default()
+
+
+# Matplotlib backend (optional)
+
+class MatplotlibCanvas(Canvas):
+    def __init__(self, size: Tuple[int, int]):
+        try:
+            import matplotlib
+            # Use headless backend for non-GUI environments
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+            from matplotlib.patches import Circle, Polygon
+        except ImportError as exc:
+            raise ImportError(
+                "The matplotlib render backend needs matplotlib: pip install matplotlib"
+            ) from exc
+        self._plt, self._Circle, self._Polygon = plt, Circle, Polygon
+        self.fig, self.ax = plt.subplots(figsize=(size[0] / DPI, size[1] / DPI), dpi=DPI)
+        self.ax.set_xlim(*DATA_LIMITS)
+        self.ax.set_ylim(*DATA_LIMITS)
+        self.ax.set_aspect('equal')
+        self.ax.axis('off')
+
+    def circle(self, center, radius, edgecolor=None, facecolor=None, linewidth=1.0, alpha=1.0, linestyle="-"):
+        self.ax.add_patch(self._Circle(
+            center, radius, fill=facecolor is not None, facecolor=facecolor or "none",
+            edgecolor=edgecolor or "none", linewidth=linewidth, alpha=alpha, linestyle=linestyle,
+        ))
+
+    def polygon(self, points, edgecolor=None, facecolor=None, linewidth=1.0, alpha=1.0):
+        self.ax.add_patch(self._Polygon(
+            [list(p) for p in points], closed=True, facecolor=facecolor or "none",
+            edgecolor=edgecolor or "none", linewidth=linewidth, alpha=alpha,
+        ))
+
+    def polyline(self, xs, ys, color, linewidth=1.0, alpha=1.0):
+        self.ax.plot(xs, ys, color=color, linewidth=linewidth, alpha=alpha)
+
+    def fill_between(self, xs, upper, lower, color, alpha=1.0):
+        self.ax.fill_between(xs, upper, lower, color=color, alpha=alpha)
+
+    def text(self, x, y, label, color="black", fontsize=10, ha="left", va="baseline",
+             weight="normal", style="normal", alpha=1.0):
+        self.ax.text(x, y, label, color=color, fontsize=fontsize, ha=ha, va=va,
+                     weight=weight, style=style, alpha=alpha)
+
+    def arrow(self, start, end, color, linewidth=1.0, alpha=1.0):
+        self.ax.annotate("", xy=end, xytext=start,
+                         arrowprops=dict(arrowstyle="->", color=color, lw=linewidth, alpha=alpha))
+
+    def to_array(self) -> np.ndarray:
+        try:
+            self.fig.canvas.draw()
+            rgba = np.frombuffer(self.fig.canvas.buffer_rgba(), dtype=np.uint8)
+            rgba = rgba.reshape(self.fig.canvas.get_width_height()[::-1] + (4,))
+            return rgba[:, :, :3].copy()
+        finally:
+            # Clean up matplotlib resources
+            self._plt.close(self.fig)
+
+    def close(self) -> None:
+        self._plt.close(self.fig)
+
 
+RENDER_BACKENDS = {
+    "numpy": NumpyCanvas,
+    "matplotlib": MatplotlibCanvas,
+}
 
-def _draw_circle_pattern(ax, geometry):
+
+# Geometry drawing
+
+def _draw_circle_pattern(canvas: Canvas, geometry):
     """Draw circular sacred geometry patterns."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     params = geometry.parameters
     geometry_name = getattr(geometry, 'name', 'Unknown')
-    
+
     try:
         if geometry_name == "Flower of Life":
-            ax.add_patch(Circle((0, 0), params["radius"], fill=False, edgecolor="gold", linewidth=2))
+            canvas.circle((0, 0), params["radius"], edgecolor="gold", linewidth=2)
             for i in range(6):
                 angle = i * math.pi / 3
                 x = params["radius"] * math.cos(angle)
                 y = params["radius"] * math.sin(angle)
-                ax.add_patch(Circle((x, y), params["radius"], fill=False, edgecolor="gold", linewidth=2))
+                canvas.circle((x, y), params["radius"], edgecolor="gold", linewidth=2)
             for i in range(12):
                 angle = i * math.pi / 6
                 x = 2 * params["radius"] * math.cos(angle)
                 y = 2 * params["radius"] * math.sin(angle)
-                ax.add_patch(Circle((x, y), params["radius"], fill=False, edgecolor="gold", linewidth=1.5))
-                
+                canvas.circle((x, y), params["radius"], edgecolor="gold", linewidth=1.5)
+
         elif geometry_name == "Seed of Life":
-            ax.add_patch(Circle((0, 0), params["radius"], fill=False, edgecolor="gold", linewidth=2))
+            canvas.circle((0, 0), params["radius"], edgecolor="gold", linewidth=2)
             for i in range(6):
                 angle = i * math.pi / 3
                 x = params["radius"] * math.cos(angle)
                 y = params["radius"] * math.sin(angle)
-                ax.add_patch(Circle((x, y), params["radius"], fill=False, edgecolor="gold", linewidth=2))
-                
+                canvas.circle((x, y), params["radius"], edgecolor="gold", linewidth=2)
+
     except Exception as e:
         logger.warning(f"Error drawing circle pattern {geometry_name}: {e}")
 
 
-def _draw_golden_spiral(ax, geometry):
+def _draw_golden_spiral(canvas: Canvas, geometry):
     """Draw golden spiral pattern."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
         params = geometry.parameters
         ratio = params["ratio"]
@@ -122,119 +489,72 @@ def _draw_golden_spiral(ax, geometry):
         max_r = np.max(r)
         x = x / max_r * 1.8
         y = y / max_r * 1.8
-        ax.plot(x, y, color="gold", linewidth=3)
-        
+        canvas.polyline(x, y, color="gold", linewidth=3)
+
         for i in range(5):
             scale = ratio ** i
             width = 1.0 / scale
             height = width / ratio
-            rect = FancyBboxPatch(
-                (-width / 2, -height / 2), width, height, 
-                fill=False, edgecolor="gold", linewidth=1, alpha=0.7
-            )
-            ax.add_patch(rect)
-            
+            canvas.rectangle((-width / 2, -height / 2), width, height, edgecolor="gold", linewidth=1, alpha=0.7)
+
     except Exception as e:
         logger.warning(f"Error drawing golden spiral: {e}")
 
 
-def _draw_sri_yantra(ax, geometry):
+def _draw_sri_yantra(canvas: Canvas, geometry):
     """Draw Sri Yantra triangular mandala."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
-        ax.add_patch(FancyBboxPatch((-1.8, -1.8), 3.6, 3.6, fill=False, edgecolor="gold", linewidth=2))
+        canvas.rectangle((-1.8, -1.8), 3.6, 3.6, edgecolor="gold", linewidth=2)
         for radius in [1.6, 1.4, 1.2]:
-            ax.add_patch(Circle((0, 0), radius, fill=False, edgecolor="gold", linewidth=1, alpha=0.7))
-            
-        # Draw upward triangles with correct properties
+            canvas.circle((0, 0), radius, edgecolor="gold", linewidth=1, alpha=0.7)
+
+        # Draw upward triangles
         for i in range(4):
             scale = 1.0 - i * 0.2
-            tri = Polygon(
-                _get_triangle_points(0, 0, scale, "up"),
-                closed=True,
-                facecolor='none',
-                edgecolor='gold',
-                linewidth=2,
-                alpha=1.0
-            )
-            ax.add_patch(tri)
-            
+            canvas.polygon(_get_triangle_points(0, 0, scale, "up"), edgecolor="gold", linewidth=2)
+
         # Draw downward triangles
         for i in range(5):
             scale = 1.1 - i * 0.18
-            tri = Polygon(
-                _get_triangle_points(0, 0, scale, "down"),
-                closed=True,
-                facecolor='none',
-                edgecolor='silver',
-                linewidth=2,
-                alpha=1.0
-            )
-            ax.add_patch(tri)
-            
+            canvas.polygon(_get_triangle_points(0, 0, scale, "down"), edgecolor="silver", linewidth=2)
+
     except Exception as e:
         logger.warning(f"Error drawing Sri Yantra: {e}")
 
 
-def _draw_merkaba(ax, geometry):
+def _draw_merkaba(canvas: Canvas, geometry):
     """Draw merkaba (star tetrahedron)."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
         # Upward triangle
-        tri1 = Polygon(
-            _get_triangle_points(0, 0, 1.5, "up"),
-            closed=True,
-            facecolor='gold',
-            edgecolor='gold',
-            linewidth=3,
-            alpha=0.3
-        )
-        ax.add_patch(tri1)
-        
+        canvas.polygon(_get_triangle_points(0, 0, 1.5, "up"),
+                       edgecolor="gold", facecolor="gold", linewidth=3, alpha=0.3)
         # Downward triangle
-        tri2 = Polygon(
-            _get_triangle_points(0, 0, 1.5, "down"),
-            closed=True,
-            facecolor='silver',
-            edgecolor='silver',
-            linewidth=3,
-            alpha=0.3
-        )
-        ax.add_patch(tri2)
-        
-        ax.add_patch(Circle((0, 0), 0.1, color="white", zorder=10))
-        
+        canvas.polygon(_get_triangle_points(0, 0, 1.5, "down"),
+                       edgecolor="silver", facecolor="silver", linewidth=3, alpha=0.3)
+
+        canvas.circle((0, 0), 0.1, edgecolor="white", facecolor="white")
+
     except Exception as e:
         logger.warning(f"Error drawing merkaba: {e}")
 
 
-def _draw_vesica_piscis(ax, geometry):
+def _draw_vesica_piscis(canvas: Canvas, geometry):
     """Draw vesica piscis lens pattern."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
-        ax.add_patch(Circle((-0.5, 0), 1.0, fill=False, edgecolor="gold", linewidth=3))
-        ax.add_patch(Circle((0.5, 0), 1.0, fill=False, edgecolor="gold", linewidth=3))
-        
+        canvas.circle((-0.5, 0), 1.0, edgecolor="gold", linewidth=3)
+        canvas.circle((0.5, 0), 1.0, edgecolor="gold", linewidth=3)
+
         lens_x = np.linspace(-0.5, 0.5, 100)
         upper_y = np.sqrt(1 - (lens_x + 0.5) ** 2)
         lower_y = -np.sqrt(1 - (lens_x + 0.5) ** 2)
-        ax.fill_between(lens_x, upper_y, lower_y, alpha=0.3, color="gold")
-        
+        canvas.fill_between(lens_x, upper_y, lower_y, color="gold", alpha=0.3)
+
     except Exception as e:
         logger.warning(f"Error drawing vesica piscis: {e}")
 
 
-def _draw_achad_tree(ax, geometry):
+def _draw_achad_tree(canvas: Canvas, geometry):
     """Draw Achad's reversed Tree of Life."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
         # Sephiroth positions (inverted Y coordinates)
         sephiroth_coords = {
@@ -249,7 +569,7 @@ def _draw_achad_tree(ax, geometry):
             2: (0.6, -1.0),    # Chokmah (Wisdom)
             1: (0, -1.6),      # Kether (Crown) - now at bottom
         }
-        
+
         # Draw 22 paths connecting sephiroth
         paths_map = [
             (1, 2), (1, 3), (1, 6),  # Kether connections
@@ -262,75 +582,60 @@ def _draw_achad_tree(ax, geometry):
             (8, 9), (8, 10),         # Hod
             (9, 10),                 # Yesod-Malkuth
         ]
-        
+
         for s1, s2 in paths_map:
             x1, y1 = sephiroth_coords[s1]
             x2, y2 = sephiroth_coords[s2]
-            ax.plot([x1, x2], [y1, y2], color="silver", linewidth=1, alpha=0.6)
-        
+            canvas.polyline([x1, x2], [y1, y2], color="silver", linewidth=1, alpha=0.6)
+
         # Draw sephiroth as circles
         for num, (x, y) in sephiroth_coords.items():
             color = "gold" if num == 1 else "silver"  # Kether gold even at bottom
             size = 0.15 if num == 6 else 0.12  # Tiphareth slightly larger
-            ax.add_patch(Circle((x, y), size, fill=True, facecolor=color, edgecolor="white", linewidth=2, alpha=0.8))
-            ax.text(x, y, str(num), ha="center", va="center", color="black", fontsize=8, weight="bold")
-        
+            canvas.circle((x, y), size, facecolor=color, edgecolor="white", linewidth=2, alpha=0.8)
+            canvas.text(x, y, str(num), ha="center", va="center", color="black", fontsize=8, weight="bold")
+
         # Mark the reversal with directional arrows
-        ax.annotate("", xy=(0, -1.8), xytext=(0, 2.0), 
-                    arrowprops=dict(arrowstyle="->", color="purple", lw=2, alpha=0.5))
-        ax.text(0.3, -1.9, "Maat", color="purple", fontsize=9, style="italic")
-        
+        canvas.arrow((0, 2.0), (0, -1.8), color="purple", linewidth=2, alpha=0.5)
+        canvas.text(0.3, -1.9, "Maat", color="purple", fontsize=9, style="italic")
+
     except Exception as e:
         logger.warning(f"Error drawing Achad tree: {e}")
 
 
-def _draw_oath_abyss_sigil(ax, geometry):
+def _draw_oath_abyss_sigil(canvas: Canvas, geometry):
     """Draw Oath of the Abyss sigil."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
         # Central Daath (the invisible sephirah in the Abyss)
-        ax.add_patch(Circle((0, 0), 0.3, fill=True, facecolor="black", edgecolor="red", linewidth=3))
-        ax.text(0, 0, "∴", ha="center", va="center", color="red", fontsize=18, weight="bold")
-        
+        canvas.circle((0, 0), 0.3, facecolor="black", edgecolor="red", linewidth=3)
+        canvas.text(0, 0, "∴", ha="center", va="center", color="red", fontsize=18, weight="bold")
+
         # Choronzon seal (333) - dispersive triangular pattern
         for i in range(3):
             angle = i * 2 * math.pi / 3
             x = 0.8 * math.cos(angle)
             y = 0.8 * math.sin(angle)
-            
-            tri = Polygon(
-                _get_triangle_points(x, y, 0.4, "down" if i % 2 == 0 else "up"),
-                closed=True,
-                facecolor='none',
-                edgecolor='red',
-                linewidth=2,
-                alpha=0.7
-            )
-            ax.add_patch(tri)
-        
+            canvas.polygon(_get_triangle_points(x, y, 0.4, "down" if i % 2 == 0 else "up"),
+                           edgecolor="red", linewidth=2, alpha=0.7)
+
         # Babalon gate (outer circle with seven points)
-        ax.add_patch(Circle((0, 0), 1.5, fill=False, edgecolor="crimson", linewidth=3, linestyle="--"))
+        canvas.circle((0, 0), 1.5, edgecolor="crimson", linewidth=3, linestyle="--")
         for i in range(7):
             angle = i * 2 * math.pi / 7
             x = 1.5 * math.cos(angle)
             y = 1.5 * math.sin(angle)
-            ax.plot([0, x], [0, y], color="crimson", linewidth=1, alpha=0.4)
-            ax.add_patch(Circle((x, y), 0.08, fill=True, color="crimson", alpha=0.8))
-        
+            canvas.polyline([0, x], [0, y], color="crimson", linewidth=1, alpha=0.4)
+            canvas.circle((x, y), 0.08, facecolor="crimson", edgecolor="crimson", alpha=0.8)
+
         # The crossing formula text
-        ax.text(0, -1.85, "Oath of the Abyss", ha="center", color="red", fontsize=8, weight="bold")
-        
+        canvas.text(0, -1.85, "Oath of the Abyss", ha="center", color="red", fontsize=8, weight="bold")
+
     except Exception as e:
         logger.warning(f"Error drawing oath abyss sigil: {e}")
 
 
-def _draw_qblh_cube(ax, geometry):
+def _draw_qblh_cube(canvas: Canvas, geometry):
     """Draw QBLH Cube of Space with Hebrew letters."""
-    if not MATPLOTLIB_AVAILABLE:
-        return
-        
     try:
         # Cube vertices in 2D projection (isometric-ish)
         cube_scale = 1.2
@@ -346,19 +651,19 @@ def _draw_qblh_cube(ax, geometry):
             (cube_scale * 0.5, cube_scale * 0.5 + 0.6),
             (-cube_scale * 0.5, cube_scale * 0.5 + 0.6),
         ]
-        
+
         # Draw cube edges
         for i in range(4):
             j = (i + 1) % 4
-            ax.plot([front[i][0], front[j][0]], [front[i][1], front[j][1]], color="silver", linewidth=2)
-            ax.plot([back[i][0], back[j][0]], [back[i][1], back[j][1]], color="silver", linewidth=1.5, alpha=0.7)
-            ax.plot([front[i][0], back[i][0]], [front[i][1], back[i][1]], color="silver", linewidth=1.5, alpha=0.7)
-        
+            canvas.polyline([front[i][0], front[j][0]], [front[i][1], front[j][1]], color="silver", linewidth=2)
+            canvas.polyline([back[i][0], back[j][0]], [back[i][1], back[j][1]], color="silver", linewidth=1.5, alpha=0.7)
+            canvas.polyline([front[i][0], back[i][0]], [front[i][1], back[i][1]], color="silver", linewidth=1.5, alpha=0.7)
+
         # 3 Mother letters (axes: Aleph, Mem, Shin)
-        ax.text(0, 0, "א", ha="center", va="center", color="gold", fontsize=16, weight="bold")  # Aleph (Air)
-        ax.text(0, -cube_scale - 0.3, "מ", ha="center", va="center", color="blue", fontsize=14, weight="bold")  # Mem (Water)
-        ax.text(cube_scale + 0.3, 0, "ש", ha="center", va="center", color="red", fontsize=14, weight="bold")  # Shin (Fire)
-        
+        canvas.text(0, 0, "א", ha="center", va="center", color="gold", fontsize=16, weight="bold")  # Aleph (Air)
+        canvas.text(0, -cube_scale - 0.3, "מ", ha="center", va="center", color="blue", fontsize=14, weight="bold")  # Mem (Water)
+        canvas.text(cube_scale + 0.3, 0, "ש", ha="center", va="center", color="red", fontsize=14, weight="bold")  # Shin (Fire)
+
         # 7 Double letters on faces (simplified placement)
         double_positions = [
             (0, cube_scale * 0.7, "ב"),
@@ -370,8 +675,8 @@ def _draw_qblh_cube(ax, geometry):
             (0, 0.3, "ת"),
         ]
         for x, y, letter in double_positions:
-            ax.text(x, y, letter, ha="center", va="center", color="silver", fontsize=10, alpha=0.8)
-        
+            canvas.text(x, y, letter, ha="center", va="center", color="silver", fontsize=10, alpha=0.8)
+
         # 12 Simple letters on edges (sample placement)
         simple_letters = "הוזחטילנסעצק"
         edge_positions = [
@@ -384,10 +689,10 @@ def _draw_qblh_cube(ax, geometry):
         ]
         for i, (x, y) in enumerate(edge_positions):
             if i < len(simple_letters):
-                ax.text(x, y, simple_letters[i], ha="center", va="center", color="white", fontsize=7, alpha=0.7)
-        
-        ax.text(0, -1.85, "QBLH Cube (Achad)", ha="center", color="gold", fontsize=8, weight="bold")
-        
+                canvas.text(x, y, simple_letters[i], ha="center", va="center", color="white", fontsize=7, alpha=0.7)
+
+        canvas.text(0, -1.85, "QBLH Cube (Achad)", ha="center", color="gold", fontsize=8, weight="bold")
+
     except Exception as e:
         logger.warning(f"Error drawing QBLH cube: {e}")
 
@@ -409,67 +714,54 @@ def _get_triangle_points(x: float, y: float, scale: float, direction: str):
         ]
 
 
-def generate_sacred_geometry(geometries, geometry_name: str, size: Tuple[int, int]):
+GEOMETRY_DRAWERS = {
+    "circle_pattern": _draw_circle_pattern,
+    "spiral_pattern": _draw_golden_spiral,
+    "triangular_mandala": _draw_sri_yantra,
+    "tetrahedron_star": _draw_merkaba,
+    "lens_pattern": _draw_vesica_piscis,
+    "reversed_tree": _draw_achad_tree,
+    "abyss_crossing": _draw_oath_abyss_sigil,
+    "cubic_letters": _draw_qblh_cube,
+}
+
+
+def generate_sacred_geometry(geometries, geometry_name: str, size: Tuple[int, int], backend: str = "numpy"):
     """
     Generate sacred geometry image with proper error handling.
-    
+
     Args:
         geometries: Dictionary of available geometries
         geometry_name: Name of geometry to generate
         size: Tuple of (width, height) in pixels
-        
+        backend: "numpy" (default, no matplotlib needed) or "matplotlib"
+
     Returns:
         numpy.ndarray: RGB image array or None if error
     """
-    if not MATPLOTLIB_AVAILABLE:
-        logger.error("Matplotlib not available - cannot generate geometry")
-        return None
-        
     if geometry_name not in geometries:
         raise ValueError(f"Geometry '{geometry_name}' not found. Available: {list(geometries.keys())}")
-    
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(f"Unknown render backend '{backend}'. Available: {list(RENDER_BACKENDS)}")
+
     geometry = geometries[geometry_name]
-    
+
+    try:
+        canvas = RENDER_BACKENDS[backend](size)
+    except ImportError as e:
+        logger.error(f"Render backend '{backend}' not available: {e}")
+        return None
+
     try:
-        fig, ax = plt.subplots(figsize=(size[0] / 100, size[1] / 100), dpi=100)
-        ax.set_xlim(-2, 2)
-        ax.set_ylim(-2, 2)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
         geometry_type = getattr(geometry, 'type', 'unknown')
-        
-        if geometry_type == "circle_pattern":
-            _draw_circle_pattern(ax, geometry)
-        elif geometry_type == "spiral_pattern":
-            _draw_golden_spiral(ax, geometry)
-        elif geometry_type == "triangular_mandala":
-            _draw_sri_yantra(ax, geometry)
-        elif geometry_type == "tetrahedron_star":
-            _draw_merkaba(ax, geometry)
-        elif geometry_type == "lens_pattern":
-            _draw_vesica_piscis(ax, geometry)
-        elif geometry_type == "reversed_tree":
-            _draw_achad_tree(ax, geometry)
-        elif geometry_type == "abyss_crossing":
-            _draw_oath_abyss_sigil(ax, geometry)
-        elif geometry_type == "cubic_letters":
-            _draw_qblh_cube(ax, geometry)
+        drawer = GEOMETRY_DRAWERS.get(geometry_type)
+        if drawer is not None:
+            drawer(canvas, geometry)
         else:
             logger.warning(f"Unknown geometry type: {geometry_type}")
-        
-        fig.canvas.draw()
-        rgba = np.frombuffer(fig.canvas.buffer_rgba(), dtype=np.uint8)
-        rgba = rgba.reshape(fig.canvas.get_width_height()[::-1] + (4,))
-        buf = rgba[:, :, :3]
-        
-        # Clean up matplotlib resources
-        plt.close(fig)
-        
-        return buf
-        
+        return canvas.to_array()
+
     except Exception as e:
         logger.error(f"Error generating geometry {geometry_name}: {e}")
-        if 'fig' in locals():
-            plt.close(fig)
-        return None
\ No newline at end of file
+        canvas.close()
+        return None
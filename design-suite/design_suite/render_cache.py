@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+CACHE_DIR_ENV = "CATHEDRAL_RENDER_CACHE"
+CACHE_BYTES_ENV = "CATHEDRAL_RENDER_CACHE_BYTES"
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+DEFAULT_DISK_BYTES = 2 * 1024 ** 3
+DISK_FORMATS = ("npy", "png")
+
+
+@lru_cache(maxsize=None)
+def code_version(*modules: ModuleType) -> str:
+    """Digest of the rendering modules' source, so code changes miss the cache"""
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _jsonable(value: Any) -> Any:
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    return str(value)
+
+
+def render_key(kind: str, params: Dict[str, Any], version: str) -> str:
+    """Content address for one render: kind, every input parameter and code version"""
+    payload = json.dumps(
+        {"kind": kind, "params": params, "version": version},
+        sort_keys=True, default=_jsonable,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Two-tier cache of rendered images.
+
+    An in-process LRU bounded by max_memory_bytes sits in front of an optional
+    content-addressed store under cache_dir (NPY by default, or PNG for files
+    that web and Godot exports can serve directly). The store is bounded by
+    max_disk_bytes: files are touched on every hit and the least recently used
+    are deleted once it is over budget, which also clears out renders keyed by
+    an older code version. Cached arrays are returned read-only; copy before
+    modifying.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        cache_dir: Optional[Path] = None,
+        disk_format: str = "npy",
+        max_disk_bytes: int = DEFAULT_DISK_BYTES,
+    ):
+        if disk_format not in DISK_FORMATS:
+            raise ValueError(f"Unknown disk format '{disk_format}', expected one of {DISK_FORMATS}")
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.disk_format = disk_format
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        # Measured on the first store, then kept as a running total
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "RenderCache":
+        """Memory cache, plus a disk store when CATHEDRAL_RENDER_CACHE names a directory
+        (bounded by CATHEDRAL_RENDER_CACHE_BYTES when set)"""
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+        max_disk_bytes = os.environ.get(CACHE_BYTES_ENV)
+        return cls(
+            cache_dir=Path(cache_dir) if cache_dir else None,
+            max_disk_bytes=int(max_disk_bytes) if max_disk_bytes else DEFAULT_DISK_BYTES,
+        )
+
+    def path_for(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.{self.disk_format}"
+
+    def get_or_render(self, key: str, render: Callable[[], Optional[np.ndarray]]) -> Optional[np.ndarray]:
+        """Cached image for key, rendering and storing it on a miss.
+
+        Failed renders (None) are passed through and not cached.
+        """
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+
+        image = self._load(key)
+        if image is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            image = render()
+            if image is None:
+                return None
+            image = np.ascontiguousarray(image)
+            self._store(key, image)
+            with self._lock:
+                self.misses += 1
+
+        image.setflags(write=False)
+        self._remember(key, image)
+        return image
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+            }
+
+    def _remember(self, key: str, image: np.ndarray) -> None:
+        if image.nbytes > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous.nbytes
+            self._entries[key] = image
+            self._memory_bytes += image.nbytes
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        path = self.path_for(key)
+        if path is None:
+            return None
+        try:
+            if self.disk_format == "npy":
+                image = np.load(path, allow_pickle=False)
+            else:
+                from PIL import Image
+                with Image.open(path) as img:
+                    image = np.asarray(img.convert("RGB")).copy()
+            # Pruning removes the least recently used files first
+            os.utime(path)
+            return image
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, image: np.ndarray) -> None:
+        path = self.path_for(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                if self.disk_format == "npy":
+                    np.save(f, image, allow_pickle=False)
+                else:
+                    from PIL import Image
+                    Image.fromarray(image).save(f, format="PNG")
+            size = tmp_path.stat().st_size
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            self._grow_disk(size - previous)
+        except (OSError, ImportError, TypeError, ValueError):
+            # The disk tier is best effort; the memory tier still serves repeats
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def prune_disk(self) -> int:
+        """Delete least recently used files until the store fits max_disk_bytes;
+        returns the number of bytes freed"""
+        if self.cache_dir is None:
+            return 0
+        with self._disk_lock:
+            entries = self._disk_entries()
+            total = sum(size for _, size, _ in entries)
+            freed = 0
+            for _, size, path in entries:
+                if total - freed <= self.max_disk_bytes:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                freed += size
+            self._disk_bytes = total - freed
+            return freed
+
+    def _grow_disk(self, delta: int) -> None:
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                # The first store measures what earlier runs left behind
+                self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+            else:
+                self._disk_bytes += delta
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self.prune_disk()
+
+    def _disk_entries(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every stored render, oldest first"""
+        entries = []
+        for path in self.cache_dir.glob(f"*/*.{self.disk_format}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
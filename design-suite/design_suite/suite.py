@@ -3,17 +3,19 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 
 from .geometry import SacredGeometry, get_sacred_geometries
-from .fractals import FractalPattern, get_fractal_patterns, generate_fractal
+from .fractals import FractalPattern, Viewport, get_fractal_patterns, generate_fractal
 from .palettes import get_color_palettes
 from .templates import DesignTemplate, get_design_templates
 from .logo import generate_witch_eye_logo
 from .render import generate_sacred_geometry as render_geometry
+from .render_cache import RenderCache, code_version, render_key
+from . import fractals as fractals_module, render as render_module
 
 
 class CathedralDesignSuite:
     """Modular Cathedral Creative Design Suite"""
 
-    def __init__(self) -> None:
+    def __init__(self, render_cache: Optional[RenderCache] = None) -> None:
         self.golden_ratio = (1 + math.sqrt(5)) / 2
         self.sacred_geometries: Dict[str, SacredGeometry] = get_sacred_geometries()
         self.fractal_patterns: Dict[str, FractalPattern] = get_fractal_patterns()
@@ -22,13 +24,38 @@ class CathedralDesignSuite:
             self.color_palettes, self.sacred_geometries, self.fractal_patterns
         )
         self.witch_eye_logo: Dict[str, Any] = generate_witch_eye_logo()
+        self.render_cache = render_cache or RenderCache.from_env()
 
     # Rendering / generation API
-    def generate_sacred_geometry(self, geometry_name: str, size: Tuple[int, int] = (800, 800)) -> np.ndarray:
-        return render_geometry(self.sacred_geometries, geometry_name, size)
+    def generate_sacred_geometry(
+        self, geometry_name: str, size: Tuple[int, int] = (800, 800), backend: str = "numpy"
+    ) -> np.ndarray:
+        if geometry_name not in self.sacred_geometries:
+            # Unknown names fall through to the renderer's ValueError
+            return render_geometry(self.sacred_geometries, geometry_name, size, backend)
+        key = render_key(
+            "sacred_geometry",
+            {"geometry": self.sacred_geometries[geometry_name], "size": size, "backend": backend},
+            code_version(render_module),
+        )
+        return self.render_cache.get_or_render(
+            key, lambda: render_geometry(self.sacred_geometries, geometry_name, size, backend)
+        )
 
-    def generate_fractal(self, pattern_name: str, size: Tuple[int, int] = (800, 800)) -> np.ndarray:
-        return generate_fractal(self.fractal_patterns, pattern_name, size)
+    def generate_fractal(
+        self, pattern_name: str, size: Tuple[int, int] = (800, 800), viewport: Optional[Viewport] = None
+    ) -> np.ndarray:
+        if pattern_name not in self.fractal_patterns:
+            # Unknown names fall through to the renderer's ValueError
+            return generate_fractal(self.fractal_patterns, pattern_name, size, viewport)
+        key = render_key(
+            "fractal",
+            {"pattern": self.fractal_patterns[pattern_name], "size": size, "viewport": viewport},
+            code_version(fractals_module),
+        )
+        return self.render_cache.get_or_render(
+            key, lambda: generate_fractal(self.fractal_patterns, pattern_name, size, viewport)
+        )
 
     # Design composition
     def create_design_from_template(
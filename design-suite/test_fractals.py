@@ -0,0 +1,174 @@
+# Test the design suite fractal renderer
+# Palette indexing and escape-time coloring
+
+import sys
+import os
+sys.path.append(os.path.join('.', 'design-suite'))
+
+import numpy as np
+from design_suite.fractals import (
+    DEFAULT_VIEWPORTS, JULIA_CONSTANT, PALETTE_STEPS_PER_COLOR, FractalPattern, expand_lsystem, generate_julia,
+    generate_mandelbrot, get_lsystems, iterations_to_rgb, lsystem_vertices, palette_lut, rasterize_polyline,
+    render_escape_time
+)
+
+SCHEME = ["#2c1810", "#8b4513", "#daa520", "#ffd700", "#ffffff"]
+
+def test_interior_is_black_for_every_max_iter():
+    """Points at the top count map to the black entry whatever max_iter is"""
+    print("\n🎨 Testing palette indexing across max_iter...")
+
+    lut = palette_lut(tuple(SCHEME))
+    steps = len(lut) - 1
+    for max_iter in range(1, 1001):
+        iterations = np.arange(max_iter + 1, dtype=np.float32)[None, :]
+        rgb = iterations_to_rgb(iterations, SCHEME)
+        assert (rgb[0, -1] == 0).all(), f"interior not black for max_iter={max_iter}"
+        expected = np.floor(iterations[0, :-1].astype(np.float64) / max_iter * steps).astype(np.intp)
+        assert (rgb[0, :-1] == lut[expected]).all(), f"band boundary off for max_iter={max_iter}"
+    print("✅ Interior black and bands exact for max_iter 1..1000")
+
+    return True
+
+def test_rendered_interior_is_black():
+    """A Mandelbrot render colors the main cardioid black in both modes"""
+    print("\n🌀 Testing rendered interior...")
+
+    for smooth in (False, True):
+        for max_iter in (78, 100, 155, 333):
+            iterations = render_escape_time("mandelbrot", (64, 64), max_iter, smooth=smooth, workers=1)
+            rgb = iterations_to_rgb(iterations, SCHEME, smooth=smooth)
+            interior = iterations == iterations.max()
+            assert interior.any() and (rgb[interior] == 0).all()
+            assert (rgb[~interior].any(axis=-1)).all()
+    print(f"✅ Interior black, escaped points colored ({PALETTE_STEPS_PER_COLOR} steps per color)")
+
+    return True
+
+def radius_two_reference(algorithm: str, size, max_iter: int) -> np.ndarray:
+    """Plain per-pixel escape counts at radius 2, as the original masked loop produced"""
+    x, y = DEFAULT_VIEWPORTS[algorithm].axes(size)
+    counts = np.full((len(y), len(x)), max_iter - 1, dtype=np.float32)
+    for row, imag in enumerate(y):
+        for col, real in enumerate(x):
+            point = complex(real, imag)
+            z, c = (point, JULIA_CONSTANT) if algorithm == "julia" else (0j, point)
+            for i in range(max_iter):
+                if abs(z) > 2.0:
+                    counts[row, col] = max(i - 1, 0)
+                    break
+                z = z * z + c
+    return counts
+
+def test_discrete_counts_match_radius_two():
+    """Banded renders escape at radius 2, pixel for pixel, through the pattern generators"""
+    print("\n🔢 Testing discrete escape counts...")
+
+    size = (48, 40)
+    for algorithm, generate in (("mandelbrot", generate_mandelbrot), ("julia", generate_julia)):
+        for max_iter in (20, 100):
+            reference = radius_two_reference(algorithm, size, max_iter)
+            counts = render_escape_time(algorithm, size, max_iter, smooth=False, workers=1)
+            assert np.array_equal(counts, reference), f"{algorithm} counts differ at max_iter={max_iter}"
+
+            pattern = FractalPattern(algorithm, algorithm, max_iter, 0.5, SCHEME)
+            assert not pattern.smooth_gradient
+            expected = iterations_to_rgb(reference, SCHEME)
+            assert np.array_equal(generate(pattern, size, workers=1), expected)
+    print("✅ Discrete counts and banded colors match the radius-2 reference")
+
+    return True
+
+def rewrite_reference(system, iterations: int) -> str:
+    """String rewriting, one pass per iteration"""
+    rules = dict(system.rules)
+    symbols = system.axiom
+    for _ in range(iterations):
+        symbols = "".join(rules.get(symbol, symbol) for symbol in symbols)
+    return symbols
+
+def test_lsystem_expansion():
+    """Array rewriting matches string rewriting; vertices follow the draw symbols"""
+    print("\n🐉 Testing L-system expansion...")
+
+    systems = get_lsystems()
+    assert expand_lsystem(systems["dragon"], 1).tobytes() == b"FX+YF+"
+    assert expand_lsystem(systems["koch_snowflake"], 1).tobytes() == b"F+F--F+F--F+F--F+F--F+F--F+F"
+    for name in ("dragon", "koch_snowflake"):
+        system = systems[name]
+        for iterations in range(5):
+            expected = rewrite_reference(system, iterations)
+            symbols = expand_lsystem(system, iterations)
+            assert symbols.tobytes().decode("latin-1") == expected
+            draws = sum(expected.count(symbol) for symbol in system.draw_symbols)
+            assert len(lsystem_vertices(system, iterations)) == draws + 1
+
+    # Closed-form sizes: the dragon draws 2^n segments, the snowflake 3 * 4^n
+    assert len(lsystem_vertices(systems["dragon"], 10)) == 2 ** 10 + 1
+    assert len(lsystem_vertices(systems["koch_snowflake"], 4)) == 3 * 4 ** 4 + 1
+    # The snowflake closes on itself with unit steps
+    vertices = lsystem_vertices(systems["koch_snowflake"], 3)
+    assert np.allclose(vertices[0], vertices[-1])
+    assert np.allclose(np.hypot(*np.diff(vertices, axis=0).T), 1.0)
+    print("✅ Dragon and Koch expansions match string rewriting")
+
+    return True
+
+def connected(mask: np.ndarray) -> bool:
+    """Whether the set pixels of mask form one 8-connected component"""
+    points = set(zip(*np.nonzero(mask)))
+    stack = [next(iter(points))]
+    seen = {stack[0]}
+    while stack:
+        row, col = stack.pop()
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                neighbour = (row + dr, col + dc)
+                if neighbour in points and neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+    return len(seen) == len(points)
+
+def test_rasterized_curve_is_connected():
+    """The rasterizer draws one unbroken line that reaches both ends of the curve"""
+    print("\n✏️ Testing polyline rasterizer...")
+
+    size = (160, 120)
+    for name, iterations in (("dragon", 8), ("hilbert", 4)):
+        vertices = lsystem_vertices(get_lsystems()[name], iterations)
+        image = rasterize_polyline(vertices, size, SCHEME)
+        mask = image.any(axis=-1)
+        assert mask.any() and connected(mask), f"{name} curve is broken"
+
+        # Endpoints land where the fitted transform puts them
+        low = vertices.min(axis=0)
+        span = np.maximum(vertices.max(axis=0) - low, 1e-12)
+        usable = np.array([size[0] - 1, size[1] - 1]) * 0.9
+        scale = float(np.min(usable / span))
+        offset = (np.array([size[0] - 1, size[1] - 1]) - span * scale) / 2
+        for vertex in (vertices[0], vertices[-1]):
+            col, row = np.rint((vertex - low) * scale + offset).astype(int)
+            assert mask[size[1] - 1 - row, col], f"{name} endpoint not drawn"
+    print("✅ Curves rasterize as single connected lines covering both endpoints")
+
+    return True
+
+if __name__ == "__main__":
+    print("🔮 Design Suite Fractals - Test Suite")
+    print("=" * 70)
+
+    try:
+        index_success = test_interior_is_black_for_every_max_iter()
+        render_success = test_rendered_interior_is_black()
+        discrete_success = test_discrete_counts_match_radius_two()
+        lsystem_success = test_lsystem_expansion()
+        raster_success = test_rasterized_curve_is_connected()
+
+        if index_success and render_success and discrete_success and lsystem_success and raster_success:
+            print("\n✨ ALL FRACTAL TESTS PASSED!")
+        else:
+            print("\n⚠️ Some tests need attention")
+    except Exception as e:
+        print(f"\n❌ Test suite error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,74 @@
+# Test the design suite geometry renderer
+# Every drawer renders through the numpy canvas
+
+import sys
+import os
+sys.path.append(os.path.join('.', 'design-suite'))
+
+import numpy as np
+from design_suite.geometry import get_sacred_geometries
+from design_suite.render import GEOMETRY_DRAWERS, NumpyCanvas, generate_sacred_geometry, parse_color
+
+SIZE = (240, 240)
+
+def test_every_drawer_renders_on_numpy_canvas():
+    """Each _draw_* geometry leaves marks on a NumpyCanvas"""
+    print("\n🔯 Testing geometry drawers on the numpy canvas...")
+
+    geometries = get_sacred_geometries()
+    background = parse_color("white")
+    by_type = {geometry.type: name for name, geometry in geometries.items()}
+    assert set(GEOMETRY_DRAWERS) <= set(by_type), "a drawer has no geometry to render"
+
+    for geometry_type, drawer in GEOMETRY_DRAWERS.items():
+        canvas = NumpyCanvas(SIZE)
+        drawer(canvas, geometries[by_type[geometry_type]])
+        image = canvas.to_array()
+        assert image.shape == (SIZE[1], SIZE[0], 3) and image.dtype == np.uint8
+        mask = (image != background).any(axis=-1)
+        assert mask.any(), f"{geometry_type} drew nothing"
+
+        rendered = generate_sacred_geometry(geometries, by_type[geometry_type], SIZE)
+        assert rendered is not None and np.array_equal(rendered, image), f"{geometry_type} differs via entry point"
+        print(f"✅ {geometry_type}: {int(mask.sum())} pixels")
+
+    return True
+
+def test_unknown_backend_raises():
+    """An unknown backend= is rejected instead of falling back"""
+    print("\n🚫 Testing unknown render backend...")
+
+    geometries = get_sacred_geometries()
+    try:
+        generate_sacred_geometry(geometries, "flower_of_life", SIZE, backend="cairo")
+    except ValueError as e:
+        assert "cairo" in str(e)
+    else:
+        raise AssertionError("unknown backend did not raise")
+    try:
+        generate_sacred_geometry(geometries, "no_such_geometry", SIZE)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown geometry did not raise")
+    print("✅ Unknown backend and geometry raise ValueError")
+
+    return True
+
+if __name__ == "__main__":
+    print("🏛️ CATHEDRAL RENDER TEST")
+    print("=" * 40)
+
+    try:
+        drawer_success = test_every_drawer_renders_on_numpy_canvas()
+        backend_success = test_unknown_backend_raises()
+
+        if drawer_success and backend_success:
+            print("\n🎉 ALL RENDER TESTS PASSED!")
+        else:
+            print("\n❌ Some render tests failed")
+
+    except Exception as e:
+        print(f"\n💥 Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,176 @@
+# Test the design suite render cache
+# Memory budget, disk LRU pruning and code-version keys
+
+import sys
+import os
+sys.path.append(os.path.join('.', 'design-suite'))
+
+import importlib.util
+import io
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from design_suite.render_cache import CACHE_BYTES_ENV, CACHE_DIR_ENV, RenderCache, code_version, render_key
+
+SHAPE = (32, 32, 3)
+
+def image(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+class Renderer:
+    """Render callback that counts how often the cache had to call it"""
+
+    def __init__(self, value: int):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self) -> np.ndarray:
+        self.calls += 1
+        return image(self.value)
+
+class CacheEnv:
+    """Point CATHEDRAL_RENDER_CACHE(_BYTES) at a temporary store for the block"""
+
+    def __init__(self, max_disk_bytes: int = None):
+        self.max_disk_bytes = max_disk_bytes
+
+    def __enter__(self) -> Path:
+        self.saved = {name: os.environ.get(name) for name in (CACHE_DIR_ENV, CACHE_BYTES_ENV)}
+        self.tmp = tempfile.TemporaryDirectory()
+        os.environ[CACHE_DIR_ENV] = self.tmp.name
+        if self.max_disk_bytes is None:
+            os.environ.pop(CACHE_BYTES_ENV, None)
+        else:
+            os.environ[CACHE_BYTES_ENV] = str(self.max_disk_bytes)
+        return Path(self.tmp.name)
+
+    def __exit__(self, *exc) -> None:
+        for name, value in self.saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        self.tmp.cleanup()
+
+def test_memory_eviction_by_byte_budget():
+    """The memory tier drops least recently used images to stay within its byte budget"""
+    print("\n🧠 Testing memory eviction...")
+
+    nbytes = image(0).nbytes
+    cache = RenderCache(max_memory_bytes=2 * nbytes + nbytes // 2)
+    renderers = [Renderer(value) for value in range(3)]
+    for key, renderer in zip("abc", renderers[:2]):
+        cache.get_or_render(key, renderer)
+    cache.get_or_render("a", renderers[0])  # a is now most recently used
+    cache.get_or_render("c", renderers[2])  # evicts b
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["memory_bytes"] == 2 * nbytes
+    assert stats["memory_bytes"] <= stats["max_memory_bytes"]
+    assert cache.get_or_render("a", renderers[0])[0, 0, 0] == 0 and renderers[0].calls == 1
+    cache.get_or_render("b", renderers[1])
+    assert renderers[1].calls == 2, "evicted entry was not re-rendered"
+
+    # Images larger than the whole budget are passed through, not cached
+    small = RenderCache(max_memory_bytes=nbytes - 1)
+    small.get_or_render("a", renderers[0])
+    assert small.stats()["entries"] == 0
+    cached = cache.get_or_render("a", renderers[0])
+    assert not cached.flags.writeable
+    print("✅ Memory tier stays within budget in LRU order")
+
+    return True
+
+def test_disk_lru_pruning():
+    """The disk store deletes least recently used files once over CATHEDRAL_RENDER_CACHE_BYTES"""
+    print("\n💾 Testing disk LRU pruning...")
+
+    buffer = io.BytesIO()
+    np.save(buffer, image(0), allow_pickle=False)
+    file_bytes = len(buffer.getvalue())
+
+    with CacheEnv(max_disk_bytes=2 * file_bytes + file_bytes // 2) as cache_dir:
+        cache = RenderCache.from_env()
+        assert cache.cache_dir == cache_dir and cache.max_disk_bytes == 2 * file_bytes + file_bytes // 2
+        for key, value in (("aa01", 1), ("bb02", 2)):
+            cache.get_or_render(key, Renderer(value))
+        # Age both files so the hit below is unambiguously the most recent use
+        for age, key in ((200, "aa01"), (100, "bb02")):
+            stamp = os.stat(cache.path_for(key)).st_mtime - age
+            os.utime(cache.path_for(key), (stamp, stamp))
+
+        # A fresh process finds a on disk, which touches it
+        restarted = RenderCache.from_env()
+        renderer = Renderer(1)
+        assert restarted.get_or_render("aa01", renderer)[0, 0, 0] == 1
+        assert renderer.calls == 0 and restarted.stats()["disk_hits"] == 1
+
+        restarted.get_or_render("cc03", Renderer(3))
+        assert cache.path_for("aa01").exists() and cache.path_for("cc03").exists()
+        assert not cache.path_for("bb02").exists(), "least recently used file survived pruning"
+        assert restarted.stats()["disk_bytes"] == 2 * file_bytes
+
+        # Shrinking the budget prunes down to it
+        restarted.max_disk_bytes = file_bytes
+        assert restarted.prune_disk() == file_bytes
+        assert not cache.path_for("aa01").exists() and cache.path_for("cc03").exists()
+    print("✅ Disk store prunes least recently used files first")
+
+    return True
+
+def load_module(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_code_version_invalidates_keys():
+    """Changing rendering code changes the key, so old renders are not served"""
+    print("\n🔑 Testing code-version keys...")
+
+    with CacheEnv() as cache_dir:
+        source = cache_dir / "drawing.py"
+        # Each process digests the source as it was when first asked
+        source.write_text("COLOR = 1\n")
+        before = load_module(source, "drawing_before")
+        old_version = code_version(before)
+        source.write_text("COLOR = 2\n")
+        after = load_module(source, "drawing_after")
+        assert code_version(after) != old_version
+        assert code_version(before) == old_version
+
+        params = {"size": (32, 32), "scheme": ["#000000", "#ffffff"]}
+        old_key = render_key("geometry", params, old_version)
+        new_key = render_key("geometry", params, code_version(after))
+        assert old_key != new_key
+        assert old_key == render_key("geometry", dict(reversed(list(params.items()))), old_version)
+
+        cache = RenderCache.from_env()
+        cache.get_or_render(old_key, Renderer(1))
+        restarted = RenderCache.from_env()
+        renderer = Renderer(2)
+        assert restarted.get_or_render(new_key, renderer)[0, 0, 0] == 2
+        assert renderer.calls == 1 and restarted.stats()["disk_hits"] == 0
+    print("✅ New code version misses the cache")
+
+    return True
+
+if __name__ == "__main__":
+    print("🏛️ CATHEDRAL RENDER CACHE TEST")
+    print("=" * 40)
+
+    try:
+        memory_success = test_memory_eviction_by_byte_budget()
+        disk_success = test_disk_lru_pruning()
+        version_success = test_code_version_invalidates_keys()
+
+        if memory_success and disk_success and version_success:
+            print("\n🎉 ALL RENDER CACHE TESTS PASSED!")
+        else:
+            print("\n❌ Some render cache tests failed")
+
+    except Exception as e:
+        print(f"\n💥 Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
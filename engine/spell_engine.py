@@ -4,8 +4,12 @@
 import json
 import sys
 import os
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from pathlib import Path
 
 # Add cathedral packages to path
@@ -16,7 +20,8 @@ sys.path.append(str(Path(__file__).parent.parent / 'packages' / 'graphs'))
 try:
     from museum_sources_engine import MuseumSourcesEngine
     from cathedral_style_engine import CathedralStyleEngine, StyleTier
-    from cathedral_graph_navigator import CathedralGraphNavigator
+    from cathedral_graph_navigator import CathedralGraphNavigator, SessionRegistry
+    from cathedral_graph_queries import get_graph_queries
     CATHEDRAL_IMPORTS_AVAILABLE = True
 except ImportError as e:
     print(f"Cathedral imports failed: {e}")
@@ -38,194 +43,543 @@ class SpellResult:
     graph_navigation: Optional[Dict[str, Any]] = None
     artifacts_generated: List[str] = field(default_factory=list)
 
+@dataclass(frozen=True)
+class CompiledSpell:
+    """Spell configuration flattened once at load for the casting hot path"""
+    spell_id: str
+    name: str
+    element: str
+    archetype: str
+    intensity: float
+    color_palette: Tuple[str, ...]
+    musical_mode: str
+    oracle_sentence: str
+    tags: Tuple[str, ...]
+    three_js_config: Dict[str, Any]
+    raw: Dict[str, Any]
+    
+    @classmethod
+    def from_json(cls, spell_data: Dict[str, Any]) -> "CompiledSpell":
+        parameters = spell_data["parameters"]
+        return cls(
+            spell_id=spell_data["id"],
+            name=spell_data["name"],
+            element=spell_data["element"],
+            archetype=spell_data["archetype"],
+            intensity=parameters["intensity"],
+            color_palette=tuple(parameters["color_palette"]),
+            musical_mode=parameters["musical_mode"],
+            oracle_sentence=spell_data["oracle_sentence"],
+            tags=tuple(spell_data.get("tags", [])),
+            three_js_config=spell_data.get("three_js_config", {}),
+            raw=spell_data
+        )
+    
+    def summary(self) -> Dict[str, Any]:
+        """Listing entry as returned by get_available_spells"""
+        return {
+            "id": self.spell_id,
+            "name": self.name,
+            "element": self.element,
+            "archetype": self.archetype,
+            "intensity": self.intensity,
+            "tags": list(self.tags)
+        }
+
+class SpellRegistry:
+    """Preloaded spell catalog invalidated by file mtime.
+    
+    The spell directory is re-stat'ed at most once per check_interval
+    seconds; between checks lookups are pure dictionary reads. The
+    registry is shared across requests, so the hit and miss counters are
+    updated under their own lock.
+    """
+    
+    def __init__(self, data_path: Path, check_interval: float = 1.0):
+        self.data_path = Path(data_path)
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        # file stem -> (mtime_ns, compiled spell or None if unparseable)
+        self._entries: Dict[str, Tuple[int, Optional[CompiledSpell]]] = {}
+        self._last_check = float("-inf")
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+    
+    def get(self, spell_id: str) -> Optional[CompiledSpell]:
+        """Compiled spell for spell_id, or None if it does not exist"""
+        self._maybe_refresh()
+        entry = self._entries.get(spell_id)
+        spell = entry[1] if entry is not None else None
+        with self._stats_lock:
+            if spell is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return spell
+    
+    def all(self) -> List[CompiledSpell]:
+        """Every valid spell in the catalog"""
+        self._maybe_refresh()
+        return [spell for _, spell in self._entries.values() if spell is not None]
+    
+    def invalidate(self) -> None:
+        """Force a directory check on the next lookup"""
+        self._last_check = float("-inf")
+    
+    def stats(self) -> Dict[str, int]:
+        spells = len(self.all())
+        with self._stats_lock:
+            return {
+                "spells": spells,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads
+            }
+    
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._last_check < self.check_interval:
+            return
+        with self._lock:
+            if time.monotonic() - self._last_check >= self.check_interval:
+                self._refresh()
+                self._last_check = time.monotonic()
+    
+    def _refresh(self) -> None:
+        """Reload spell files whose mtime changed and drop deleted ones"""
+        if not self.data_path.exists():
+            self._entries = {}
+            return
+        
+        entries = {}
+        with os.scandir(self.data_path) as scan:
+            for item in scan:
+                if not item.name.endswith(".json") or not item.is_file():
+                    continue
+                spell_id = item.name[:-len(".json")]
+                mtime_ns = item.stat().st_mtime_ns
+                previous = self._entries.get(spell_id)
+                if previous is not None and previous[0] == mtime_ns:
+                    entries[spell_id] = previous
+                    continue
+                
+                self.reloads += 1
+                try:
+                    with open(item.path, 'r') as f:
+                        entries[spell_id] = (mtime_ns, CompiledSpell.from_json(json.load(f)))
+                except (OSError, ValueError, KeyError, TypeError):
+                    entries[spell_id] = (mtime_ns, None)
+        
+        # Swap in the new table so readers never see a half-built catalog
+        self._entries = entries
+
+@dataclass(frozen=True)
+class NPCState:
+    """One NPC as stored in an immutable world snapshot"""
+    name: str
+    emotion: str
+    location: str
+
+@dataclass(frozen=True)
+class WorldSnapshot:
+    """Immutable world state; changes produce a new snapshot.
+    
+    Unchanged NPC entries are shared between successive snapshots, so a
+    cast never deep-copies the world.
+    """
+    weather: str
+    terrain: str
+    npcs: Tuple[NPCState, ...]
+    
+    def with_world_change(self, emotion: str) -> "WorldSnapshot":
+        """Snapshot after a world-changing spell sets every NPC's emotion"""
+        if self.weather == "storm" and self.terrain == "cracked" and all(npc.emotion == emotion for npc in self.npcs):
+            return self
+        return WorldSnapshot(
+            weather="storm",
+            terrain="cracked",
+            npcs=tuple(npc if npc.emotion == emotion else replace(npc, emotion=emotion) for npc in self.npcs)
+        )
+    
+    @cached_property
+    def npc_list(self) -> List[Dict[str, Any]]:
+        """NPCs as plain dicts, built once per snapshot; treat as read-only"""
+        return [{"name": npc.name, "emotion": npc.emotion, "location": npc.location} for npc in self.npcs]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {"weather": self.weather, "terrain": self.terrain, "npcs": self.npc_list}
+
+INITIAL_WORLD = WorldSnapshot(
+    weather="clear",
+    terrain="stable",
+    npcs=(
+        NPCState("Dee", "curious", "scrying_chamber"),
+        NPCState("Fortune", "protective", "temple_sanctuary"),
+        NPCState("Tesla", "inventive", "laboratory"),
+        NPCState("Hilma", "visionary", "art_studio")
+    )
+)
+
+# Respawned world: calm weather and every NPC at peace
+RESET_WORLD = WorldSnapshot(
+    weather="clear",
+    terrain="stable",
+    npcs=tuple(replace(npc, emotion="peaceful") for npc in INITIAL_WORLD.npcs)
+)
+
+DEFAULT_PLAYER = "default"
+JOURNAL_CAPACITY = 500
+ARTIFACT_CAPACITY = 1000
+
+class BoundedLog:
+    """Append-only ring buffer keeping the newest `capacity` entries.
+    
+    Entries are interned strings (journal lines and artifact names repeat
+    heavily) and are addressed by a monotonically increasing sequence
+    number, which stays valid as a pagination cursor after old entries
+    fall off the ring.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.total = 0
+        self._entries: deque = deque(maxlen=capacity)
+    
+    def append(self, entry: str) -> None:
+        self._entries.append(sys.intern(entry))
+        self.total += 1
+    
+    def extend(self, entries: List[str]) -> None:
+        for entry in entries:
+            self.append(entry)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __iter__(self):
+        return iter(self._entries)
+    
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest retained entry"""
+        return self.total - len(self._entries)
+    
+    def recent(self, limit: int) -> List[str]:
+        """Newest entries, oldest first"""
+        count = min(limit, len(self._entries))
+        return [self._entries[i] for i in range(len(self._entries) - count, len(self._entries))]
+    
+    def page(self, before: Optional[int] = None, limit: int = 50) -> Dict[str, Any]:
+        """Entries with seq < before, newest first; pass next_cursor to continue"""
+        end = self.total if before is None else max(self.first_seq, min(before, self.total))
+        start = max(self.first_seq, end - max(limit, 0))
+        offset = self.first_seq
+        entries = [{"seq": seq, "entry": self._entries[seq - offset]} for seq in range(end - 1, start - 1, -1)]
+        return {
+            "entries": entries,
+            "total": self.total,
+            "retained": len(self._entries),
+            "next_cursor": start if start > self.first_seq else None
+        }
+
+class WorldStateStore:
+    """World snapshots keyed by player id or shard id.
+    
+    Readers take the current snapshot reference and writers publish a new
+    one with a single dict assignment, so no lock is held while casting.
+    """
+    
+    def __init__(self, initial: WorldSnapshot = INITIAL_WORLD):
+        self.initial = initial
+        self._worlds: Dict[str, WorldSnapshot] = {}
+    
+    def get(self, key: str) -> WorldSnapshot:
+        return self._worlds.get(key, self.initial)
+    
+    def publish(self, key: str, world: WorldSnapshot) -> None:
+        self._worlds[key] = world
+    
+    def reset(self, key: str, world: WorldSnapshot = RESET_WORLD) -> None:
+        """Swap the key's world for a shared reset snapshot"""
+        self._worlds[key] = world
+    
+    def keys(self) -> List[str]:
+        return list(self._worlds)
+
 class CathedralSpellEngine:
     """Complete spell engine with cathedral integration"""
     
     def __init__(self, data_path: str = "data/spells", graph_path: str = "packages/graphs"):
         self.data_path = Path(data_path)
         self.graph_path = Path(graph_path)
+        self.spell_registry = SpellRegistry(self.data_path)
         
         # Initialize cathedral systems if available
         if CATHEDRAL_IMPORTS_AVAILABLE:
             self.museum_engine = MuseumSourcesEngine()
             self.style_engine = CathedralStyleEngine()
             self.graph_navigator = CathedralGraphNavigator(str(self.graph_path))
-            self.graph_navigator.start_session("spell_session")
+            # One graph session per player, all sharing the navigator's snapshot
+            self.graph_sessions = SessionRegistry(self.graph_navigator.snapshot)
         else:
             self.museum_engine = None
             self.style_engine = None
             self.graph_navigator = None
+            self.graph_sessions = None
         
-        # Default game state
-        self.player_state = {
-            "journal": [],
-            "artifacts": [],
-            "current_location": "cathedral_entrance",
-            "energy_level": 100
-        }
+        # Game state, keyed by player or shard id
+        self.worlds = WorldStateStore()
+        self.players: Dict[str, Dict[str, Any]] = {}
+    
+    @property
+    def world_state(self) -> Dict[str, Any]:
+        """World state of the default player"""
+        return self.worlds.get(DEFAULT_PLAYER).to_dict()
+    
+    @property
+    def player_state(self) -> Dict[str, Any]:
+        """Player state of the default player"""
+        return self.get_player_state(DEFAULT_PLAYER)
+    
+    def get_player_state(self, player_id: str) -> Dict[str, Any]:
+        """Player state for player_id, created on first use"""
+        player = self.players.get(player_id)
+        if player is None:
+            player = self.players.setdefault(player_id, {
+                "journal": BoundedLog(JOURNAL_CAPACITY),
+                "artifacts": BoundedLog(ARTIFACT_CAPACITY),
+                "current_location": "cathedral_entrance",
+                "energy_level": 100
+            })
+        return player
+    
+    def find_player_state(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """Player state for player_id without creating it; None if unknown.
         
-        self.world_state = {
-            "weather": "clear",
-            "terrain": "stable",
-            "npcs": [
-                {"name": "Dee", "emotion": "curious", "location": "scrying_chamber"},
-                {"name": "Fortune", "emotion": "protective", "location": "temple_sanctuary"},
-                {"name": "Tesla", "emotion": "inventive", "location": "laboratory"},
-                {"name": "Hilma", "emotion": "visionary", "location": "art_studio"}
-            ]
-        }
+        The default player always exists, as in single-player mode.
+        """
+        if player_id == DEFAULT_PLAYER:
+            return self.get_player_state(player_id)
+        return self.players.get(player_id)
     
     def load_spell(self, spell_id: str) -> Dict[str, Any]:
-        """Load spell configuration from JSON"""
-        spell_file = self.data_path / f"{spell_id}.json"
+        """Load spell configuration from the preloaded registry"""
+        spell = self.spell_registry.get(spell_id)
         
-        if not spell_file.exists():
+        if spell is None:
             return {"error": f"Spell '{spell_id}' not found"}
         
-        with open(spell_file, 'r') as f:
-            return json.load(f)
+        return spell.raw
     
-    def cast_spell(self, spell_id: str, caster_location: Optional[str] = None) -> SpellResult:
+    def cast_spell(self, spell_id: str, caster_location: Optional[str] = None,
+                   player_id: str = DEFAULT_PLAYER) -> SpellResult:
         """Cast a spell with full cathedral integration"""
         
         # Load spell configuration
-        spell = self.load_spell(spell_id)
-        if "error" in spell:
-            return SpellResult(
-                spell_id=spell_id,
-                effect="failed",
-                palette=["#000000"],
-                musical_mode="silence",
-                oracle_sentence="The spell failed to manifest.",
-                npcs=[],
-                intensity=0.0
-            )
+        spell = self.spell_registry.get(spell_id)
+        if spell is None:
+            return self._failed_result(spell_id)
         
         # Basic spell effects
-        intensity = spell["parameters"]["intensity"]
-        element = spell["element"]
+        intensity = spell.intensity
+        element = spell.element
         
-        # Apply world modifications
-        if element == "fire" and intensity > 0.7:
-            self.world_state["weather"] = "storm"
-            self.world_state["terrain"] = "cracked"
-            
-            # NPC reactions based on element and intensity
-            for npc in self.world_state["npcs"]:
-                if intensity > 0.8:
-                    npc["emotion"] = "awe"
-                elif intensity > 0.6:
-                    npc["emotion"] = "alert"
-                else:
-                    npc["emotion"] = "curious"
+        # Apply world modifications and NPC reactions
+        world = self.worlds.get(player_id)
+        npc_emotion = self._world_change_emotion(spell)
+        if npc_emotion:
+            world = world.with_world_change(npc_emotion)
+            self.worlds.publish(player_id, world)
         
         # Add to player journal
-        self.player_state["journal"].append(spell["oracle_sentence"])
-        
-        # Museum integration (if available)
-        museum_sources = []
-        if self.museum_engine:
-            sources = self.museum_engine.get_sources_for_spell(element, spell["archetype"])
-            museum_sources = [source.source_id for source in sources[:3]]
+        player = self.get_player_state(player_id)
+        player["journal"].append(spell.oracle_sentence)
         
-        # Style elevation (if available)
-        cathedral_style = "elevated"
-        if self.style_engine:
-            style_tier = StyleTier.MUSEUM_GRADE if museum_sources else StyleTier.ELEVATED
-            cathedral_style = style_tier.value
+        # Museum integration and style elevation (if available)
+        museum_sources = self._museum_sources(element, spell.archetype)
+        cathedral_style = self._cathedral_style(museum_sources)
         
         # Graph navigation integration (if available)
-        graph_navigation = None
-        if self.graph_navigator and caster_location:
-            # Try to enter the location node in the graph
-            try:
-                nav_result = self.graph_navigator.enter_node(caster_location)
-                if "error" not in nav_result:
-                    graph_navigation = {
-                        "current_node": nav_result["node_entered"],
-                        "intensity": nav_result["intensity"],
-                        "oracle": nav_result["oracle_message"],
-                        "navigation_options": nav_result["navigation_options"]
-                    }
-            except:
-                pass  # Graph navigation optional
+        graph_navigation = self._graph_navigation(caster_location, player_id)
         
         # Generate artifacts
-        artifacts = []
-        if intensity > 0.7:
-            artifacts.append(f"{spell['name']} Sigil")
-            if intensity > 0.8:
-                artifacts.append(f"{spell['archetype']} Plate")
-        
-        self.player_state["artifacts"].extend(artifacts)
+        artifacts = self._artifacts_for(spell)
+        player["artifacts"].extend(artifacts)
         
         # Create enhanced spell result
         return SpellResult(
             spell_id=spell_id,
             effect=spell_id,
-            palette=spell["parameters"]["color_palette"],
-            musical_mode=spell["parameters"]["musical_mode"],
-            oracle_sentence=spell["oracle_sentence"],
-            npcs=self.world_state["npcs"],
+            palette=list(spell.color_palette),
+            musical_mode=spell.musical_mode,
+            oracle_sentence=spell.oracle_sentence,
+            npcs=world.npc_list,
             intensity=intensity,
             museum_sources=museum_sources,
             cathedral_style=cathedral_style,
-            three_js_config=spell.get("three_js_config", {}),
+            three_js_config=spell.three_js_config,
             graph_navigation=graph_navigation,
             artifacts_generated=artifacts
         )
     
-    def get_available_spells(self) -> List[Dict[str, Any]]:
-        """Get list of available spells"""
-        spells = []
+    def cast_batch(self, casts: List[Tuple[str, Optional[str]]],
+                   player_id: str = DEFAULT_PLAYER) -> List[SpellResult]:
+        """Cast many (spell_id, caster_location) pairs in one pass.
         
-        if not self.data_path.exists():
-            return spells
+        Results match casting each pair in order with cast_spell: each result
+        carries the NPC state as it stood after that cast, and the world,
+        journal and artifacts end in the same state. Spells are resolved,
+        thresholds evaluated and museum lookups done once per batch.
+        """
+        # Resolve every spell and evaluate thresholds up front
+        spells = [self.spell_registry.get(spell_id) for spell_id, _ in casts]
+        emotions = [self._world_change_emotion(spell) if spell else None for spell in spells]
         
-        for spell_file in self.data_path.glob("*.json"):
-            try:
-                with open(spell_file, 'r') as f:
-                    spell_data = json.load(f)
-                    spells.append({
-                        "id": spell_data["id"],
-                        "name": spell_data["name"],
-                        "element": spell_data["element"],
-                        "archetype": spell_data["archetype"],
-                        "intensity": spell_data["parameters"]["intensity"],
-                        "tags": spell_data["tags"]
-                    })
-            except:
+        # Thread the world snapshot through the batch; each result keeps the
+        # snapshot as of its own cast
+        world = self.worlds.get(player_id)
+        
+        museum_cache: Dict[Tuple[str, str], List[str]] = {}
+        journal_entries = []
+        batch_artifacts = []
+        results = []
+        
+        for (spell_id, caster_location), spell, emotion in zip(casts, spells, emotions):
+            if spell is None:
+                results.append(self._failed_result(spell_id))
                 continue
+            
+            if emotion:
+                world = world.with_world_change(emotion)
+            
+            museum_key = (spell.element, spell.archetype)
+            if museum_key not in museum_cache:
+                museum_cache[museum_key] = self._museum_sources(*museum_key)
+            museum_sources = museum_cache[museum_key]
+            
+            # Navigation mutates the session, so it stays in cast order
+            graph_navigation = self._graph_navigation(caster_location, player_id)
+            
+            artifacts = self._artifacts_for(spell)
+            journal_entries.append(spell.oracle_sentence)
+            batch_artifacts.extend(artifacts)
+            
+            results.append(SpellResult(
+                spell_id=spell_id,
+                effect=spell_id,
+                palette=list(spell.color_palette),
+                musical_mode=spell.musical_mode,
+                oracle_sentence=spell.oracle_sentence,
+                npcs=world.npc_list,
+                intensity=spell.intensity,
+                museum_sources=museum_sources,
+                cathedral_style=self._cathedral_style(museum_sources),
+                three_js_config=spell.three_js_config,
+                graph_navigation=graph_navigation,
+                artifacts_generated=artifacts
+            ))
+        
+        # Publish the final world and player mutations once
+        self.worlds.publish(player_id, world)
+        player = self.get_player_state(player_id)
+        player["journal"].extend(journal_entries)
+        player["artifacts"].extend(batch_artifacts)
         
-        return spells
+        return results
+    
+    def _failed_result(self, spell_id: str) -> SpellResult:
+        return SpellResult(
+            spell_id=spell_id,
+            effect="failed",
+            palette=["#000000"],
+            musical_mode="silence",
+            oracle_sentence="The spell failed to manifest.",
+            npcs=[],
+            intensity=0.0
+        )
     
-    def get_world_state(self) -> Dict[str, Any]:
-        """Get current world state"""
+    def _world_change_emotion(self, spell: CompiledSpell) -> Optional[str]:
+        """NPC emotion set by a world-changing spell, or None if the world is untouched"""
+        if spell.element == "fire" and spell.intensity > 0.7:
+            return "awe" if spell.intensity > 0.8 else "alert"
+        return None
+    
+    def _museum_sources(self, element: str, archetype: str) -> List[str]:
+        if not self.museum_engine:
+            return []
+        sources = self.museum_engine.get_sources_for_spell(element, archetype)
+        return [source.source_id for source in sources[:3]]
+    
+    def _cathedral_style(self, museum_sources: List[str]) -> str:
+        if not self.style_engine:
+            return "elevated"
+        style_tier = StyleTier.MUSEUM_GRADE if museum_sources else StyleTier.ELEVATED
+        return style_tier.value
+    
+    def _graph_navigation(self, caster_location: Optional[str], player_id: str) -> Optional[Dict[str, Any]]:
+        if self.graph_sessions is None or not caster_location:
+            return None
+        # Try to enter the location node in the player's graph session
+        try:
+            nav_result = self.graph_sessions.open_session(player_id).enter_node(caster_location)
+            if "error" not in nav_result:
+                return {
+                    "current_node": nav_result["node_entered"],
+                    "intensity": nav_result["intensity"],
+                    "oracle": nav_result["oracle_message"],
+                    "navigation_options": nav_result["navigation_options"]
+                }
+        except:
+            pass  # Graph navigation optional
+        return None
+    
+    def _artifacts_for(self, spell: CompiledSpell) -> List[str]:
+        artifacts = []
+        if spell.intensity > 0.7:
+            artifacts.append(f"{spell.name} Sigil")
+            if spell.intensity > 0.8:
+                artifacts.append(f"{spell.archetype} Plate")
+        return artifacts
+    
+    def get_available_spells(self) -> List[Dict[str, Any]]:
+        """Get list of available spells"""
+        return [spell.summary() for spell in self.spell_registry.all()]
+    
+    def get_world_state(self, player_id: str = DEFAULT_PLAYER) -> Optional[Dict[str, Any]]:
+        """Get current world state, or None for an unknown player"""
+        player = self.find_player_state(player_id)
+        if player is None:
+            return None
         return {
-            "world": self.world_state,
-            "player": self.player_state,
+            "world": self.worlds.get(player_id).to_dict(),
+            "player": self._player_summary(player),
             "cathedral_status": "operational" if CATHEDRAL_IMPORTS_AVAILABLE else "basic",
-            "session_active": self.graph_navigator is not None
+            "session_active": self.graph_sessions is not None and player_id in self.graph_sessions
         }
     
-    def reset_world(self) -> Dict[str, Any]:
+    def _player_summary(self, player: Dict[str, Any], recent: int = 20) -> Dict[str, Any]:
+        """Player state with only the newest journal and artifact entries"""
+        summary = dict(player)
+        for key in ("journal", "artifacts"):
+            summary[key] = player[key].recent(recent)
+            summary[f"{key}_total"] = player[key].total
+        return summary
+    
+    def reset_world(self, player_id: str = DEFAULT_PLAYER) -> Dict[str, Any]:
         """Reset world state (respawn mechanism)"""
         
-        # Reset basic state
-        self.world_state["weather"] = "clear"
-        self.world_state["terrain"] = "stable"
-        
-        for npc in self.world_state["npcs"]:
-            npc["emotion"] = "peaceful"
+        # Reset basic state by swapping in the shared reset snapshot
+        self.worlds.reset(player_id)
         
         # Reset player energy
-        self.player_state["energy_level"] = 100
+        self.get_player_state(player_id)["energy_level"] = 100
         
         # Trigger graph respawn if available
         respawn_result = None
-        if self.graph_navigator:
+        if self.graph_sessions is not None:
             try:
-                respawn_result = self.graph_navigator.trigger_respawn()
+                respawn_result = self.graph_sessions.open_session(player_id).trigger_respawn()
             except:
                 pass
         
@@ -256,10 +610,35 @@ app.add_middleware(
 # Initialize spell engine
 spell_engine = CathedralSpellEngine()
 
-class SpellCastRequest(BaseModel):
+class SpellCast(BaseModel):
     spell_id: str
     caster_location: Optional[str] = None
 
+class SpellCastRequest(SpellCast):
+    player_id: str = DEFAULT_PLAYER
+
+class SpellBatchRequest(BaseModel):
+    casts: List[SpellCast]
+    player_id: str = DEFAULT_PLAYER
+
+MAX_BATCH_CASTS = 1000
+
+def _spell_result_payload(result: SpellResult) -> Dict[str, Any]:
+    return {
+        "spell_id": result.spell_id,
+        "effect": result.effect,
+        "palette": result.palette,
+        "musical_mode": result.musical_mode,
+        "oracle_sentence": result.oracle_sentence,
+        "npcs": result.npcs,
+        "intensity": result.intensity,
+        "museum_sources": result.museum_sources,
+        "cathedral_style": result.cathedral_style,
+        "three_js_config": result.three_js_config,
+        "graph_navigation": result.graph_navigation,
+        "artifacts_generated": result.artifacts_generated
+    }
+
 @app.get("/api/spells/available")
 def get_available_spells():
     """Get list of available spells"""
@@ -268,30 +647,34 @@ def get_available_spells():
 @app.post("/api/spells/cast")
 def cast_spell_api(request: SpellCastRequest):
     """Cast a spell"""
-    result = spell_engine.cast_spell(request.spell_id, request.caster_location)
+    result = spell_engine.cast_spell(request.spell_id, request.caster_location, request.player_id)
     
     return {
         "success": True,
-        "spell_result": {
-            "spell_id": result.spell_id,
-            "effect": result.effect,
-            "palette": result.palette,
-            "musical_mode": result.musical_mode,
-            "oracle_sentence": result.oracle_sentence,
-            "npcs": result.npcs,
-            "intensity": result.intensity,
-            "museum_sources": result.museum_sources,
-            "cathedral_style": result.cathedral_style,
-            "three_js_config": result.three_js_config,
-            "graph_navigation": result.graph_navigation,
-            "artifacts_generated": result.artifacts_generated
-        }
+        "spell_result": _spell_result_payload(result)
+    }
+
+@app.post("/api/spells/cast_batch")
+def cast_spell_batch_api(request: SpellBatchRequest):
+    """Cast many spells in one pass; results are returned in request order"""
+    if len(request.casts) > MAX_BATCH_CASTS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_CASTS} casts")
+    
+    results = spell_engine.cast_batch(
+        [(cast.spell_id, cast.caster_location) for cast in request.casts],
+        request.player_id
+    )
+    
+    return {
+        "success": True,
+        "count": len(results),
+        "spell_results": [_spell_result_payload(result) for result in results]
     }
 
 @app.get("/api/spells/cast")
-def cast_spell_simple(spell_id: str, caster_location: Optional[str] = None):
+def cast_spell_simple(spell_id: str, caster_location: Optional[str] = None, player_id: str = DEFAULT_PLAYER):
     """Simple GET endpoint for spell casting (legacy compatibility)"""
-    result = spell_engine.cast_spell(spell_id, caster_location)
+    result = spell_engine.cast_spell(spell_id, caster_location, player_id)
     
     return {
         "effect": result.effect,
@@ -305,14 +688,58 @@ def cast_spell_simple(spell_id: str, caster_location: Optional[str] = None):
     }
 
 @app.get("/api/world/state")
-def get_world_state():
+def get_world_state(player_id: str = DEFAULT_PLAYER):
     """Get current world state"""
-    return spell_engine.get_world_state()
+    state = spell_engine.get_world_state(player_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"Unknown player: {player_id}")
+    return state
 
 @app.post("/api/world/reset")
-def reset_world():
+def reset_world(player_id: str = DEFAULT_PLAYER):
     """Reset world state (respawn)"""
-    return spell_engine.reset_world()
+    return spell_engine.reset_world(player_id)
+
+@app.get("/api/player/journal")
+def get_player_journal(player_id: str = DEFAULT_PLAYER, before: Optional[int] = None, limit: int = 50):
+    """Page through a player's journal, newest first"""
+    return _known_player(player_id)["journal"].page(before, min(limit, 500))
+
+@app.get("/api/player/artifacts")
+def get_player_artifacts(player_id: str = DEFAULT_PLAYER, before: Optional[int] = None, limit: int = 50):
+    """Page through a player's artifacts, newest first"""
+    return _known_player(player_id)["artifacts"].page(before, min(limit, 500))
+
+def _known_player(player_id: str) -> Dict[str, Any]:
+    """Player state for read endpoints; reads never create players"""
+    player = spell_engine.find_player_state(player_id)
+    if player is None:
+        raise HTTPException(status_code=404, detail=f"Unknown player: {player_id}")
+    return player
+
+def _graph_queries():
+    """Query engine over the spell engine's graph snapshot"""
+    if not spell_engine.graph_navigator:
+        raise HTTPException(status_code=503, detail="Cathedral graph not available")
+    return get_graph_queries(spell_engine.graph_navigator.snapshot)
+
+@app.get("/api/graph/path")
+def get_graph_path(source: str, target: str):
+    """Shortest intensity-weighted path between two nodes"""
+    result = _graph_queries().shortest_path(source, target)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"No path from {source} to {target}")
+    return result
+
+@app.get("/api/graph/nearest")
+def get_graph_nearest(source: str, k: int = 5):
+    """The k nearest rooms to a node"""
+    return {"source": source, "nearest": _graph_queries().k_nearest(source, k)}
+
+@app.get("/api/graph/reachable")
+def get_graph_reachable(source: str, max_hops: int = 2):
+    """Nodes reachable within max_hops edges, with hop counts"""
+    return {"source": source, "reachable": _graph_queries().reachable_within(source, max_hops)}
 
 @app.get("/api/health")
 def health_check():
@@ -320,7 +747,8 @@ def health_check():
     return {
         "status": "operational",
         "cathedral_integration": CATHEDRAL_IMPORTS_AVAILABLE,
-        "available_spells": len(spell_engine.get_available_spells())
+        "available_spells": len(spell_engine.get_available_spells()),
+        "spell_registry": spell_engine.spell_registry.stats()
     }
 
 if __name__ == "__main__":
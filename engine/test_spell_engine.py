@@ -0,0 +1,191 @@
+# Test the Cathedral Spell Engine
+# Spell registry, batched casting, per-player worlds and bounded logs
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.join('.', 'engine'))
+
+from dataclasses import asdict
+
+import spell_engine as spell_engine_module
+from fastapi.testclient import TestClient
+from spell_engine import INITIAL_WORLD, MAX_BATCH_CASTS, RESET_WORLD, BoundedLog, CathedralSpellEngine, SpellRegistry, app
+
+def write_spell(spell_dir: Path, spell_id: str, element: str = "fire", intensity: float = 0.9,
+                mtime_ns: int = None) -> Path:
+    """Write a minimal spell file, optionally with a fixed mtime"""
+    path = spell_dir / f"{spell_id}.json"
+    path.write_text(json.dumps({
+        "id": spell_id,
+        "name": spell_id.replace("_", " ").title(),
+        "element": element,
+        "archetype": "Magician",
+        "parameters": {"intensity": intensity, "color_palette": ["#ff4500", "#ffd700"], "musical_mode": "lydian"},
+        "oracle_sentence": f"The {spell_id} answers.",
+        "tags": [element]
+    }))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+def make_engine() -> CathedralSpellEngine:
+    """Engine over a throwaway spell directory: two world-changing fire spells and a calm one"""
+    spell_dir = Path(tempfile.mkdtemp())
+    write_spell(spell_dir, "inferno", intensity=0.9)
+    write_spell(spell_dir, "ember", intensity=0.75)
+    write_spell(spell_dir, "still_water", element="water", intensity=0.4)
+    return CathedralSpellEngine(str(spell_dir), "packages/graphs")
+
+def api_client(engine: CathedralSpellEngine) -> TestClient:
+    """Test client whose endpoints use engine"""
+    spell_engine_module.spell_engine = engine
+    return TestClient(app)
+
+def test_spell_registry_reload():
+    """An mtime change reloads one spell; lookups count hits and misses"""
+    print("\n📜 Testing spell registry...")
+
+    spell_dir = Path(tempfile.mkdtemp())
+    write_spell(spell_dir, "fire_sigil", intensity=0.5, mtime_ns=1_000_000_000)
+    write_spell(spell_dir, "water_veil", element="water", intensity=0.3, mtime_ns=1_000_000_000)
+    registry = SpellRegistry(spell_dir, check_interval=0.0)
+
+    assert registry.get("fire_sigil").intensity == 0.5
+    assert registry.get("missing") is None
+    assert registry.stats() == {"spells": 2, "hits": 1, "misses": 1, "reloads": 2}
+
+    # Same mtime: cached entry kept even though the content changed
+    write_spell(spell_dir, "fire_sigil", intensity=0.8, mtime_ns=1_000_000_000)
+    assert registry.get("fire_sigil").intensity == 0.5
+
+    # New mtime: only that file is reloaded
+    write_spell(spell_dir, "fire_sigil", intensity=0.8, mtime_ns=2_000_000_000)
+    assert registry.get("fire_sigil").intensity == 0.8
+    stats = registry.stats()
+    assert stats["reloads"] == 3
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+    # Deleted files drop out of the catalog
+    (spell_dir / "water_veil.json").unlink()
+    assert registry.get("water_veil") is None
+    assert [spell.spell_id for spell in registry.all()] == ["fire_sigil"]
+    print(f"✅ Registry stats: {registry.stats()}")
+
+    return True
+
+def test_cast_batch_matches_sequential():
+    """A batch leaves results, world, journal and artifacts as sequential casts do"""
+    print("\n⚡ Testing batched casting...")
+
+    casts = [("ember", "tesla"), ("still_water", None), ("missing", None), ("inferno", "hypatia"), ("ember", None)]
+    sequential, batched = make_engine(), make_engine()
+    expected = [asdict(sequential.cast_spell(spell_id, location, "alice")) for spell_id, location in casts]
+    results = [asdict(result) for result in batched.cast_batch(casts, "alice")]
+
+    assert results == expected
+    assert [result["npcs"][0]["emotion"] for result in results if result["npcs"]] == ["alert", "alert", "awe", "alert"]
+    assert batched.get_world_state("alice") == sequential.get_world_state("alice")
+    for key in ("journal", "artifacts"):
+        assert list(batched.players["alice"][key]) == list(sequential.players["alice"][key])
+    print(f"✅ {len(casts)} batched casts match sequential casting")
+
+    return True
+
+def test_batch_endpoint_limits():
+    """The batch endpoint casts in order and rejects oversized batches with 413"""
+    print("\n📦 Testing batch endpoint...")
+
+    client = api_client(make_engine())
+    response = client.post("/api/spells/cast_batch", json={
+        "player_id": "alice", "casts": [{"spell_id": "inferno"}, {"spell_id": "still_water"}]
+    })
+    assert response.status_code == 200
+    assert [result["spell_id"] for result in response.json()["spell_results"]] == ["inferno", "still_water"]
+
+    oversized = {"casts": [{"spell_id": "ember"}] * (MAX_BATCH_CASTS + 1)}
+    assert client.post("/api/spells/cast_batch", json=oversized).status_code == 413
+
+    # Reads never create players
+    for endpoint in ("/api/player/journal", "/api/player/artifacts", "/api/world/state"):
+        assert client.get(endpoint, params={"player_id": "nobody"}).status_code == 404
+        assert client.get(endpoint, params={"player_id": "alice"}).status_code == 200
+    assert "nobody" not in spell_engine_module.spell_engine.players
+    print("✅ Oversized batches get 413 and unknown players 404")
+
+    return True
+
+def test_players_keep_separate_worlds():
+    """Casting and resetting touch only the acting player's world"""
+    print("\n🌍 Testing per-player worlds...")
+
+    engine = make_engine()
+    engine.cast_spell("inferno", player_id="alice")
+    engine.cast_spell("still_water", player_id="bob")
+    alice, bob = engine.get_world_state("alice"), engine.get_world_state("bob")
+    assert alice["world"]["weather"] == "storm"
+    assert bob["world"] == INITIAL_WORLD.to_dict()
+    assert engine.worlds.get("default") is INITIAL_WORLD
+
+    engine.cast_spell("ember", player_id="bob")
+    bob_world = engine.worlds.get("bob")
+    engine.players["bob"]["energy_level"] = 10
+    reset = engine.reset_world("alice")
+    assert reset["world_reset"]
+    assert engine.worlds.get("alice") is RESET_WORLD
+    assert engine.worlds.get("bob") is bob_world
+    assert engine.players["bob"]["energy_level"] == 10
+    assert engine.get_world_state("alice")["player"]["journal"] == ["The inferno answers."]
+    print(f"✅ Worlds kept apart for {sorted(engine.worlds.keys())}")
+
+    return True
+
+def test_bounded_log_pages():
+    """The ring buffer evicts at capacity and sequence cursors page backwards"""
+    print("\n📖 Testing bounded log...")
+
+    log = BoundedLog(5)
+    log.extend([f"entry {i}" for i in range(8)])
+    assert len(log) == 5 and log.total == 8 and log.first_seq == 3
+    assert list(log) == [f"entry {i}" for i in range(3, 8)]
+    assert log.recent(2) == ["entry 6", "entry 7"]
+
+    first = log.page(limit=2)
+    assert [item["seq"] for item in first["entries"]] == [7, 6]
+    assert first["entries"][0]["entry"] == "entry 7"
+    assert first["next_cursor"] == 6
+    second = log.page(first["next_cursor"], limit=2)
+    assert [item["seq"] for item in second["entries"]] == [5, 4]
+    last = log.page(second["next_cursor"], limit=2)
+    assert [item["seq"] for item in last["entries"]] == [3]
+    assert last["next_cursor"] is None
+
+    # Cursors that fell off the ring return nothing rather than wrong entries
+    assert log.page(2)["entries"] == []
+    assert log.page(100, limit=1)["entries"][0]["seq"] == 7
+    assert log.page(limit=0)["entries"] == []
+    print(f"✅ Paged {len(log)} retained entries of {log.total}")
+
+    return True
+
+if __name__ == "__main__":
+    print("🔥 Cathedral Spell Engine - Test Suite")
+    print("=" * 70)
+
+    try:
+        registry_success = test_spell_registry_reload()
+        batch_success = test_cast_batch_matches_sequential()
+        endpoint_success = test_batch_endpoint_limits()
+        world_success = test_players_keep_separate_worlds()
+        log_success = test_bounded_log_pages()
+
+        if registry_success and batch_success and endpoint_success and world_success and log_success:
+            print("\n✨ ALL SPELL ENGINE TESTS PASSED!")
+        else:
+            print("\n⚠️ Some tests need attention")
+    except Exception as e:
+        print(f"\n❌ Test suite error: {e}")
+        import traceback
+        traceback.print_exc()
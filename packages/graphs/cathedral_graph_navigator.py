@@ -1,8 +1,12 @@
 # Cathedral Graph Navigation Engine
 # Core navigation system for the 10-node Cathedral of Circuits graph
 
+import hashlib
 import json
 import math
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -37,15 +41,119 @@ class NavigationSession:
     accumulated_intensity: float = 0.0
     respawn_count: int = 0
 
+@dataclass(frozen=True)
+class GraphEdge:
+    """Outgoing edge as stored in the adjacency list"""
+    source: str
+    target: str
+    edge_type: str
+    intensity: float
+    note: str
+
+@dataclass
+class CompiledGraph:
+    """Indexed view of core_node_map.json, built once at load"""
+    nodes_by_id: Dict[str, Dict[str, Any]]
+    adjacency: Dict[str, List[GraphEdge]]
+    edge_index: Dict[Tuple[str, str], GraphEdge]
+
+    @classmethod
+    def from_core_nodes(cls, core_nodes: Dict[str, Any]) -> "CompiledGraph":
+        """Build node, adjacency and (from, to) lookups in one pass"""
+        nodes_by_id = {node["id"]: node for node in core_nodes["nodes"]}
+        adjacency: Dict[str, List[GraphEdge]] = {node_id: [] for node_id in nodes_by_id}
+        edge_index: Dict[Tuple[str, str], GraphEdge] = {}
+        
+        for edge in core_nodes["edges"]:
+            compiled = GraphEdge(
+                source=edge["from"],
+                target=edge["to"],
+                edge_type=edge["type"],
+                intensity=edge.get("intensity", 0.5),
+                note=edge.get("note", "")
+            )
+            adjacency.setdefault(compiled.source, []).append(compiled)
+            # First matching edge wins, as with the original linear scan
+            edge_index.setdefault((compiled.source, compiled.target), compiled)
+        
+        return cls(nodes_by_id=nodes_by_id, adjacency=adjacency, edge_index=edge_index)
+    
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a node by id"""
+        return self.nodes_by_id.get(node_id)
+    
+    def edges_from(self, node_id: str) -> List[GraphEdge]:
+        """Outgoing edges of a node, in file order"""
+        return self.adjacency.get(node_id, [])
+    
+    def get_edge(self, source: str, target: str) -> Optional[GraphEdge]:
+        """Look up the edge between two nodes"""
+        return self.edge_index.get((source, target))
+
+@dataclass(frozen=True)
+class GraphSnapshot:
+    """Immutable parsed graph shared by every navigator handle.
+    
+    The loaded dicts are treated as read-only; sessions never mutate them.
+    """
+    core_nodes: Dict[str, Any]
+    navigation_rules: Dict[str, Any]
+    render_hints: Dict[str, Any]
+    graph: CompiledGraph
+    version: str
+    source_path: str
+    
+    @classmethod
+    def from_path(cls, graph_data_path: str = "packages/graphs") -> "GraphSnapshot":
+        """Parse the three graph files once and compile the graph"""
+        graph_path = Path(graph_data_path)
+        raw = {}
+        for name in ("core_node_map.json", "navigation_rules.json", "render_hints.json"):
+            with open(graph_path / name, 'rb') as f:
+                raw[name] = f.read()
+        
+        # Content digest identifies this graph version for downstream caches
+        digest = hashlib.sha1()
+        for name in sorted(raw):
+            digest.update(raw[name])
+        
+        core_nodes = json.loads(raw["core_node_map.json"])
+        return cls(
+            core_nodes=core_nodes,
+            navigation_rules=json.loads(raw["navigation_rules.json"]),
+            render_hints=json.loads(raw["render_hints.json"]),
+            graph=CompiledGraph.from_core_nodes(core_nodes),
+            version=digest.hexdigest()[:16],
+            source_path=str(graph_path)
+        )
+
 class CathedralGraphNavigator:
-    """Navigation engine for the Cathedral Core Graph"""
+    """Navigation engine for the Cathedral Core Graph.
     
-    def __init__(self, graph_data_path: str = "packages/graphs"):
-        self.graph_path = Path(graph_data_path)
-        self.core_nodes = self.load_core_nodes()
-        self.navigation_rules = self.load_navigation_rules()
-        self.render_hints = self.load_render_hints()
+    A navigator is a lightweight handle: the parsed graph lives in a shared
+    GraphSnapshot, and the handle only owns its current NavigationSession.
+    """
+    
+    def __init__(self, graph_data_path: str = "packages/graphs", snapshot: Optional[GraphSnapshot] = None):
+        self.snapshot = snapshot or GraphSnapshot.from_path(graph_data_path)
+        self.graph_path = Path(self.snapshot.source_path)
         self.current_session = None
+    
+    @property
+    def core_nodes(self) -> Dict[str, Any]:
+        return self.snapshot.core_nodes
+    
+    @property
+    def navigation_rules(self) -> Dict[str, Any]:
+        return self.snapshot.navigation_rules
+    
+    @property
+    def render_hints(self) -> Dict[str, Any]:
+        return self.snapshot.render_hints
+    
+    @property
+    def graph(self) -> CompiledGraph:
+        return self.snapshot.graph
         
     def load_core_nodes(self) -> Dict[str, Any]:
         """Load the core node map"""
@@ -75,11 +183,10 @@ class CathedralGraphNavigator:
         if not self.current_session:
             return {"error": "No active session. Start a session first."}
         
-        if node_id not in [node["id"] for node in self.core_nodes["nodes"]]:
-            return {"error": f"Node '{node_id}' not found in cathedral graph"}
-        
         # Get node data
-        node_data = next(node for node in self.core_nodes["nodes"] if node["id"] == node_id)
+        node_data = self.graph.get_node(node_id)
+        if node_data is None:
+            return {"error": f"Node '{node_id}' not found in cathedral graph"}
         
         # Apply edge behaviors if transitioning from another node
         edge_effects = []
@@ -126,16 +233,15 @@ class CathedralGraphNavigator:
         """Get available navigation options from current node"""
         options = []
         
-        for edge in self.core_nodes["edges"]:
-            if edge["from"] == current_node_id:
-                target_node = next(node for node in self.core_nodes["nodes"] if node["id"] == edge["to"])
-                options.append({
-                    "target_node": edge["to"],
-                    "target_name": target_node["name"],
-                    "edge_type": edge["type"],
-                    "description": edge["note"],
-                    "intensity": edge.get("intensity", 0.5)
-                })
+        for edge in self.graph.edges_from(current_node_id):
+            target_node = self.graph.nodes_by_id[edge.target]
+            options.append({
+                "target_node": edge.target,
+                "target_name": target_node["name"],
+                "edge_type": edge.edge_type,
+                "description": edge.note,
+                "intensity": edge.intensity
+            })
         
         return options
     
@@ -146,17 +252,13 @@ class CathedralGraphNavigator:
         
         # Find the edge
         current_node = self.current_session.current_node
-        edge = None
-        for e in self.core_nodes["edges"]:
-            if e["from"] == current_node and e["to"] == target_node_id:
-                edge = e
-                break
+        edge = self.graph.get_edge(current_node, target_node_id)
         
         if not edge:
             return {"error": f"No edge found from {current_node} to {target_node_id}"}
         
         # Apply exit behaviors
-        edge_type = edge["type"]
+        edge_type = edge.edge_type
         if edge_type in self.navigation_rules["edgeBehaviors"]:
             exit_effects = self.navigation_rules["edgeBehaviors"][edge_type].get("onExit", [])
             # Process exit effects here
@@ -288,4 +390,93 @@ class CathedralGraphNavigator:
             "render_hints": self.render_hints,
             "navigation_rules": self.navigation_rules,
             "current_session": self.get_session_status() if self.current_session else None
-        }
\ No newline at end of file
+        }
+
+class SessionRegistry:
+    """Per-session navigator handles over one shared GraphSnapshot.
+    
+    Sessions idle for longer than idle_timeout seconds are evicted by
+    evict_idle(), which also runs opportunistically when sessions open.
+    """
+    
+    def __init__(self, snapshot: GraphSnapshot, idle_timeout: float = 1800.0, max_sessions: Optional[int] = None):
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, got {max_sessions}")
+        self.snapshot = snapshot
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # Ordered least recently used first, so eviction stops at the first live session
+        self._handles: "OrderedDict[str, CathedralGraphNavigator]" = OrderedDict()
+        self._last_seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_path(cls, graph_data_path: str = "packages/graphs", **kwargs) -> "SessionRegistry":
+        """Parse the graph once and build a registry around it"""
+        return cls(GraphSnapshot.from_path(graph_data_path), **kwargs)
+    
+    def __len__(self) -> int:
+        return len(self._handles)
+    
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._handles
+    
+    def open_session(self, session_id: str) -> CathedralGraphNavigator:
+        """Return the handle for session_id, starting a new session if needed"""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle_locked(now)
+            handle = self._handles.get(session_id)
+            if handle is None:
+                handle = CathedralGraphNavigator(self.snapshot.source_path, snapshot=self.snapshot)
+                handle.start_session(session_id)
+                self._handles[session_id] = handle
+                if self.max_sessions is not None:
+                    while len(self._handles) > self.max_sessions:
+                        evicted_id, _ = self._handles.popitem(last=False)
+                        del self._last_seen[evicted_id]
+            self._touch_locked(session_id, now)
+            return handle
+    
+    def get(self, session_id: str) -> Optional[CathedralGraphNavigator]:
+        """Return the live handle for session_id, or None if unknown or evicted"""
+        now = time.monotonic()
+        with self._lock:
+            handle = self._handles.get(session_id)
+            if handle is None:
+                return None
+            if now - self._last_seen[session_id] > self.idle_timeout:
+                self._drop_locked(session_id)
+                return None
+            self._touch_locked(session_id, now)
+            return handle
+    
+    def close_session(self, session_id: str) -> bool:
+        """Remove a session; returns False if it was not registered"""
+        with self._lock:
+            if session_id not in self._handles:
+                return False
+            self._drop_locked(session_id)
+            return True
+    
+    def evict_idle(self, now: Optional[float] = None) -> List[str]:
+        """Evict sessions idle past the timeout and return their ids"""
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic() if now is None else now)
+    
+    def _touch_locked(self, session_id: str, now: float) -> None:
+        self._last_seen[session_id] = now
+        self._handles.move_to_end(session_id)
+    
+    def _drop_locked(self, session_id: str) -> None:
+        del self._handles[session_id]
+        del self._last_seen[session_id]
+    
+    def _evict_idle_locked(self, now: float) -> List[str]:
+        evicted = []
+        for session_id in list(self._handles):
+            if now - self._last_seen[session_id] <= self.idle_timeout:
+                break
+            self._drop_locked(session_id)
+            evicted.append(session_id)
+        return evicted
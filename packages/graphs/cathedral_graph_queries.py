@@ -0,0 +1,157 @@
+# Cathedral Graph Query Engine
+# Path-finding and reachability queries over a compiled cathedral graph
+
+import heapq
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Tuple
+
+from cathedral_graph_navigator import GraphEdge, GraphSnapshot
+
+# Memoized results kept per GraphQueries, least recently used dropped first
+MAX_CACHED_SOURCES = 256
+MAX_CACHED_REACHABLE = 1024
+# Graph versions whose query engines are kept by get_graph_queries()
+MAX_CACHED_VERSIONS = 4
+
+class GraphQueries:
+    """Shortest paths, nearest rooms and reachable sets for one graph version.
+
+    Edge cost is the edge intensity. Results are memoized per source node
+    in bounded LRUs and handed out as copies; instances are shared per
+    snapshot version through get_graph_queries().
+    """
+
+    def __init__(self, snapshot: GraphSnapshot):
+        self.snapshot = snapshot
+        self.graph = snapshot.graph
+        self.version = snapshot.version
+        self._distances: "OrderedDict[str, Tuple[Dict[str, float], Dict[str, GraphEdge]]]" = OrderedDict()
+        self._reachable: "OrderedDict[Tuple[str, int], Dict[str, int]]" = OrderedDict()
+        self._all_pairs: Optional[Dict[str, Dict[str, float]]] = None
+        self._lock = threading.Lock()
+
+    def single_source(self, source: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Dijkstra from source: (distance by node, predecessor by node)"""
+        distances, previous = self._single_source(source)
+        return dict(distances), {node_id: edge.source for node_id, edge in previous.items()}
+
+    def _single_source(self, source: str) -> Tuple[Dict[str, float], Dict[str, GraphEdge]]:
+        """Cached Dijkstra result, with the relaxed edge into each node as
+        predecessor; shared, so callers must not modify it"""
+        with self._lock:
+            cached = self._distances.get(source)
+            if cached is not None:
+                self._distances.move_to_end(source)
+                return cached
+
+        distances = {source: 0.0}
+        previous: Dict[str, GraphEdge] = {}
+        heap = [(0.0, source)]
+
+        while heap:
+            distance, node_id = heapq.heappop(heap)
+            if distance > distances[node_id]:
+                continue
+            for edge in self.graph.edges_from(node_id):
+                candidate = distance + edge.intensity
+                if candidate < distances.get(edge.target, float("inf")):
+                    distances[edge.target] = candidate
+                    previous[edge.target] = edge
+                    heapq.heappush(heap, (candidate, edge.target))
+
+        with self._lock:
+            self._distances[source] = (distances, previous)
+            while len(self._distances) > MAX_CACHED_SOURCES:
+                self._distances.popitem(last=False)
+        return distances, previous
+
+    def shortest_path(self, source: str, target: str) -> Optional[Dict[str, Any]]:
+        """Cheapest intensity-weighted path, or None if target is unreachable"""
+        if self.graph.get_node(source) is None or self.graph.get_node(target) is None:
+            return None
+
+        distances, previous = self._single_source(source)
+        if target not in distances:
+            return None
+
+        # Walk back along the edges Dijkstra relaxed, so parallel edges report the cheapest one
+        edges = []
+        node_id = target
+        while node_id != source:
+            edges.append(previous[node_id])
+            node_id = edges[-1].source
+        edges.reverse()
+        path = [source] + [edge.target for edge in edges]
+
+        return {
+            "path": path,
+            "cost": distances[target],
+            "hops": len(edges),
+            "edge_types": [edge.edge_type for edge in edges]
+        }
+
+    def k_nearest(self, source: str, k: int) -> List[Dict[str, Any]]:
+        """The k rooms with the lowest path cost from source, nearest first"""
+        if self.graph.get_node(source) is None:
+            return []
+
+        distances, _ = self._single_source(source)
+        nearest = heapq.nsmallest(
+            k,
+            ((cost, node_id) for node_id, cost in distances.items() if node_id != source)
+        )
+        return [{"node_id": node_id, "cost": cost} for cost, node_id in nearest]
+
+    def reachable_within(self, source: str, max_hops: int) -> Dict[str, int]:
+        """Nodes reachable from source in at most max_hops edges, with hop counts"""
+        key = (source, max_hops)
+        with self._lock:
+            cached = self._reachable.get(key)
+            if cached is not None:
+                self._reachable.move_to_end(key)
+                return dict(cached)
+        if self.graph.get_node(source) is None:
+            return {}
+
+        hops = {source: 0}
+        queue = deque([source])
+        while queue:
+            node_id = queue.popleft()
+            if hops[node_id] >= max_hops:
+                continue
+            for edge in self.graph.edges_from(node_id):
+                if edge.target not in hops:
+                    hops[edge.target] = hops[node_id] + 1
+                    queue.append(edge.target)
+
+        with self._lock:
+            self._reachable[key] = hops
+            while len(self._reachable) > MAX_CACHED_REACHABLE:
+                self._reachable.popitem(last=False)
+        return dict(hops)
+
+    def all_pairs_distances(self) -> Dict[str, Dict[str, float]]:
+        """Precompute intensity-weighted distances between every pair of nodes"""
+        if self._all_pairs is None:
+            self._all_pairs = {
+                node_id: self._single_source(node_id)[0]
+                for node_id in self.graph.nodes_by_id
+            }
+        return {node_id: dict(distances) for node_id, distances in self._all_pairs.items()}
+
+_QUERY_CACHE: "OrderedDict[str, GraphQueries]" = OrderedDict()
+_QUERY_CACHE_LOCK = threading.Lock()
+
+def get_graph_queries(snapshot: GraphSnapshot) -> GraphQueries:
+    """Shared query engine for a snapshot, keyed by graph version"""
+    with _QUERY_CACHE_LOCK:
+        queries = _QUERY_CACHE.get(snapshot.version)
+        if queries is None:
+            queries = GraphQueries(snapshot)
+            _QUERY_CACHE[snapshot.version] = queries
+            while len(_QUERY_CACHE) > MAX_CACHED_VERSIONS:
+                _QUERY_CACHE.popitem(last=False)
+        else:
+            _QUERY_CACHE.move_to_end(snapshot.version)
+        return queries
@@ -3,9 +3,11 @@
 
 import sys
 import os
+import time
 sys.path.append(os.path.join('.', 'packages', 'graphs'))
 
-from cathedral_graph_navigator import CathedralGraphNavigator, NavigationState
+from cathedral_graph_navigator import CathedralGraphNavigator, CompiledGraph, GraphSnapshot, NavigationState, SessionRegistry
+from cathedral_graph_queries import GraphQueries, get_graph_queries
 
 def test_cathedral_graph_navigation():
     """Test the complete cathedral graph navigation system"""
@@ -173,6 +175,121 @@ def test_render_integration():
     
     return True
 
+def test_compiled_graph_index():
+    """Test the compiled node, adjacency and edge lookups"""
+    print("\n🗺️ Testing Compiled Graph Index...")
+    
+    navigator = CathedralGraphNavigator("packages/graphs")
+    graph = navigator.graph
+    
+    assert len(graph.nodes_by_id) == len(navigator.core_nodes["nodes"])
+    assert sum(len(edges) for edges in graph.adjacency.values()) == len(navigator.core_nodes["edges"])
+    
+    for edge in navigator.core_nodes["edges"]:
+        compiled = graph.get_edge(edge["from"], edge["to"])
+        assert compiled is not None
+        assert compiled.edge_type == edge["type"]
+        assert compiled.note == edge["note"]
+    
+    assert graph.get_node("tesla")["name"] == "Nikola Tesla"
+    assert graph.get_node("missing-room") is None
+    assert graph.get_edge("tesla", "missing-room") is None
+    print(f"✅ Indexed {len(graph.nodes_by_id)} nodes and {len(graph.edge_index)} edges")
+    
+    return True
+
+def test_session_registry():
+    """Test shared-snapshot session handles and idle eviction"""
+    print("\n👥 Testing Session Registry...")
+    
+    registry = SessionRegistry.from_path("packages/graphs", idle_timeout=60.0)
+    alice = registry.open_session("alice")
+    bob = registry.open_session("bob")
+    
+    # Handles share one parsed graph but keep independent sessions
+    assert alice.snapshot is bob.snapshot
+    assert alice.core_nodes is bob.core_nodes
+    alice.enter_node("tesla")
+    bob.enter_node("hypatia")
+    assert alice.traverse_edge("crowley-shadow")["node_entered"] == "crowley-shadow"
+    assert bob.get_session_status()["current_node"] == "hypatia"
+    assert registry.open_session("alice") is alice
+    print(f"✅ {len(registry)} sessions share graph version {registry.snapshot.version}")
+    
+    # Idle eviction
+    evicted = registry.evict_idle(now=time.monotonic() + 120.0)
+    assert sorted(evicted) == ["alice", "bob"]
+    assert len(registry) == 0
+    assert registry.get("alice") is None
+    print(f"✅ Evicted idle sessions: {evicted}")
+    
+    # Capacity eviction keeps the most recently used sessions
+    bounded = SessionRegistry(registry.snapshot, max_sessions=1)
+    bounded.open_session("alice")
+    bounded.open_session("bob")
+    assert "bob" in bounded and "alice" not in bounded
+    try:
+        SessionRegistry(registry.snapshot, max_sessions=0)
+        assert False, "max_sessions=0 should be rejected"
+    except ValueError:
+        pass
+    
+    return True
+
+def test_graph_queries():
+    """Test path-finding and reachability queries"""
+    print("\n🧭 Testing Graph Queries...")
+    
+    navigator = CathedralGraphNavigator("packages/graphs")
+    queries = get_graph_queries(navigator.snapshot)
+    assert get_graph_queries(navigator.snapshot) is queries
+    
+    path = queries.shortest_path("tesla", "fortune")
+    assert path["path"][0] == "tesla" and path["path"][-1] == "fortune"
+    assert len(path["edge_types"]) == path["hops"]
+    for a, b in zip(path["path"], path["path"][1:]):
+        assert navigator.graph.get_edge(a, b) is not None
+    print(f"✅ Path: {' → '.join(path['path'])} (cost {path['cost']:.2f})")
+    
+    one_hop = queries.reachable_within("tesla", 1)
+    expected = {option["target_node"] for option in navigator.get_navigation_options("tesla")}
+    assert set(one_hop) - {"tesla"} == expected
+    
+    nearest = queries.k_nearest("tesla", 3)
+    assert len(nearest) <= 3
+    assert [n["cost"] for n in nearest] == sorted(n["cost"] for n in nearest)
+    
+    all_pairs = queries.all_pairs_distances()
+    assert all_pairs["tesla"]["fortune"] == path["cost"]
+    
+    # Callers get copies; the memoized results stay intact
+    one_hop.clear()
+    all_pairs["tesla"].clear()
+    queries.single_source("tesla")[0]["fortune"] = -1.0
+    assert queries.reachable_within("tesla", 1)
+    assert queries.shortest_path("tesla", "fortune")["cost"] == path["cost"]
+    assert queries.shortest_path("tesla", "missing-room") is None
+    print(f"✅ Nearest to Tesla: {[n['node_id'] for n in nearest]}")
+    
+    # Parallel edges: the path reports the cheaper edge Dijkstra took, not the first listed
+    core_nodes = {
+        "nodes": [{"id": "a"}, {"id": "b"}, {"id": "c"}],
+        "edges": [
+            {"from": "a", "to": "b", "type": "storm", "intensity": 0.9},
+            {"from": "a", "to": "b", "type": "whisper", "intensity": 0.1},
+            {"from": "b", "to": "c", "type": "bridge", "intensity": 0.5},
+        ]
+    }
+    parallel = GraphQueries(GraphSnapshot(core_nodes, {}, {}, CompiledGraph.from_core_nodes(core_nodes), "parallel", ""))
+    route = parallel.shortest_path("a", "c")
+    assert route["path"] == ["a", "b", "c"]
+    assert route["edge_types"] == ["whisper", "bridge"]
+    assert abs(route["cost"] - 0.6) < 1e-9
+    assert parallel.single_source("a")[1] == {"b": "a", "c": "b"}
+    print("✅ Parallel edges report the edge on the cheapest path")
+    
+    return True
+
 if __name__ == "__main__":
     print("🏛️ Cathedral Core Graph System - Complete Test Suite")
     print("=" * 70)
@@ -184,7 +301,16 @@ if __name__ == "__main__":
         # Render integration tests  
         render_success = test_render_integration()
         
-        if nav_success and render_success:
+        # Compiled graph index tests
+        index_success = test_compiled_graph_index()
+        
+        # Session registry tests
+        registry_success = test_session_registry()
+        
+        # Graph query tests
+        query_success = test_graph_queries()
+        
+        if nav_success and render_success and index_success and registry_success and query_success:
             print("\n✨ ALL CATHEDRAL GRAPH TESTS PASSED!")
             print("🏛️ The 10-node Cathedral of Circuits is fully operational")
             print("⚡ Tesla, Hypatia, Agrippa, Dee, Fortune, Hilma")
@@ -0,0 +1,376 @@
+# Test the Cathedral Book Scanner
+# Tokenizer modes, result store and corpus index behaviour
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.append(os.path.join('.', 'packages', 'scanner'))
+
+import cathedral_scanner
+from fastapi.testclient import TestClient
+from cathedral_scanner import (
+    FREQUENCY_KEYWORDS, BookMetadata, BookScanner, CorpusIndex, ExtractedText, PageJob, ScanAccumulator,
+    ScanJobQueue, ScanResultStore, app, estimate_source_dpi, fast_sent_tokenize, ingest_library
+)
+
+def make_page(text: str, page_number: int = 1) -> ExtractedText:
+    return ExtractedText(
+        text=text, page_number=page_number, confidence_score=90.0, language="en",
+        character_count=len(text), word_count=len(text.split())
+    )
+
+def make_scanner(config=None) -> BookScanner:
+    """Scanner writing into a throwaway scan_results directory"""
+    os.chdir(tempfile.mkdtemp())
+    return BookScanner({"corpus_index": False, **(config or {})})
+
+PARITY_PAGES = [
+    "The magician channels will and power through the wand. A hermit walks alone, seeking wisdom. "
+    "Love and harmony unite the lovers beneath the sun.",
+    "The tower falls in sudden upheaval! Death brings transformation and rebirth. "
+    "Does the star offer hope and healing? The moon rules illusion, dreams and intuition.",
+    "Justice weighs truth and balance. The emperor builds structure and authority. "
+    "Transformation, transformation, transformation: the cycle of the wheel of fortune turns.",
+    "A priestess keeps hidden knowledge and mystery. The fool leaps into new beginnings with innocence. "
+    "Divine unity and enlightenment crown the world, and miracles repair what was broken.",
+]
+
+def per_archetype_reference(scanner: BookScanner, pages):
+    """The per-archetype scan KeywordIndex replaced: scores, snippets and frequency keywords"""
+    archetypes = scanner.archetype_matcher.archetype_keywords
+    token_counts, total_tokens = Counter(), 0
+    snippets = {name: [] for name in archetypes}
+    frequency_matches = {freq: set() for freq in FREQUENCY_KEYWORDS}
+    for text in pages:
+        tokens = scanner._tokenize_text(text)
+        token_counts.update(tokens)
+        total_tokens += len(tokens)
+        for name, data in archetypes.items():
+            matching = []
+            for sentence in scanner._split_sentences(text):
+                if any(keyword.lower() in sentence.lower() for keyword in data["keywords"]):
+                    snippet = sentence.strip()
+                    matching.append(snippet[:200] + "..." if len(snippet) > 200 else snippet)
+            snippets[name].extend(matching[:3][:3 - len(snippets[name])])
+        for freq, keywords in FREQUENCY_KEYWORDS.items():
+            frequency_matches[freq].update(keyword for keyword in keywords if keyword in text.lower())
+    scores = {
+        name: min(sum(token_counts.get(keyword.lower(), 0) / total_tokens for keyword in data["keywords"]), 1.0)
+        for name, data in archetypes.items()
+    }
+    return scores, snippets, frequency_matches
+
+def test_keyword_index_parity():
+    """The single precompiled matcher scores and quotes exactly like the per-archetype scan"""
+    print("\n🗝️ Testing keyword index parity...")
+
+    cwd = os.getcwd()
+    try:
+        scanner = make_scanner({"tokenizer": "fast"})
+    finally:
+        os.chdir(cwd)
+    accumulator = ScanAccumulator(scanner)
+    for page_number, text in enumerate(PARITY_PAGES, 1):
+        accumulator.add_page(make_page(text, page_number))
+
+    scores, snippets, frequency_matches = per_archetype_reference(scanner, PARITY_PAGES)
+    assert accumulator.archetype_scores() == scores
+    assert accumulator.snippets == snippets
+    assert {freq: accumulator.frequency_matches.get(freq, set()) for freq in FREQUENCY_KEYWORDS} == frequency_matches
+    assert any(scores.values()) and any(snippets.values()) and any(frequency_matches.values())
+    matched = sorted(name for name, score in scores.items() if score)
+    print(f"✅ Identical scores and snippets for {len(matched)} matched archetypes")
+
+    return True
+
+def test_fast_tokenizer_skips_nltk():
+    """The fast tokenizer mode must not call into NLTK at all"""
+    print("\n⚡ Testing fast tokenizer...")
+
+    assert fast_sent_tokenize("The tower falls. Does the star rise? Yes!") == [
+        "The tower falls.", "Does the star rise?", "Yes!"
+    ]
+
+    cwd = os.getcwd()
+    patched = ("sent_tokenize", "word_tokenize", "get_nlp_resources", "lemmatize")
+    originals = {name: getattr(cathedral_scanner, name) for name in patched}
+    def forbidden(*args, **kwargs):
+        raise AssertionError("NLTK used in fast tokenizer mode")
+    try:
+        for name in patched:
+            setattr(cathedral_scanner, name, forbidden)
+        scanner = make_scanner({"tokenizer": "fast"})
+        accumulator = ScanAccumulator(scanner)
+        accumulator.add_page(make_page("The magician channels will and power. The hermit seeks wisdom alone."))
+        assert accumulator.total_tokens > 0
+        assert accumulator.pages == 1
+    finally:
+        for name, original in originals.items():
+            setattr(cathedral_scanner, name, original)
+        os.chdir(cwd)
+    print("✅ Fast mode split and tokenized pages without NLTK")
+
+    return True
+
+def test_result_store_budget():
+    """Unique temp files and a running size total that evicts oldest entries"""
+    print("\n🗄️ Testing result store...")
+
+    store = ScanResultStore(Path(tempfile.mkdtemp()), max_bytes=3000)
+    path = store.result_path("hash", "ocr", "analysis")
+    assert store.tmp_path(path) != store.tmp_path(path)
+
+    for i in range(10):
+        result_path = store.result_path(f"hash{i}", "ocr", "analysis")
+        store.put_result(result_path, {"text": "x" * 400})
+        os.utime(result_path, (i, i))
+    on_disk = sum(f.stat().st_size for f in store.results_dir.iterdir())
+    assert on_disk <= 3000
+    assert store._total_bytes == on_disk
+    assert store.get_result(store.result_path("hash9", "ocr", "analysis")) is not None
+    assert store.get_result(store.result_path("hash0", "ocr", "analysis")) is None
+
+    writer = store.page_writer(store.pages_path("hash9", "ocr"))
+    writer.write(make_page("A single cached page."))
+    writer.commit()
+    assert [page.text for page in store.iter_pages(store.pages_path("hash9", "ocr"))] == ["A single cached page."]
+    assert not list(store.root.rglob("*.tmp"))
+    print(f"✅ Store holds {on_disk} bytes within its 3000 byte budget")
+
+    return True
+
+def test_source_dpi_from_page_size():
+    """Scan resolution comes from the real page size, not a letter-height guess"""
+    print("\n📐 Testing source DPI...")
+
+    # A4 page (842pt tall) rasterized at 300 DPI
+    assert round(estimate_source_dpi(3508, {}, page_height_points=842.0)) == 300
+    # Pocket-format page (6in = 432pt) at 300 DPI
+    assert round(estimate_source_dpi(1800, {}, page_height_points=432.0)) == 300
+    # Embedded scan DPI is trusted; writer placeholder DPI is not
+    assert estimate_source_dpi(1800, {}, image_dpi=300) == 300
+    assert estimate_source_dpi(1100, {}, image_dpi=72) == 100
+    # Configured DPI always wins
+    assert estimate_source_dpi(3508, {"source_dpi": 400}, page_height_points=842.0) == 400
+    print("✅ DPI resolved from page size, image tag and config")
+
+    return True
+
+def test_corpus_index_streams_pages():
+    """Page terms reach the index in batches; the tokenizer mode is fixed at creation"""
+    print("\n🔎 Testing corpus index...")
+
+    path = Path(tempfile.mkdtemp()) / "index.sqlite3"
+    index = CorpusIndex(path, "fast")
+    assert CorpusIndex(path, "nltk").tokenizer == "fast"
+
+    metadata = BookMetadata(
+        title="Tarot", author="Unknown", isbn=None, page_count=0, scan_timestamp="",
+        file_hash="hash", original_filename="tarot.pdf"
+    )
+    batches = []
+    def sink(page_terms):
+        batches.append(len(page_terms))
+        index.add_pages(book_id, page_terms)
+
+    cwd = os.getcwd()
+    try:
+        scanner = make_scanner({"tokenizer": "fast"})
+        book_id = index.start_book(metadata)
+        accumulator = ScanAccumulator(scanner, term_sink=sink)
+        for page_number in range(1, cathedral_scanner.PAGE_TERMS_BATCH + 11):
+            accumulator.add_page(make_page("The tower stands beside the star.", page_number))
+        accumulator.flush_terms()
+        assert batches == [cathedral_scanner.PAGE_TERMS_BATCH, 10]
+        assert index.search(["tower"]) == []  # unfinished books are not searchable
+
+        metadata.page_count = accumulator.pages
+        results = {"archetype_matches": [], "frequency_analysis": {"frequency_correlations": {}}}
+        index.finish_book(book_id, metadata, accumulator.token_counts, accumulator.total_tokens, results)
+        hits = index.search(["tower", "star"])
+        assert hits[0]["file_hash"] == "hash" and hits[0]["pages"]
+        assert index.has_book("hash")
+    finally:
+        os.chdir(cwd)
+    print(f"✅ Indexed {metadata.page_count} pages in {len(batches)} batches")
+
+    return True
+
+def test_stream_bounds_pages_in_flight():
+    """Streaming keeps at most max_pages_in_flight pages extracting and no page text by default"""
+    print("\n🌊 Testing streaming scan...")
+
+    cwd = os.getcwd()
+    original_extract = cathedral_scanner.extract_page
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, peak
+    def slow_extract(job, config):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.002)
+        with lock:
+            in_flight[0] -= 1
+        return make_page(f"The star rises over page {job.page_number}.", job.page_number)
+
+    try:
+        cathedral_scanner.extract_page = slow_extract
+        scanner = make_scanner({"tokenizer": "fast", "max_pages_in_flight": 3})
+        book = Path(tempfile.mkdtemp()) / "long_book.pdf"
+        book.write_bytes(b"%PDF-1.4 stub")
+        page_count = 60
+        scanner._page_jobs = lambda path: [PageJob(str(path), i, "pdf") for i in range(1, page_count + 1)]
+        scanner._ocr_pool = ThreadPoolExecutor(max_workers=8)
+
+        async def collect():
+            return [event async for event in scanner.scan_book_stream(str(book))]
+        events = asyncio.run(collect())
+        scanner.shutdown()
+    finally:
+        cathedral_scanner.extract_page = original_extract
+        os.chdir(cwd)
+
+    pages = [event for event in events if event["event"] == "page"]
+    results = events[-1]["results"]
+    assert [event["page_number"] for event in pages] == list(range(1, page_count + 1))
+    assert in_flight[1] <= 3
+    assert results["metadata"]["page_count"] == page_count
+    assert results["extracted_texts"] == []
+    print(f"✅ {page_count} pages streamed with at most {in_flight[1]} in flight")
+
+    return True
+
+def fake_page_stream(scanner: BookScanner, page_count: int = 3):
+    """Replace OCR with generated pages; uploads containing b"broken" fail after one page"""
+    async def stream_pages(file_path):
+        broken = b"broken" in Path(file_path).read_bytes()
+        for page_number in range(1, page_count + 1):
+            if broken and page_number == 2:
+                raise ValueError("Unreadable page 2")
+            yield make_page(f"The hermit lights the lantern of wisdom on page {page_number}.", page_number)
+    scanner._stream_pages = stream_pages
+
+def wait_for_job(client: TestClient, job_id: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        report = client.get(f"/scan/{job_id}").json()
+        if report["status"] in ("complete", "failed", "cancelled"):
+            return report
+        time.sleep(0.01)
+    raise AssertionError(f"Scan job {job_id} did not finish")
+
+def test_scan_job_endpoints():
+    """Jobs are accepted with 202, stream events and serve results; failures give 422"""
+    print("\n🛎️ Testing scan job endpoints...")
+
+    cwd = os.getcwd()
+    originals = (cathedral_scanner.scanner, cathedral_scanner.scan_jobs)
+    try:
+        for store_results in (True, False):
+            scanner = make_scanner({"tokenizer": "fast", "ocr_workers": 0, "store_results": store_results})
+            fake_page_stream(scanner)
+            cathedral_scanner.scanner = scanner
+            cathedral_scanner.scan_jobs = ScanJobQueue(scanner, workers=1)
+            with TestClient(app) as client:
+                response = client.post("/scan/jobs", files={"file": ("hermit.png", b"lantern", "image/png")})
+                assert response.status_code == 202
+                job_id = response.json()["job_id"]
+                report = wait_for_job(client, job_id)
+                assert report["status"] == "complete" and report["pages_done"] == 3
+
+                events = [json.loads(line) for line in client.get(f"/scan/{job_id}/events").text.splitlines()]
+                assert [event["event"] for event in events] == ["started", "page", "page", "page", "complete"]
+
+                result = client.get(f"/scan/{job_id}/result")
+                if store_results:
+                    assert result.status_code == 200
+                    assert result.json()["metadata"]["page_count"] == 3
+                    assert result.json()["cache_hit"] is False
+                else:
+                    # Nothing was written to the result store to serve
+                    assert result.status_code == 410
+
+                failed = client.post("/scan/jobs", files={"file": ("broken.png", b"broken", "image/png")})
+                failed_id = failed.json()["job_id"]
+                assert wait_for_job(client, failed_id)["status"] == "failed"
+                response = client.get(f"/scan/{failed_id}/result")
+                assert response.status_code == 422 and "page 2" in response.json()["detail"]
+                assert json.loads(client.get(f"/scan/{failed_id}/events").text.splitlines()[-1])["event"] == "error"
+                assert client.get("/scan/unknown-job").status_code == 404
+    finally:
+        cathedral_scanner.scanner, cathedral_scanner.scan_jobs = originals
+        os.chdir(cwd)
+    print("✅ Jobs complete, stream their events and report failures")
+
+    return True
+
+def test_ingest_dedupes_and_resumes():
+    """Copies are scanned once, reruns skip everything, and the parent owns the index"""
+    print("\n🏛️ Testing library ingestion...")
+
+    cwd = os.getcwd()
+    work = Path(tempfile.mkdtemp())
+    library = work / "library"
+    (library / "copies").mkdir(parents=True)
+    (library / "hermit.pdf").write_bytes(b"%PDF-1.4 hermit")
+    (library / "tower.pdf").write_bytes(b"%PDF-1.4 tower")
+    (library / "copies" / "hermit_copy.pdf").write_bytes(b"%PDF-1.4 hermit")
+    output = work / "out"
+    try:
+        os.chdir(work)
+        config = {"tokenizer": "fast"}
+        first = ingest_library(str(library), str(output), workers=2, config=config)
+        assert (first["books_scanned"], first["duplicates_skipped"], first["failed"]) == (2, 1, 0)
+
+        shard_records = [json.loads(line) for line in (output / "results-00000.ndjson").read_text().splitlines()]
+        # One of the two identical hermit files is scanned, the other recorded as its duplicate
+        assert len({record["file_hash"] for record in shard_records}) == 2
+        assert sum(Path(record["path"]).name.startswith("hermit") for record in shard_records) == 1
+        assert all("index" not in record for record in shard_records)
+        manifest = [json.loads(line) for line in (output / "manifest.jsonl").read_text().splitlines()]
+        assert sorted(entry["status"] for entry in manifest) == ["duplicate", "scanned", "scanned"]
+
+        # Only the parent wrote an index, under the output directory; workers stored nothing
+        assert not (work / "scan_results" / "corpus_index.sqlite3").exists()
+        assert not list((work / "scan_results").rglob("*.json"))
+        index = CorpusIndex(output / "corpus_index.sqlite3", "fast")
+        assert index.has_book(shard_records[0]["file_hash"]) and index.has_book(shard_records[1]["file_hash"])
+
+        second = ingest_library(str(library), str(output), workers=2, config=config)
+        assert (second["books_scanned"], second["duplicates_skipped"], second["already_in_manifest"]) == (0, 0, 3)
+    finally:
+        os.chdir(cwd)
+    print(f"✅ Ingested {first['books_scanned']} books, skipped {first['duplicates_skipped']} copy, rerun skipped all")
+
+    return True
+
+if __name__ == "__main__":
+    print("📚 Cathedral Book Scanner - Test Suite")
+    print("=" * 70)
+
+    try:
+        parity_success = test_keyword_index_parity()
+        fast_success = test_fast_tokenizer_skips_nltk()
+        store_success = test_result_store_budget()
+        dpi_success = test_source_dpi_from_page_size()
+        index_success = test_corpus_index_streams_pages()
+        stream_success = test_stream_bounds_pages_in_flight()
+        jobs_success = test_scan_job_endpoints()
+        ingest_success = test_ingest_dedupes_and_resumes()
+        
+        if (parity_success and fast_success and store_success and dpi_success and index_success
+                and stream_success and jobs_success and ingest_success):
+            print("\n✨ ALL SCANNER TESTS PASSED!")
+        else:
+            print("\n⚠️ Some tests need attention")
+    except Exception as e:
+        print(f"\n❌ Test suite error: {e}")
+        import traceback
+        traceback.print_exc()
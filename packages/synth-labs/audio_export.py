@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Cathedral Synth Labs - Audio Export
+Streaming WAV/FLAC writer and process-pool batch rendering for synth output
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional
+
+import numpy as np
+
+SUBTYPES = ("PCM_16", "FLOAT")
+# Frames converted per write, bounding the temporary integer/float32 copy
+WRITE_CHUNK_FRAMES = 65536
+
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_IEEE_FLOAT = 3
+
+class AudioWriter:
+    """Incremental audio file writer.
+
+    Blocks of float samples in [-1, 1] are appended as they are rendered, so
+    a take never has to be held in memory. WAV (16-bit PCM or 32-bit float)
+    is written directly, with the RIFF sizes patched in on close(); FLAC
+    goes through the optional soundfile package.
+    """
+
+    def __init__(self, path, sample_rate: int = 44100, channels: int = 1,
+                 subtype: str = "PCM_16", gain: float = 1.0):
+        if subtype not in SUBTYPES:
+            raise ValueError(f"Unknown subtype '{subtype}', expected one of {SUBTYPES}")
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.subtype = subtype
+        self.gain = gain
+        self.frames_written = 0
+        self.format = self.path.suffix.lower().lstrip(".")
+
+        self._file = None
+        self._soundfile = None
+        if self.format == "flac":
+            try:
+                import soundfile
+            except ImportError as e:
+                raise ImportError("FLAC export requires the soundfile package") from e
+            # FLAC has no float subtype; float takes are stored as 24-bit
+            flac_subtype = "PCM_16" if subtype == "PCM_16" else "PCM_24"
+            self._soundfile = soundfile.SoundFile(
+                str(self.path), "w", samplerate=sample_rate, channels=channels,
+                format="FLAC", subtype=flac_subtype,
+            )
+        elif self.format == "wav":
+            self._file = open(self.path, "wb")
+            self._write_wav_header()
+        else:
+            raise ValueError(f"Unsupported audio format: {self.path.suffix}")
+
+    @property
+    def sample_width(self) -> int:
+        return 2 if self.subtype == "PCM_16" else 4
+
+    def _write_wav_header(self):
+        block_align = self.channels * self.sample_width
+        if self.subtype == "PCM_16":
+            fmt = struct.pack("<HHIIHH", WAVE_FORMAT_PCM, self.channels, self.sample_rate,
+                              self.sample_rate * block_align, block_align, 16)
+            header = b"RIFF" + struct.pack("<I", 0) + b"WAVE"
+            header += b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        else:
+            # Non-PCM WAV carries cbSize and a fact chunk with the frame count
+            fmt = struct.pack("<HHIIHHH", WAVE_FORMAT_IEEE_FLOAT, self.channels, self.sample_rate,
+                              self.sample_rate * block_align, block_align, 32, 0)
+            header = b"RIFF" + struct.pack("<I", 0) + b"WAVE"
+            header += b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            header += b"fact" + struct.pack("<II", 4, 0)
+        header += b"data" + struct.pack("<I", 0)
+        self._file.write(header)
+        self._data_offset = len(header)
+
+    def write(self, block: np.ndarray):
+        """Append frames: shape (frames,) for mono or (frames, channels)"""
+        block = np.asarray(block)
+        for start in range(0, len(block), WRITE_CHUNK_FRAMES):
+            chunk = block[start:start + WRITE_CHUNK_FRAMES] * self.gain
+            if self._soundfile is not None:
+                self._soundfile.write(np.clip(chunk, -1.0, 1.0))
+            elif self.subtype == "PCM_16":
+                np.clip(chunk, -1.0, 1.0, out=chunk)
+                chunk *= 32767
+                self._file.write(np.rint(chunk).astype("<i2").tobytes())
+            else:
+                self._file.write(chunk.astype("<f4").tobytes())
+            self.frames_written += len(chunk)
+
+    def close(self):
+        if self._soundfile is not None:
+            self._soundfile.close()
+            self._soundfile = None
+        if self._file is None:
+            return
+        data_bytes = self.frames_written * self.channels * self.sample_width
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", self._data_offset - 8 + data_bytes))
+        if self.subtype == "FLOAT":
+            self._file.seek(self._data_offset - 12)
+            self._file.write(struct.pack("<I", self.frames_written))
+        self._file.seek(self._data_offset - 4)
+        self._file.write(struct.pack("<I", data_bytes))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "AudioWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def write_audio(path, blocks: Iterable[np.ndarray], sample_rate: int = 44100,
+                subtype: str = "PCM_16", channels: int = 1, gain: float = 1.0) -> int:
+    """Stream blocks into an audio file; returns the number of frames written"""
+    with AudioWriter(path, sample_rate, channels, subtype, gain) as writer:
+        for block in blocks:
+            writer.write(block)
+    return writer.frames_written
+
+def render_batch(task: Callable[[Any], Any], jobs: List[Any],
+                 workers: Optional[int] = None) -> List[Any]:
+    """Run task over jobs in a process pool, returning results in job order.
+
+    task must be a module-level function; jobs that need randomness should
+    carry their own seed so results do not depend on scheduling.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [task(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(task, jobs))
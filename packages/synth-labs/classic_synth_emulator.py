@@ -6,12 +6,17 @@ Emulating legendary synthesizers with mathematical precision
 
 import numpy as np
 import sounddevice as sd
+from scipy.signal import lfilter
 import json
 from pathlib import Path
 import math
 import time
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from collections import deque
+from dataclasses import astuple, dataclass
+from functools import lru_cache
+from typing import Iterator, List, Dict, Optional, Tuple
+
+from audio_export import AudioWriter, render_batch, write_audio
 
 @dataclass
 class Oscillator:
@@ -25,7 +30,7 @@ class Oscillator:
 @dataclass
 class Filter:
     """Filter configuration"""
-    type: str = "lowpass"  # lowpass, highpass, bandpass
+    type: str = "lowpass"  # lowpass, highpass, bandpass, ladder
     cutoff: float = 1000.0
     resonance: float = 0.0
     envelope_amount: float = 0.0
@@ -38,6 +43,60 @@ class Envelope:
     sustain: float = 0.7
     release: float = 0.5
 
+@dataclass
+class NoteEvent:
+    """One note on a sequencer timeline (times in seconds)"""
+    frequency: float
+    velocity: float = 0.8
+    start: float = 0.0
+    duration: float = 1.0  # gate plus release
+
+WAVEFORMS = ("sine", "saw", "square", "triangle")
+WAVETABLE_SIZE = 4096
+# Harmonics in the richest table; each further mip level halves the count
+WAVETABLE_HARMONICS = 1024
+WAVETABLE_LEVELS = int(math.log2(WAVETABLE_HARMONICS)) + 1
+
+@lru_cache(maxsize=None)
+def band_limited_tables(waveform: str) -> np.ndarray:
+    """Mip-mapped single-cycle tables (WAVETABLE_LEVELS, WAVETABLE_SIZE + 1).
+    
+    Level n holds the Fourier series up to WAVETABLE_HARMONICS >> n; the
+    extra column repeats the first sample for interpolation. Read-only.
+    """
+    harmonics = np.arange(WAVETABLE_SIZE // 2 + 1)
+    # Coefficients of sum(c_k * exp(2j*pi*k*phase)) matching the naive shapes
+    spectrum = np.zeros(len(harmonics), dtype=complex)
+    k = harmonics[1:WAVETABLE_HARMONICS + 1]
+    odd = k % 2 == 1
+    if waveform == "sine":
+        spectrum[1] = -0.5j
+    elif waveform == "saw":
+        spectrum[k] = 1j * (-1.0) ** k / (np.pi * k)
+    elif waveform == "square":
+        spectrum[k] = np.where(odd, -2j / (np.pi * k), 0)
+    elif waveform == "triangle":
+        spectrum[k] = np.where(odd, -4 / (np.pi * k) ** 2, 0)
+    else:
+        raise ValueError(f"Unknown waveform: {waveform}")
+    
+    tables = np.empty((WAVETABLE_LEVELS, WAVETABLE_SIZE + 1))
+    for level in range(WAVETABLE_LEVELS):
+        band = spectrum.copy()
+        band[(WAVETABLE_HARMONICS >> level) + 1:] = 0
+        tables[level, :-1] = np.fft.irfft(band, WAVETABLE_SIZE) * WAVETABLE_SIZE
+    tables[:, -1] = tables[:, 0]
+    tables.setflags(write=False)
+    return tables
+
+@lru_cache(maxsize=None)
+def wavetable_bank() -> np.ndarray:
+    """Tables of every waveform stacked, WAVETABLE_LEVELS rows per waveform
+    in WAVEFORMS order, so a mixed oscillator bank is read in one gather"""
+    bank = np.concatenate([band_limited_tables(waveform) for waveform in WAVEFORMS])
+    bank.setflags(write=False)
+    return bank
+
 class WaveformGenerator:
     """Generate classic synthesizer waveforms"""
     
@@ -46,43 +105,161 @@ class WaveformGenerator:
                          sample_rate: int = 44100, phase: float = 0.0) -> np.ndarray:
         """Generate waveform array"""
         t = np.linspace(0, duration, int(sample_rate * duration), False)
-        
-        if waveform == "sine":
-            return np.sin(2 * np.pi * frequency * t + phase)
-        elif waveform == "saw":
-            return 2 * (t * frequency - np.floor(0.5 + t * frequency))
-        elif waveform == "square":
-            return np.sign(np.sin(2 * np.pi * frequency * t + phase))
-        elif waveform == "triangle":
-            return 2 * np.abs(2 * (t * frequency - np.floor(0.5 + t * frequency))) - 1
-        else:
+        return WaveformGenerator.from_phase(
+            waveform, frequency * t + (phase / (2 * np.pi)) % 1.0, frequency / sample_rate
+        )
+    
+    @staticmethod
+    def mip_level(increment: np.ndarray) -> np.ndarray:
+        """Richest table level whose harmonics stay below Nyquist at this
+        phase increment (cycles per sample)"""
+        with np.errstate(divide="ignore"):
+            level = np.ceil(np.log2(2 * WAVETABLE_HARMONICS * np.abs(increment)))
+        return np.clip(level, 0, WAVETABLE_LEVELS - 1).astype(np.intp)
+    
+    @staticmethod
+    def bank_rows(waveforms: List[str], increments: np.ndarray) -> np.ndarray:
+        """Rows of wavetable_bank() for oscillators at these phase increments"""
+        for waveform in waveforms:
+            if waveform not in WAVEFORMS:
+                raise ValueError(f"Unknown waveform: {waveform}")
+        offsets = np.array([WAVEFORMS.index(waveform) for waveform in waveforms]) * WAVETABLE_LEVELS
+        return offsets + WaveformGenerator.mip_level(increments)
+    
+    @staticmethod
+    def read_bank(phase: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Linearly interpolated table reads at non-negative phases (cycles),
+        one bank row per row of phase"""
+        samples = wavetable_bank().ravel()
+        
+        # Phase accumulator to table position: integer index plus fraction
+        position = phase * WAVETABLE_SIZE
+        index = position.astype(np.intp)
+        position -= index
+        index &= WAVETABLE_SIZE - 1
+        index += rows[..., None] * (WAVETABLE_SIZE + 1)
+        left = samples.take(index)
+        out = samples.take(index + 1)
+        out -= left
+        out *= position
+        out += left
+        return out
+    
+    @staticmethod
+    def from_phase(waveform: str, phase: np.ndarray,
+                   increment: Optional[np.ndarray] = None) -> np.ndarray:
+        """Waveform values at non-negative phase positions given in cycles
+        
+        increment (cycles per sample, one per row of phase) band-limits the
+        waveform; without it the richest table is read.
+        """
+        if waveform not in WAVEFORMS:
             raise ValueError(f"Unknown waveform: {waveform}")
+        level = 0 if increment is None else WaveformGenerator.mip_level(increment)
+        rows = WAVEFORMS.index(waveform) * WAVETABLE_LEVELS + np.asarray(level)
+        return WaveformGenerator.read_bank(phase, rows)
 
 class FilterEngine:
     """Digital filter implementations"""
     
+    # The one-pole ladder model goes unstable near Nyquist, so its cutoff is capped
+    LADDER_MAX_CUTOFF_RATIO = 0.2
+    
     @staticmethod
-    def lowpass_filter(signal: np.ndarray, cutoff: float, resonance: float, 
-                      sample_rate: int = 44100) -> np.ndarray:
-        """Simple lowpass filter implementation"""
-        # Simplified digital filter (for production, use scipy.signal)
-        omega = 2 * np.pi * cutoff / sample_rate
+    def biquad_coefficients(filter_type: str, cutoff: float, resonance: float,
+                            sample_rate: int = 44100) -> Tuple[np.ndarray, np.ndarray]:
+        """Normalized RBJ biquad coefficients (b, a); Q is 1 + resonance"""
+        omega = 2 * np.pi * min(cutoff, 0.49 * sample_rate) / sample_rate
+        cos_w = np.cos(omega)
         alpha = np.sin(omega) / (2 * (1 + resonance))
         
-        b0 = (1 - np.cos(omega)) / 2
-        b1 = 1 - np.cos(omega)
-        b2 = (1 - np.cos(omega)) / 2
-        a0 = 1 + alpha
-        a1 = -2 * np.cos(omega)
-        a2 = 1 - alpha
-        
-        # Normalize coefficients
-        b = np.array([b0, b1, b2]) / a0
-        a = np.array([1, a1/a0, a2/a0])
-        
-        # Apply filter (simplified - use scipy.signal.lfilter for production)
-        filtered = np.convolve(signal, b, mode='same')
-        return filtered
+        if filter_type == "lowpass":
+            b = np.array([(1 - cos_w) / 2, 1 - cos_w, (1 - cos_w) / 2])
+        elif filter_type == "highpass":
+            b = np.array([(1 + cos_w) / 2, -(1 + cos_w), (1 + cos_w) / 2])
+        elif filter_type == "bandpass":
+            b = np.array([alpha, 0.0, -alpha])
+        else:
+            raise ValueError(f"Unknown filter type: {filter_type}")
+        a = np.array([1 + alpha, -2 * cos_w, 1 - alpha])
+        return b / a[0], a / a[0]
+    
+    @staticmethod
+    def ladder_coefficients(cutoff: float, resonance: float,
+                            sample_rate: int = 44100) -> Tuple[np.ndarray, np.ndarray]:
+        """4-pole Moog ladder as one 4th-order IIR (b, a).
+        
+        Four identical one-pole lowpasses with the delayed output fed back
+        with gain k = 4 * resonance: H = g^4 / ((1 - p z^-1)^4 + k g^4 z^-1).
+        The passband is scaled by 1 + k so resonance does not thin the level.
+        """
+        cutoff = min(cutoff, FilterEngine.LADDER_MAX_CUTOFF_RATIO * sample_rate)
+        g = 1 - np.exp(-2 * np.pi * cutoff / sample_rate)
+        k = 4 * min(max(resonance, 0.0), 0.99)
+        a = np.poly([1 - g] * 4)
+        a[1] += k * g ** 4
+        b = np.array([g ** 4 * (1 + k)])
+        return b, a
+    
+    @staticmethod
+    def coefficients(filter_type: str, cutoff: float, resonance: float,
+                     sample_rate: int = 44100) -> Tuple[np.ndarray, np.ndarray]:
+        if filter_type == "ladder":
+            return FilterEngine.ladder_coefficients(cutoff, resonance, sample_rate)
+        return FilterEngine.biquad_coefficients(filter_type, cutoff, resonance, sample_rate)
+    
+    @staticmethod
+    def lowpass_filter(signal: np.ndarray, cutoff: float, resonance: float, 
+                      sample_rate: int = 44100) -> np.ndarray:
+        """Lowpass biquad over a whole signal"""
+        b, a = FilterEngine.biquad_coefficients("lowpass", cutoff, resonance, sample_rate)
+        return lfilter(b, a, signal)
+    
+    @staticmethod
+    def ladder_filter(signal: np.ndarray, cutoff: float, resonance: float,
+                      sample_rate: int = 44100) -> np.ndarray:
+        """Moog ladder lowpass over a whole signal"""
+        b, a = FilterEngine.ladder_coefficients(cutoff, resonance, sample_rate)
+        return lfilter(b, a, signal)
+
+# Coefficient updates per block: a moving cutoff is stepped this many times
+# per block, each step filtered by lfilter with the state carried over
+COEFFICIENT_STEPS = 4
+
+class StatefulFilter:
+    """Biquad or ladder filter applied block by block with carried state (zi).
+    
+    Passing a new cutoff to process() glides to it across the block in
+    COEFFICIENT_STEPS geometrically spaced coefficient updates. With
+    channels set, blocks are 2-D (channels, frames), one state per row.
+    """
+    
+    def __init__(self, filter_config: Filter, sample_rate: int = 44100,
+                 channels: Optional[int] = None):
+        self.type = filter_config.type
+        self.resonance = filter_config.resonance
+        self.sample_rate = sample_rate
+        self.cutoff = filter_config.cutoff
+        self.b, self.a = self._coefficients(self.cutoff)
+        order = max(len(self.a), len(self.b)) - 1
+        self.zi = np.zeros(order if channels is None else (channels, order))
+    
+    def _coefficients(self, cutoff: float) -> Tuple[np.ndarray, np.ndarray]:
+        return FilterEngine.coefficients(self.type, cutoff, self.resonance, self.sample_rate)
+    
+    def process(self, block: np.ndarray, cutoff: Optional[float] = None) -> np.ndarray:
+        if cutoff is None or cutoff == self.cutoff:
+            out, self.zi = lfilter(self.b, self.a, block, zi=self.zi)
+            return out
+        
+        out = np.empty_like(block)
+        bounds = np.linspace(0, block.shape[-1], COEFFICIENT_STEPS + 1).astype(int)
+        cutoffs = np.geomspace(self.cutoff, cutoff, COEFFICIENT_STEPS + 1)[1:]
+        for start, stop, step_cutoff in zip(bounds[:-1], bounds[1:], cutoffs):
+            self.b, self.a = self._coefficients(step_cutoff)
+            out[..., start:stop], self.zi = lfilter(self.b, self.a, block[..., start:stop], zi=self.zi)
+        self.cutoff = cutoff
+        return out
 
 class EnvelopeGenerator:
     """ADSR envelope generator"""
@@ -122,6 +299,246 @@ class EnvelopeGenerator:
         
         return env
 
+class EnvelopeState:
+    """ADSR rendered block by block; release starts from the current level on note_off"""
+    
+    def __init__(self, envelope: Envelope, sample_rate: int = 44100):
+        self.sustain = envelope.sustain
+        self.lengths = {
+            "attack": int(envelope.attack * sample_rate),
+            "decay": int(envelope.decay * sample_rate),
+            "release": int(envelope.release * sample_rate),
+        }
+        self.stage = "attack"
+        self.position = 0
+        self.level = 0.0
+        self.stage_start = 0.0
+    
+    @property
+    def finished(self) -> bool:
+        return self.stage == "done"
+    
+    def release(self, frames: Optional[int] = None):
+        """Start the release, optionally shortened to end within frames samples"""
+        if self.stage != "done":
+            if frames is not None:
+                self.lengths["release"] = min(self.lengths["release"], max(frames, 0))
+            self._enter("release")
+    
+    def _enter(self, stage: str):
+        self.stage = stage
+        self.position = 0
+        self.stage_start = self.level
+    
+    def render(self, frames: int) -> np.ndarray:
+        out = np.empty(frames)
+        filled = 0
+        while filled < frames:
+            if self.stage in ("sustain", "done"):
+                self.level = self.sustain if self.stage == "sustain" else 0.0
+                out[filled:] = self.level
+                break
+            
+            length = self.lengths[self.stage]
+            target = {"attack": 1.0, "decay": self.sustain, "release": 0.0}[self.stage]
+            take = min(frames - filled, length - self.position)
+            if take > 0:
+                steps = (self.position + np.arange(1, take + 1)) / length
+                out[filled:filled + take] = self.stage_start + (target - self.stage_start) * steps
+                self.position += take
+                filled += take
+            if self.position >= length:
+                self.level = target
+                self._enter({"attack": "decay", "decay": "sustain", "release": "done"}[self.stage])
+            elif take > 0:
+                self.level = out[filled - 1]
+        return out
+
+BLOCK_SIZE = 256
+# Gain on every voice of unnormalized output (live engine, stream_note): a single
+# resonant Moog note peaks near 2.0 and overlapping notes sum, so -12 dB keeps
+# typical polyphony out of the hard clip
+VOICE_HEADROOM = 0.25
+
+class Voice:
+    """One sounding note rendered in fixed-size blocks.
+    
+    Oscillator phases, the ring modulator phase, filter history and envelope
+    position persist between blocks, so a note can be streamed for as long
+    as it is held with memory bounded by the block size.
+    
+    Voice.stack() batches notes of one patch into a single voice whose
+    blocks are 2-D (notes, frames); every note then shares one envelope.
+    """
+    
+    def __init__(self, oscillators: List[Oscillator], filter_config: Filter, envelope: Envelope,
+                 velocity: float = 1.0, sample_rate: int = 44100,
+                 ring_modulation: Optional[Tuple[float, float]] = None,
+                 cutoff_glide: Optional[Tuple[float, float]] = None):
+        self.sample_rate = sample_rate
+        self.velocity = velocity
+        self.amplitudes = np.array([osc.amplitude for osc in oscillators])
+        self.increments = np.array([osc.frequency for osc in oscillators]) / sample_rate
+        self.waveforms = tuple(osc.waveform for osc in oscillators)
+        self.table_rows = WaveformGenerator.bank_rows(self.waveforms, self.increments)
+        # Oscillator phase is kept in cycles; Oscillator.phase is in radians
+        self.phases = np.array([osc.phase for osc in oscillators]) / (2 * np.pi) % 1.0
+        self.filter_config = filter_config
+        self.envelope_config = envelope
+        self.filter = StatefulFilter(filter_config, sample_rate)
+        # (target cutoff, seconds): exponential cutoff sweep from filter_config.cutoff
+        self.cutoff_glide = cutoff_glide
+        self.start_cutoff = filter_config.cutoff
+        self.elapsed = 0
+        self.envelope = EnvelopeState(envelope, sample_rate)
+        self.ring_modulation = ring_modulation
+        self.modulation_phase = 0.0
+    
+    @property
+    def batch_key(self) -> Tuple:
+        """Voices with equal keys differ only in pitch and velocity"""
+        return (
+            self.sample_rate, tuple(self.amplitudes), self.waveforms,
+            astuple(self.filter_config), astuple(self.envelope_config),
+            self.ring_modulation, self.cutoff_glide,
+        )
+    
+    @classmethod
+    def stack(cls, voices: List["Voice"]) -> "Voice":
+        """One batched voice rendering all given (fresh, same-patch) voices as rows"""
+        first = voices[0]
+        if any(voice.batch_key != first.batch_key for voice in voices):
+            raise ValueError("Only voices of the same patch can be stacked")
+        batch = cls.__new__(cls)
+        batch.__dict__.update(first.__dict__)
+        batch.increments = np.stack([voice.increments for voice in voices])
+        batch.table_rows = np.stack([voice.table_rows for voice in voices])
+        batch.phases = np.stack([voice.phases for voice in voices])
+        batch.velocity = np.array([voice.velocity for voice in voices])[:, None]
+        batch.filter = StatefulFilter(first.filter_config, first.sample_rate, channels=len(voices))
+        batch.envelope = EnvelopeState(first.envelope_config, first.sample_rate)
+        return batch
+    
+    @property
+    def finished(self) -> bool:
+        return self.envelope.finished
+    
+    def note_off(self, release_frames: Optional[int] = None):
+        self.envelope.release(release_frames)
+    
+    def render_block(self, frames: int = BLOCK_SIZE) -> np.ndarray:
+        ramp = np.arange(frames)
+        phase = self.phases[..., None] + self.increments[..., None] * ramp
+        self.phases = (self.phases + self.increments * frames) % 1.0
+        
+        # Every oscillator, whatever its waveform, is one row of a single table read
+        mixed = self.amplitudes @ WaveformGenerator.read_bank(phase, self.table_rows)
+        
+        if self.ring_modulation is not None:
+            frequency, depth = self.ring_modulation
+            increment = frequency / self.sample_rate
+            modulation = WaveformGenerator.from_phase("sine", self.modulation_phase + increment * ramp)
+            self.modulation_phase = (self.modulation_phase + increment * frames) % 1.0
+            mixed *= 1 + depth * modulation
+        
+        self.elapsed += frames
+        cutoff = None
+        if self.cutoff_glide is not None:
+            target, seconds = self.cutoff_glide
+            progress = min(self.elapsed / max(seconds * self.sample_rate, 1), 1.0)
+            cutoff = self.start_cutoff * (target / self.start_cutoff) ** progress
+        filtered = self.filter.process(mixed, cutoff)
+        return filtered * self.envelope.render(frames) * self.velocity
+    
+    def render(self, frames: int, gate_frames: Optional[int] = None) -> np.ndarray:
+        """Render a whole note, releasing it after gate_frames samples.
+        
+        The release is shortened if needed so the note ends silent at frames.
+        """
+        out = np.empty(self.phases.shape[:-1] + (frames,))
+        start = 0
+        for block in self.iter_blocks(frames, gate_frames):
+            out[..., start:start + block.shape[-1]] = block
+            start += block.shape[-1]
+        return out
+    
+    def iter_blocks(self, frames: int, gate_frames: Optional[int] = None) -> Iterator[np.ndarray]:
+        """Blocks of render(), yielded as they are synthesized"""
+        if gate_frames is not None and gate_frames <= 0:
+            self.note_off(frames)
+            gate_frames = None
+        for start in range(0, frames, BLOCK_SIZE):
+            stop = min(start + BLOCK_SIZE, frames)
+            if gate_frames is not None and start <= gate_frames < stop:
+                if gate_frames > start:
+                    yield self.render_block(gate_frames - start)
+                self.note_off(frames - gate_frames)
+                if stop > gate_frames:
+                    yield self.render_block(stop - gate_frames)
+            else:
+                yield self.render_block(stop - start)
+    
+    def note_gate(self, frames: int) -> int:
+        """Gate length for a note lasting frames samples including its release.
+        
+        Notes shorter than their release still reach the end of the decay
+        (or half the note) before releasing.
+        """
+        lengths = self.envelope.lengths
+        return max(frames - lengths["release"],
+                   min(lengths["attack"] + lengths["decay"], frames // 2))
+    
+    def render_note(self, frames: int) -> np.ndarray:
+        """Render a note lasting frames samples including its release"""
+        return self.render(frames, self.note_gate(frames))
+
+class VoiceEngine:
+    """Live mixer: notes are switched on and off while blocks are pulled.
+    
+    Blocks are not normalized; every voice is scaled by headroom so the sum
+    of several notes stays below the sound card's clip level.
+    """
+    
+    def __init__(self, synths: Dict[str, object], sample_rate: int = 44100,
+                 block_size: int = BLOCK_SIZE, headroom: float = VOICE_HEADROOM):
+        self.synths = synths
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.headroom = headroom
+        self.voices: Dict[int, Voice] = {}
+        self._next_id = 0
+    
+    def note_on(self, synth_name: str, frequency: float, velocity: float = 0.8) -> int:
+        if synth_name not in self.synths:
+            raise ValueError(f"Unknown synth: {synth_name}")
+        voice_id = self._next_id
+        self._next_id += 1
+        self.voices[voice_id] = self.synths[synth_name].create_voice(frequency, velocity)
+        return voice_id
+    
+    def note_off(self, voice_id: int):
+        voice = self.voices.get(voice_id)
+        if voice is not None:
+            voice.note_off()
+    
+    def render_block(self) -> np.ndarray:
+        """Next block of the mix; voices whose release has ended are dropped"""
+        block = np.zeros(self.block_size)
+        for voice_id, voice in list(self.voices.items()):
+            block += voice.render_block(self.block_size)
+            if voice.finished:
+                del self.voices[voice_id]
+        block *= self.headroom
+        return block
+    
+    def open_stream(self) -> "sd.OutputStream":
+        """Sound card stream pulling blocks from this engine (call .start())"""
+        def callback(outdata, frames, time_info, status):
+            outdata[:, 0] = self.render_block()[:frames]
+        
+        return sd.OutputStream(samplerate=self.sample_rate, blocksize=self.block_size,
+                               channels=1, dtype="float32", callback=callback)
+
 class YamahaCS80Emulator:
     """Emulate the legendary Yamaha CS-80 synthesizer"""
     
@@ -138,36 +555,20 @@ class YamahaCS80Emulator:
         self.default_filter = Filter("lowpass", 2000.0, 0.3, 0.5)
         self.default_envelope = Envelope(0.05, 0.3, 0.6, 1.2)
     
+    def create_voice(self, frequency: float, velocity: float = 0.8) -> Voice:
+        """Streaming voice with CS-80 characteristics"""
+        oscillators = [
+            Oscillator(osc.waveform, frequency + osc.detune, osc.amplitude, osc.phase)
+            for osc in self.default_oscillators
+        ]
+        return Voice(oscillators, self.default_filter, self.default_envelope,
+                     velocity, self.sample_rate)
+    
     def generate_note(self, frequency: float, duration: float, 
                      velocity: float = 0.8) -> np.ndarray:
         """Generate a note with CS-80 characteristics"""
-        
-        # Generate oscillator signals
-        osc_signals = []
-        for osc in self.default_oscillators:
-            osc_freq = frequency + osc.detune
-            signal = WaveformGenerator.generate_waveform(
-                osc.waveform, osc_freq, duration, self.sample_rate, osc.phase
-            )
-            osc_signals.append(signal * osc.amplitude)
-        
-        # Mix oscillators
-        mixed_signal = sum(osc_signals)
-        
-        # Apply filter
-        filtered_signal = FilterEngine.lowpass_filter(
-            mixed_signal, self.default_filter.cutoff, self.default_filter.resonance
-        )
-        
-        # Apply envelope
-        envelope_curve = EnvelopeGenerator.generate_adsr(
-            self.default_envelope, duration, self.sample_rate
-        )
-        
-        # Apply velocity and envelope
-        final_signal = filtered_signal * envelope_curve * velocity
-        
-        return final_signal
+        frames = int(duration * self.sample_rate)
+        return self.create_voice(frequency, velocity).render_note(frames)
 
 class MoogModularEmulator:
     """Emulate Moog Modular characteristics"""
@@ -183,148 +584,260 @@ class MoogModularEmulator:
         ]
         
         # Characteristic Moog ladder filter
-        self.default_filter = Filter("lowpass", 800.0, 0.7, 0.8)
+        self.default_filter = Filter("ladder", 800.0, 0.7, 0.8)
         self.default_envelope = Envelope(0.01, 0.4, 0.5, 0.8)
     
-    def generate_note(self, frequency: float, duration: float, 
-                     velocity: float = 0.8) -> np.ndarray:
-        """Generate Moog-style note"""
-        
-        osc_signals = []
+    def create_voice(self, frequency: float, velocity: float = 0.8) -> Voice:
+        """Streaming Moog-style voice"""
+        oscillators = []
         for osc in self.default_oscillators:
             if osc.frequency == 220.0:  # Sub oscillator
                 osc_freq = frequency / 2
             else:
                 osc_freq = frequency
-                
-            signal = WaveformGenerator.generate_waveform(
-                osc.waveform, osc_freq, duration, self.sample_rate
-            )
-            osc_signals.append(signal * osc.amplitude)
-        
-        mixed_signal = sum(osc_signals)
+            oscillators.append(Oscillator(osc.waveform, osc_freq, osc.amplitude))
         
         # Moog-style filter with higher resonance
-        filtered_signal = FilterEngine.lowpass_filter(
-            mixed_signal, self.default_filter.cutoff, self.default_filter.resonance
-        )
-        
-        envelope_curve = EnvelopeGenerator.generate_adsr(
-            self.default_envelope, duration, self.sample_rate
-        )
-        
-        return filtered_signal * envelope_curve * velocity
+        return Voice(oscillators, self.default_filter, self.default_envelope,
+                     velocity, self.sample_rate)
+    
+    def generate_note(self, frequency: float, duration: float, 
+                     velocity: float = 0.8) -> np.ndarray:
+        """Generate Moog-style note"""
+        frames = int(duration * self.sample_rate)
+        return self.create_voice(frequency, velocity).render_note(frames)
 
 class AphexTwinGenerator:
     """Richard D. James style generative engine"""
     
-    def __init__(self, sample_rate: int = 44100):
+    def __init__(self, sample_rate: int = 44100, rng: Optional[np.random.Generator] = None):
         self.sample_rate = sample_rate
         self.name = "Aphex Generator"
+        # Patches draw from the global NumPy state unless a seeded generator is given
+        self.rng = rng if rng is not None else np.random
     
-    def generate_complex_patch(self, base_frequency: float, duration: float) -> np.ndarray:
-        """Generate complex Aphex-style patch"""
+    def create_voice(self, base_frequency: float, velocity: float = 1.0,
+                     sweep_seconds: float = 4.0) -> Voice:
+        """Random Aphex-style patch as a streaming voice"""
         
         # Multiple detuned oscillators
         oscillators = []
         for i in range(5):
-            detune = np.random.uniform(-50, 50)
-            waveform = np.random.choice(["saw", "square", "sine"])
+            detune = self.rng.uniform(-50, 50)
+            waveform = self.rng.choice(["saw", "square", "sine"])
             osc = Oscillator(waveform, base_frequency + detune, 
-                           np.random.uniform(0.1, 0.3))
+                           self.rng.uniform(0.1, 0.3))
             oscillators.append(osc)
         
-        # Generate and mix signals
-        signals = []
-        for osc in oscillators:
-            signal = WaveformGenerator.generate_waveform(
-                osc.waveform, osc.frequency, duration, self.sample_rate
-            )
-            signals.append(signal * osc.amplitude)
-        
-        mixed_signal = sum(signals)
-        
-        # Apply random modulation
-        modulation_freq = np.random.uniform(0.1, 20.0)
-        modulation = WaveformGenerator.generate_waveform(
-            "sine", modulation_freq, duration, self.sample_rate
-        )
-        
-        # Ring modulation
-        modulated_signal = mixed_signal * (1 + 0.3 * modulation)
+        # Ring modulation by a random slow-to-audio-rate sine
+        modulation_freq = self.rng.uniform(0.1, 20.0)
         
         # Random filter sweep
-        cutoff_start = np.random.uniform(200, 2000)
-        cutoff_end = np.random.uniform(200, 2000)
+        cutoff_start = self.rng.uniform(200, 2000)
+        cutoff_end = self.rng.uniform(200, 2000)
         
-        # Simple filter sweep (in production, use time-varying filter)
-        mid_cutoff = (cutoff_start + cutoff_end) / 2
-        filtered_signal = FilterEngine.lowpass_filter(
-            modulated_signal, mid_cutoff, np.random.uniform(0.1, 0.8)
-        )
+        filter_config = Filter("lowpass", cutoff_start, self.rng.uniform(0.1, 0.8))
         
         # Random envelope
         envelope = Envelope(
-            np.random.uniform(0.01, 0.5),
-            np.random.uniform(0.1, 1.0),
-            np.random.uniform(0.3, 0.9),
-            np.random.uniform(0.2, 2.0)
+            self.rng.uniform(0.01, 0.5),
+            self.rng.uniform(0.1, 1.0),
+            self.rng.uniform(0.3, 0.9),
+            self.rng.uniform(0.2, 2.0)
         )
         
-        envelope_curve = EnvelopeGenerator.generate_adsr(envelope, duration)
-        
-        return filtered_signal * envelope_curve
+        return Voice(oscillators, filter_config, envelope, velocity, self.sample_rate,
+                     ring_modulation=(modulation_freq, 0.3),
+                     cutoff_glide=(cutoff_end, sweep_seconds))
+    
+    def generate_complex_patch(self, base_frequency: float, duration: float) -> np.ndarray:
+        """Generate complex Aphex-style patch"""
+        voice = self.create_voice(base_frequency, sweep_seconds=duration)
+        frames = int(duration * self.sample_rate)
+        return voice.render_note(frames)
 
 class SynthLabManager:
     """Main synthesizer lab manager"""
     
-    def __init__(self, sample_rate: int = 44100):
+    def __init__(self, sample_rate: int = 44100, rng: Optional[np.random.Generator] = None):
         self.sample_rate = sample_rate
         self.synths = {
             "cs80": YamahaCS80Emulator(sample_rate),
             "moog": MoogModularEmulator(sample_rate),
-            "aphex": AphexTwinGenerator(sample_rate)
+            "aphex": AphexTwinGenerator(sample_rate, rng)
         }
     
     def generate_sequence(self, synth_name: str, notes: List[Tuple[float, float]], 
-                         note_duration: float = 1.0) -> np.ndarray:
-        """Generate a sequence of notes"""
-        
-        if synth_name not in self.synths:
-            raise ValueError(f"Unknown synth: {synth_name}")
+                         note_duration: float = 1.0, gap: float = 0.1,
+                         tempo: Optional[float] = None) -> np.ndarray:
+        """Generate a sequence of notes
+        
+        Notes follow each other separated by gap seconds, or start on every
+        beat when tempo (BPM) is given, in which case they may overlap.
+        """
+        events, length = self._sequence_events(notes, note_duration, gap, tempo)
+        return self.render_events(synth_name, events, length)
+    
+    def _sequence_events(self, notes: List[Tuple[float, float]], note_duration: float = 1.0,
+                         gap: float = 0.1, tempo: Optional[float] = None) -> Tuple[List[NoteEvent], int]:
+        """Timeline of generate_sequence(): its note events and length in frames"""
+        note_frames = int(note_duration * self.sample_rate)
+        if tempo is not None:
+            step_frames = 60.0 * self.sample_rate / tempo
+        else:
+            step_frames = note_frames + int(gap * self.sample_rate)
         
+        starts = [int(round(i * step_frames)) for i in range(len(notes))]
+        events = [
+            NoteEvent(frequency, velocity, start / self.sample_rate, note_duration)
+            for (frequency, velocity), start in zip(notes, starts)
+        ]
+        length = max(int(round(len(notes) * step_frames)), starts[-1] + note_frames) if notes else 0
+        return events, length
+    
+    def _create_voice(self, synth_name: str, event: NoteEvent) -> Voice:
         synth = self.synths[synth_name]
-        sequences = []
+        if hasattr(synth, 'generate_note'):
+            return synth.create_voice(event.frequency, event.velocity)
+        if hasattr(synth, 'generate_complex_patch'):
+            return synth.create_voice(event.frequency, sweep_seconds=event.duration)
+        raise ValueError(f"Synth {synth_name} has no generate method")
+    
+    def render_events(self, synth_name: str, events: List[NoteEvent],
+                      length: Optional[int] = None) -> np.ndarray:
+        """Mix (possibly overlapping) notes into one buffer at sample-accurate offsets.
         
-        for frequency, velocity in notes:
-            if hasattr(synth, 'generate_note'):
-                note_signal = synth.generate_note(frequency, note_duration, velocity)
-            elif hasattr(synth, 'generate_complex_patch'):
-                note_signal = synth.generate_complex_patch(frequency, note_duration)
-            else:
-                raise ValueError(f"Synth {synth_name} has no generate method")
-            
-            sequences.append(note_signal)
+        Notes of the same patch and duration are stacked and rendered as one
+        2-D batch. length (frames) defaults to the end of the last note.
         
-        # Concatenate sequences with small gaps
-        gap_samples = int(0.1 * self.sample_rate)
-        gap = np.zeros(gap_samples)
+        The mix is unscaled: overlapping notes sum and can peak well above
+        1.0 (about 2.8 for eight Moog notes at 240 BPM), so it must be
+        normalized, as save_sequence does, before it is written.
+        """
         
-        full_sequence = []
-        for seq in sequences:
-            full_sequence.extend(seq)
-            full_sequence.extend(gap)
+        if synth_name not in self.synths:
+            raise ValueError(f"Unknown synth: {synth_name}")
         
-        return np.array(full_sequence)
+        batches: Dict[Tuple, List[Tuple[int, Voice]]] = {}
+        end = 0
+        for event in events:
+            start = int(round(event.start * self.sample_rate))
+            frames = int(event.duration * self.sample_rate)
+            voice = self._create_voice(synth_name, event)
+            batches.setdefault((voice.batch_key, frames), []).append((start, voice))
+            end = max(end, start + frames)
+        
+        output = np.zeros(end if length is None else length)
+        for (_, frames), members in batches.items():
+            rendered = Voice.stack([voice for _, voice in members]).render_note(frames)
+            for (start, _), note_signal in zip(members, rendered):
+                stop = min(start + frames, len(output))
+                output[start:stop] += note_signal[:stop - start]
+        
+        return output
     
-    def save_sequence(self, sequence: np.ndarray, filename: str):
-        """Save sequence to WAV file (requires scipy)"""
-        # Normalize
-        sequence = sequence / np.max(np.abs(sequence))
+    def iter_events(self, synth_name: str, events: List[NoteEvent], length: Optional[int] = None,
+                    block_size: int = BLOCK_SIZE) -> Iterator[np.ndarray]:
+        """Blocks of render_events(), synthesized as the timeline reaches each note.
+        
+        Notes are rendered voice by voice instead of stacked, so memory is
+        bounded by the notes sounding at once rather than the length of the
+        take. Voices are created in event order, as in render_events().
+        """
+        if synth_name not in self.synths:
+            raise ValueError(f"Unknown synth: {synth_name}")
         
-        # In production, use scipy.io.wavfile.write
-        print(f"Would save sequence to {filename}")
+        notes = []
+        end = 0
+        for event in events:
+            start = int(round(event.start * self.sample_rate))
+            frames = int(event.duration * self.sample_rate)
+            notes.append((start, frames, self._create_voice(synth_name, event)))
+            end = max(end, start + frames)
+        total = end if length is None else length
+        pending = deque(sorted(notes, key=lambda note: note[0]))
+        
+        # [start, stop, block iterator, samples pulled but not yet mixed]
+        active = []
+        for block_start in range(0, total, block_size):
+            block_stop = min(block_start + block_size, total)
+            while pending and pending[0][0] < block_stop:
+                start, frames, voice = pending.popleft()
+                active.append([start, start + frames, voice.iter_blocks(frames, voice.note_gate(frames)),
+                               np.empty(0)])
+            
+            block = np.zeros(block_stop - block_start)
+            for note in active:
+                low, high = max(note[0], block_start), min(note[1], block_stop)
+                pieces = [note[3]]
+                available = len(note[3])
+                while available < high - low:
+                    pieces.append(next(note[2]))
+                    available += len(pieces[-1])
+                samples = np.concatenate(pieces) if len(pieces) > 1 else pieces[0]
+                block[low - block_start:high - block_start] += samples[:high - low]
+                note[3] = samples[high - low:]
+            active = [note for note in active if note[1] > block_stop]
+            yield block
+    
+    def save_sequence(self, sequence: np.ndarray, filename: str, subtype: str = "PCM_16"):
+        """Save sequence, peak-normalized, to a WAV (or FLAC) file"""
+        peak = np.max(np.abs(sequence)) if len(sequence) else 0.0
+        with AudioWriter(filename, self.sample_rate, subtype=subtype,
+                         gain=1.0 / peak if peak > 0 else 1.0) as writer:
+            writer.write(sequence)
+        print(f"Saved sequence to {filename}")
         print(f"Sequence length: {len(sequence)} samples, Duration: {len(sequence)/self.sample_rate:.2f}s")
+    
+    def stream_note(self, synth_name: str, frequency: float, velocity: float,
+                    duration: float, filename: str, subtype: str = "PCM_16") -> int:
+        """Write one note to an audio file block by block.
+        
+        Memory stays bounded by the block size however long the note is. The
+        note is not normalized but scaled by VOICE_HEADROOM, as in the live
+        engine, so it is not clipped.
+        """
+        if synth_name not in self.synths:
+            raise ValueError(f"Unknown synth: {synth_name}")
+        voice = self._create_voice(synth_name, NoteEvent(frequency, velocity, 0.0, duration))
+        frames = int(duration * self.sample_rate)
+        return write_audio(filename, voice.iter_blocks(frames, voice.note_gate(frames)),
+                           self.sample_rate, subtype, gain=VOICE_HEADROOM)
+    
+    def render_batch(self, jobs: List[Tuple[str, List[Tuple[float, float]], float]],
+                     output_dir: Path, seed: int = 0, workers: Optional[int] = None,
+                     subtype: str = "PCM_16", audio_format: str = "wav") -> List[Path]:
+        """Render (synth_name, notes, note_duration) sequences to files in a process pool.
+        
+        Every job gets its own child of seed, so the output is reproducible
+        regardless of worker count or scheduling.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        seeds = np.random.SeedSequence(seed).spawn(len(jobs))
+        tasks = [
+            (self.sample_rate, job, child, output_dir / f"{index:03d}_{job[0]}.{audio_format}", subtype)
+            for index, (job, child) in enumerate(zip(jobs, seeds))
+        ]
+        return render_batch(_render_sequence_job, tasks, workers)
+
+def _render_sequence_job(task) -> Path:
+    """Stream one sequence into its file without holding the take.
+    
+    The first pass only finds the peak; the second renders the same notes
+    again (the job seed makes both draw the same patches) and writes them
+    normalized to it, block by block.
+    """
+    sample_rate, (synth_name, notes, note_duration), seed, path, subtype = task
+    
+    def blocks() -> Iterator[np.ndarray]:
+        lab = SynthLabManager(sample_rate, rng=np.random.default_rng(seed))
+        events, length = lab._sequence_events(notes, note_duration)
+        return lab.iter_events(synth_name, events, length)
+    
+    peak = max((np.max(np.abs(block)) for block in blocks()), default=0.0)
+    write_audio(path, blocks(), sample_rate, subtype, gain=1.0 / peak if peak > 0 else 1.0)
+    return path
 
 def main():
     """Generate sample synthesizer sequences"""
@@ -358,7 +871,7 @@ def main():
     complex_patch = aphex.generate_complex_patch(220.0, 4.0)
     lab.save_sequence(complex_patch, output_dir / "aphex_complex_patch.wav")
     
-    print(f"Generated synth sequences (simulated) in {output_dir}")
+    print(f"Generated synth sequences in {output_dir}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
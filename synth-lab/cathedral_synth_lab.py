@@ -1,10 +1,20 @@
 # 🎹 Cathedral Synth Lab - Legendary Instruments Collection
 # World's most expensive synthesizers recreated with full functionality + magical integration
 
+import os
+import sys
 import numpy as np
 import scipy.signal as signal
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'packages', 'synth-labs'))
+from audio_export import AudioWriter, render_batch
+
+SAMPLE_RATE = 44100
+# Frames synthesized per block when streaming a take to disk
+RENDER_BLOCK_FRAMES = 4096
 
 @dataclass
 class SynthEngine:
@@ -474,8 +484,13 @@ class CathedralSynthLab:
             }
         }
     
-    def generate_sound(self, session_id: str, note: int, velocity: int = 127, duration: float = 1.0) -> Dict[str, Any]:
-        """Generate sound with the legendary synth (simplified simulation)"""
+    def generate_sound(self, session_id: str, note: int, velocity: int = 127, duration: float = 1.0,
+                       output_path: Optional[str] = None, subtype: str = "PCM_16") -> Dict[str, Any]:
+        """Generate sound with the legendary synth (simplified simulation)
+        
+        With output_path (.wav or .flac) the note is streamed to disk block
+        by block; otherwise only the note metadata is returned.
+        """
         if session_id not in self.active_sessions:
             return {"error": "Session not found"}
         
@@ -485,28 +500,7 @@ class CathedralSynthLab:
         
         # Convert MIDI note to frequency
         frequency = 440 * (2 ** ((note - 69) / 12))
-        
-        # Simulate sound generation
-        sample_rate = 44100
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples)
-        
-        # Generate basic waveform (simplified)
-        if patch["oscillators"]["osc1"]["waveform"] == "sine":
-            audio = np.sin(2 * np.pi * frequency * t)
-        elif patch["oscillators"]["osc1"]["waveform"] == "sawtooth":
-            audio = signal.sawtooth(2 * np.pi * frequency * t)
-        elif patch["oscillators"]["osc1"]["waveform"] == "square":
-            audio = signal.square(2 * np.pi * frequency * t)
-        else:
-            audio = np.sin(2 * np.pi * frequency * t)  # default to sine
-        
-        # Apply envelope (simplified)
-        envelope = self._generate_envelope(samples, patch["envelope"])
-        audio *= envelope
-        
-        # Apply velocity
-        audio *= (velocity / 127.0)
+        samples = int(SAMPLE_RATE * duration)
         
         result = {
             "note": note,
@@ -517,42 +511,100 @@ class CathedralSynthLab:
             "magic_mode": session.get("spell_mode", False)
         }
         
+        if output_path is not None:
+            with AudioWriter(output_path, SAMPLE_RATE, subtype=subtype) as writer:
+                for block in self._render_blocks(patch, frequency, velocity, duration):
+                    writer.write(block)
+            result["output_path"] = str(output_path)
+        
         if session.get("spell_mode"):
             result["spell_effect"] = session.get("active_spell")
             result["magic_resonance"] = session.get("magic_resonance", 0.0)
         
         return result
     
-    def _generate_envelope(self, samples: int, env_params: Dict) -> np.ndarray:
-        """Generate ADSR envelope"""
+    def _render_blocks(self, patch: Dict[str, Any], frequency: float, velocity: int,
+                       duration: float) -> Iterator[np.ndarray]:
+        """Audio for one note in blocks of RENDER_BLOCK_FRAMES samples"""
+        samples = int(SAMPLE_RATE * duration)
+        # Same time grid as np.linspace(0, duration, samples)
+        step = duration / (samples - 1) if samples > 1 else 0.0
+        waveform = patch["oscillators"]["osc1"]["waveform"]
+        envelope_points = self._envelope_points(samples, patch["envelope"])
+        
+        for start in range(0, samples, RENDER_BLOCK_FRAMES):
+            index = np.arange(start, min(start + RENDER_BLOCK_FRAMES, samples))
+            phase = 2 * np.pi * frequency * (index * step)
+            
+            # Generate basic waveform (simplified)
+            if waveform == "sawtooth":
+                audio = signal.sawtooth(phase)
+            elif waveform == "square":
+                audio = signal.square(phase)
+            else:
+                audio = np.sin(phase)  # sine, and default for other waveforms
+            
+            audio *= np.interp(index, *envelope_points)
+            audio *= (velocity / 127.0)
+            yield audio
+    
+    def render_spell_soundtracks(self, jobs: List[Tuple[str, str, List[int], float]], output_dir: str,
+                                 workers: Optional[int] = None, subtype: str = "PCM_16") -> List[Path]:
+        """Render (synth_name, spell_name, midi_notes, note_duration) soundtracks in a process pool.
+        
+        Each soundtrack is one file of its notes played back to back, streamed
+        to disk; rendering is deterministic, so files match for any worker count.
+        """
+        for synth_name, spell_name, _, _ in jobs:
+            if synth_name not in self.legendary_synths:
+                raise ValueError(f"Synth '{synth_name}' not found")
+            if spell_name not in self.legendary_synths[synth_name].spell_triggers:
+                raise ValueError(f"Spell '{spell_name}' not available on {synth_name}")
+        
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tasks = [
+            (job, output_dir / f"{index:03d}_{job[1]}.wav", subtype)
+            for index, job in enumerate(jobs)
+        ]
+        return render_batch(_render_spell_soundtrack, tasks, workers)
+    
+    def _envelope_points(self, samples: int, env_params: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """ADSR breakpoints (sample index, level) for np.interp"""
         attack_samples = int(samples * env_params["attack"] / 4)
         decay_samples = int(samples * env_params["decay"] / 4)
         sustain_level = env_params["sustain"]
         release_samples = samples - attack_samples - decay_samples
         
-        envelope = np.zeros(samples)
-        
-        # Attack
-        if attack_samples > 0:
-            envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
-        
-        # Decay
-        if decay_samples > 0:
-            envelope[attack_samples:attack_samples + decay_samples] = np.linspace(1, sustain_level, decay_samples)
-        
-        # Sustain and Release
+        # (first sample, length, start level, end level) of each linear stage
+        stages = [(0, attack_samples, 0.0, 1.0),
+                  (attack_samples, decay_samples, 1.0, sustain_level)]
         if release_samples > 0:
             sustain_samples = release_samples // 2
-            actual_release_samples = release_samples - sustain_samples
-            
             start_idx = attack_samples + decay_samples
-            envelope[start_idx:start_idx + sustain_samples] = sustain_level
-            
-            if actual_release_samples > 0:
-                release_start = start_idx + sustain_samples
-                envelope[release_start:] = np.linspace(sustain_level, 0, actual_release_samples)
+            stages.append((start_idx, sustain_samples, sustain_level, sustain_level))
+            stages.append((start_idx + sustain_samples, release_samples - sustain_samples, sustain_level, 0.0))
         
-        return envelope
+        indices, levels = [], []
+        for first, length, start_level, end_level in stages:
+            length = min(length, samples - first)
+            if length <= 0:
+                continue
+            indices.append(first)
+            levels.append(start_level)
+            if length > 1:
+                indices.append(first + length - 1)
+                levels.append(end_level)
+        if not indices or indices[-1] < samples - 1:
+            # Samples past the last stage stay silent
+            next_idx = indices[-1] + 1 if indices else 0
+            indices += [next_idx, samples - 1]
+            levels += [0.0, 0.0]
+        return np.array(indices, dtype=float), np.array(levels)
+    
+    def _generate_envelope(self, samples: int, env_params: Dict) -> np.ndarray:
+        """Generate ADSR envelope"""
+        return np.interp(np.arange(samples), *self._envelope_points(samples, env_params))
     
     def get_synth_collection_info(self) -> Dict[str, Any]:
         """Get complete information about the legendary synth collection"""
@@ -580,6 +632,20 @@ class CathedralSynthLab:
         return collection_info
 
 
+def _render_spell_soundtrack(task) -> Path:
+    (synth_name, spell_name, notes, note_duration), path, subtype = task
+    lab = CathedralSynthLab()
+    session_id = lab.start_synth_session(synth_name, "soundtrack")["session_id"]
+    lab.trigger_spell_mode(session_id, spell_name)
+    patch = lab.active_sessions[session_id]["current_patch"]
+    with AudioWriter(path, SAMPLE_RATE, subtype=subtype) as writer:
+        for note in notes:
+            frequency = 440 * (2 ** ((note - 69) / 12))
+            for block in lab._render_blocks(patch, frequency, 127, note_duration):
+                writer.write(block)
+    return path
+
+
 # Standalone CLI Interface
 if __name__ == "__main__":
     print("🎹 CATHEDRAL SYNTH LAB - LEGENDARY COLLECTION")